@@ -2,6 +2,7 @@ import contextlib
 import json
 import os
 import shlex
+import stat
 import sys
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional
@@ -602,10 +603,22 @@ def validate_initialized(
     """
     config_file = root_path / "docops.config.yaml"
 
-    if config_file.is_file() and not config_file.is_symlink():
+    # One lstat answers "missing", "symlink" and "regular file"; only a symlink
+    # needs a second stat to tell a dangling link (missing) from a live one.
+    try:
+        config_mode = os.lstat(config_file).st_mode
+    except OSError:
+        config_mode = None
+    if config_mode is not None and stat.S_ISLNK(config_mode) and not config_file.exists():
+        config_mode = None
+
+    if config_mode is not None and stat.S_ISREG(config_mode):
         import yaml as _yaml
+
+        from meminit.core.services.repo_config import load_config_data
+
         try:
-            raw = _yaml.safe_load(config_file.read_text(encoding="utf-8"))
+            raw = load_config_data(config_file)
             if isinstance(raw, dict) and raw.get("docops_version") is not None:
                 return
             msg = (
@@ -631,7 +644,7 @@ def validate_initialized(
                 "file": "docops.config.yaml",
                 "error": str(exc),
             }
-    elif config_file.exists():
+    elif config_mode is not None:
         msg = (
             "Repository not initialized: docops.config.yaml exists but is not a "
             "regular file (e.g., directory or symlink). Run 'meminit init' to repair."
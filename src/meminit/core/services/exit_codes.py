@@ -8,11 +8,29 @@ from meminit.core.services.error_codes import ErrorCode
 
 EX_SUCCESS = 0
 EX_COMPLIANCE_FAIL = 1
-EX_USAGE = getattr(os, "EX_USAGE", 64)
-EX_DATAERR = getattr(os, "EX_DATAERR", 65)
-EX_NOINPUT = getattr(os, "EX_NOINPUT", 66)
-EX_CANTCREAT = getattr(os, "EX_CANTCREAT", 73)
-EX_NOPERM = getattr(os, "EX_NOPERM", 77)
+# sysexits.h values, used where the os module does not define them (e.g. Windows).
+_SYSEXITS = {
+    "EX_USAGE": 64,
+    "EX_DATAERR": 65,
+    "EX_NOINPUT": 66,
+    "EX_CANTCREAT": 73,
+    "EX_NOPERM": 77,
+}
+
+
+def _sysexit(name: str, source: object = os) -> int:
+    """Return the platform's value for a sysexits constant, falling back to sysexits.h.
+
+    ``source`` is the namespace the constant is looked up on; it defaults to ``os``.
+    """
+    return getattr(source, name, _SYSEXITS[name])
+
+
+EX_USAGE = _sysexit("EX_USAGE")
+EX_DATAERR = _sysexit("EX_DATAERR")
+EX_NOINPUT = _sysexit("EX_NOINPUT")
+EX_CANTCREAT = _sysexit("EX_CANTCREAT")
+EX_NOPERM = _sysexit("EX_NOPERM")
 
 
 def exit_code_for_error(error_code: ErrorCode) -> int:
@@ -2,13 +2,28 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
-from typing import Dict, Iterable, Mapping, Optional, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from meminit.core.services.xdg_paths import get_xdg_paths
 
+# Repo-relative location of the vendored org profile lock file.
+REPO_LOCK_RELATIVE_PATH = Path(".meminit") / "org-profile.lock.json"
+
+# (relative path, st_ino, st_mtime_ns, st_ctime_ns, st_size) for each profile file.
+_ProfileSignature = Tuple[Tuple[str, int, int, int, int], ...]
+
+# Global profiles keyed by profile directory, most recently used last. Entries are
+# reused only while every profile file keeps its signature; an atomic replace
+# changes st_ino and any write bumps st_ctime_ns, which utime() cannot reset.
+_GLOBAL_PROFILE_CACHE: "OrderedDict[Path, Tuple[_ProfileSignature, OrgProfile]]" = OrderedDict()
+_GLOBAL_PROFILE_CACHE_SIZE = 8
+
 
 @dataclass(frozen=True)
 class OrgProfile:
@@ -63,6 +78,7 @@ def _read_files_from_dir(root: Path, rel_paths: Iterable[str]) -> Dict[str, byte
     return out
 
 
+@lru_cache(maxsize=8)
 def load_packaged_profile(profile_name: str = "default") -> OrgProfile:
     root = resources.files("meminit.core.assets").joinpath(str(packaged_profile_root(profile_name)))
     manifest = _load_manifest_from_traversable(root)
@@ -78,19 +94,43 @@ def load_packaged_profile(profile_name: str = "default") -> OrgProfile:
     )
 
 
+def _profile_signature(root: Path, rel_paths: Iterable[str]) -> Optional[_ProfileSignature]:
+    sig = []
+    for rel in rel_paths:
+        try:
+            st = (root / rel).stat()
+        except OSError:
+            return None
+        sig.append((rel, st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size))
+    return tuple(sig)
+
+
 def load_global_profile(profile_name: str = "default", env: Optional[Mapping[str, str]] = None) -> OrgProfile:
     root = global_profile_dir(profile_name, env=env)
+    cached = _GLOBAL_PROFILE_CACHE.get(root)
+    if cached is not None and _profile_signature(root, cached[1].files) == cached[0]:
+        _GLOBAL_PROFILE_CACHE.move_to_end(root)
+        return cached[1]
+
     manifest = _load_manifest_from_dir(root)
     rels = set(str(p) for p in (manifest.get("files", []) or []))
     rels.add("profile.json")
+    # Take the signature before reading so a concurrent edit invalidates the entry.
+    signature = _profile_signature(root, sorted(rels))
     files = _read_files_from_dir(root, sorted(rels))
-    return OrgProfile(
+    profile = OrgProfile(
         name=manifest.get("profile_name", profile_name),
         version=str(manifest.get("profile_version", "0.0")),
         docops_version=str(manifest.get("docops_version", "2.0")),
         files=files,
         source="global",
     )
+    if signature is not None:
+        _GLOBAL_PROFILE_CACHE[root] = (signature, profile)
+        _GLOBAL_PROFILE_CACHE.move_to_end(root)
+        while len(_GLOBAL_PROFILE_CACHE) > _GLOBAL_PROFILE_CACHE_SIZE:
+            _GLOBAL_PROFILE_CACHE.popitem(last=False)
+    return profile
 
 
 def resolve_org_profile(
@@ -111,24 +151,117 @@ def resolve_org_profile(
     return load_packaged_profile(profile_name=profile_name)
 
 
-def diff_profile_to_repo(profile: OrgProfile, repo_root: Path, mapping: Mapping[str, str]) -> Tuple[int, int, int]:
+def _stat_targets(targets: Iterable[Path]) -> Dict[Path, Optional[os.stat_result]]:
     """
-    Compute a simple diff summary: (would_create, would_update, unchanged).
+    Stat target files with one directory listing per parent directory.
+
+    Only listed entries that are targets are stat()ed, so unrelated files in
+    a shared directory cost nothing beyond the listing. Missing targets (or
+    dangling symlinks) map to None. Targets whose entry cannot be stat()ed,
+    and all targets of a parent that cannot be listed for a reason other than
+    not existing, are stat()ed individually.
     """
-    create = update = same = 0
-    for profile_rel, repo_rel in mapping.items():
-        target = repo_root / repo_rel
-        content = profile.files.get(profile_rel, b"")
-        if not target.exists():
-            create += 1
-            continue
+    by_parent: Dict[Path, List[Path]] = {}
+    for target in targets:
+        by_parent.setdefault(target.parent, []).append(target)
+
+    out: Dict[Path, Optional[os.stat_result]] = {}
+    for parent, children in by_parent.items():
+        wanted = {child.name for child in children}
+        listing: Dict[str, os.stat_result] = {}
+        listed = True
+        retry: Set[str] = set()
         try:
-            existing = target.read_bytes()
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.name not in wanted:
+                        continue
+                    try:
+                        listing[entry.name] = entry.stat()
+                    except OSError:
+                        retry.add(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
         except OSError:
-            update += 1
-            continue
-        if existing == content:
-            same += 1
+            listed = False
+
+        for child in children:
+            if listed and child.name not in retry:
+                out[child] = listing.get(child.name)
+                continue
+            try:
+                out[child] = child.stat()
+            except OSError:
+                out[child] = None
+    return out
+
+
+def _file_matches(path: Path, content: bytes, chunk_size: int = 64 * 1024) -> bool:
+    """
+    Compare a file with expected bytes in fixed-size chunks.
+
+    Stops at the first differing chunk, so memory stays bounded by
+    ``chunk_size``. Raises OSError if the file cannot be read.
+    """
+    expected = memoryview(content)
+    offset = 0
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return offset == len(expected)
+            end = offset + len(chunk)
+            if expected[offset:end] != chunk:
+                return False
+            offset = end
+
+
+TARGET_CREATE = "create"
+TARGET_UPDATE = "update"
+TARGET_UNCHANGED = "unchanged"
+
+
+def classify_profile_targets(
+    profile: OrgProfile, repo_root: Path, mapping: Mapping[str, str]
+) -> List[Tuple[str, Path, str]]:
+    """
+    Classify each mapped profile file as (profile_rel, repo_path, status).
+
+    ``status`` is one of TARGET_CREATE, TARGET_UPDATE or TARGET_UNCHANGED.
+    Existence and size come from one directory listing per destination
+    directory; a file is only read when its size matches the profile content.
+    """
+    files = profile.files
+    targets = [
+        (profile_rel, repo_root / repo_rel, files.get(profile_rel, b""))
+        for profile_rel, repo_rel in mapping.items()
+    ]
+    stats = _stat_targets(target for _, target, _ in targets)
+
+    out: List[Tuple[str, Path, str]] = []
+    for profile_rel, target, content in targets:
+        st = stats[target]
+        if st is None:
+            status = TARGET_CREATE
+        elif st.st_size != len(content):
+            status = TARGET_UPDATE
         else:
-            update += 1
-    return create, update, same
+            try:
+                matches = _file_matches(target, content)
+            except OSError:
+                matches = False
+            status = TARGET_UNCHANGED if matches else TARGET_UPDATE
+        out.append((profile_rel, target, status))
+    return out
+
+
+def diff_profile_to_repo(profile: OrgProfile, repo_root: Path, mapping: Mapping[str, str]) -> Tuple[int, int, int]:
+    """
+    Compute a simple diff summary: (would_create, would_update, unchanged).
+    """
+    statuses = [status for _, _, status in classify_profile_targets(profile, repo_root, mapping)]
+    return (
+        statuses.count(TARGET_CREATE),
+        statuses.count(TARGET_UPDATE),
+        statuses.count(TARGET_UNCHANGED),
+    )
@@ -185,13 +185,12 @@ def generate_run_id() -> str:
 
 
 def canonical_json_dumps(payload: Any) -> str:
-    """Serialize payload as deterministic compact JSON."""
-    return json.dumps(
-        recursively_sort_keys(payload),
-        separators=(",", ":"),
-        default=str,
-        sort_keys=True,
-    )
+    """Serialize payload as deterministic compact JSON.
+
+    ``sort_keys`` orders nested mappings during encoding, so the payload is not
+    deep-copied through ``recursively_sort_keys`` first.
+    """
+    return json.dumps(payload, separators=(",", ":"), default=str, sort_keys=True)
 
 
 def normalize_correlation_id(correlation_id: str | None) -> str | None:
@@ -37,12 +37,10 @@ def normalize_filename_to_kebab_case(original_path: Path) -> Path:
 
 
 def compute_file_hash(path: Path) -> str:
-    """Compute SHA256 hash of a file efficiently using chunked reading."""
-    h = hashlib.sha256()
+    """Compute SHA256 hash of a file by streaming it through ``hashlib.file_digest``."""
     with open(path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            h.update(chunk)
-    return f"sha256:{h.hexdigest()}"
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    return f"sha256:{digest}"
 
 
 def relative_path_string(path: Path, base: Path) -> str:
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import copy
 import datetime
 import glob
 import hashlib
+import os
 import re
 import warnings
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import (
     Any,
@@ -25,6 +28,11 @@ import yaml
 
 from meminit.core.services.observability import log_debug
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 # Constants
 DEFAULT_DOCS_ROOT = "docs"
 DEFAULT_CATALOG_NAME = "catalogue.md"
@@ -241,19 +249,31 @@ class RepoLayout:
                 return ns
         return self.namespaces[0]
 
-    def namespace_for_path(self, path: Path) -> Optional[RepoConfig]:
-        # Pick the most specific match (longest docs_root) to handle nested docs roots.
-        matches: list[tuple[int, RepoConfig]] = []
+    @cached_property
+    def _namespaces_by_docs_dir(self) -> Dict[Tuple[str, ...], RepoConfig]:
+        # First declared namespace wins when two namespaces share a docs_root.
+        by_dir: Dict[Tuple[str, ...], RepoConfig] = {}
         for ns in self.namespaces:
-            try:
-                path.relative_to(ns.docs_dir)
-            except ValueError:
-                continue
-            matches.append((len(Path(ns.docs_root).parts), ns))
-        if not matches:
-            return None
-        matches.sort(key=lambda t: t[0], reverse=True)
-        return matches[0][1]
+            by_dir.setdefault(_normcase_parts(ns.docs_dir), ns)
+        return by_dir
+
+    def namespace_for_path(self, path: Path) -> Optional[RepoConfig]:
+        # Pick the most specific match (longest docs_root) to handle nested docs roots:
+        # walk the path's ancestors from deepest to shallowest and stop at the first
+        # configured docs_dir, so lookups cost O(depth) rather than O(namespaces).
+        by_dir = self._namespaces_by_docs_dir
+        parts = _normcase_parts(path)
+        for end in range(len(parts), 0, -1):
+            ns = by_dir.get(parts[:end])
+            if ns is not None:
+                return ns
+        return None
+
+
+def _normcase_parts(path: Path) -> Tuple[str, ...]:
+    # Case-fold on platforms with case-insensitive paths (Windows), matching
+    # the semantics of Path.relative_to for the platform's path flavour.
+    return tuple(os.path.normcase(part) for part in path.parts)
 
 
 def _normalize_string_list(raw: Any) -> list[str]:
@@ -485,24 +505,43 @@ def _validate_no_legacy_config_keys(config_data: Dict[str, Any]) -> None:
         )
 
 
+@lru_cache(maxsize=32)
+def _parse_config_bytes(raw: bytes) -> Any:
+    # Keyed on the file's bytes, so any edit (even one that keeps size and
+    # mtime) is a cache miss. Callers only ever see deep copies of the result.
+    return yaml.load(raw.decode("utf-8"), Loader=_SafeLoader)
+
+
+def load_config_data(config_path: Path) -> Any:
+    """Parse a docops.config.yaml file, reusing earlier parses of identical content.
+
+    Each call returns a fresh copy that the caller may mutate.
+    Raises OSError (including FileNotFoundError) if the file cannot be read, and
+    yaml.YAMLError / UnicodeDecodeError if it is not valid UTF-8 YAML.
+    """
+    return copy.deepcopy(_parse_config_bytes(config_path.read_bytes()))
+
+
 def load_repo_layout(root_dir: str | Path) -> RepoLayout:
     root = Path(root_dir).resolve()
     config_path = root / "docops.config.yaml"
 
     data: Dict[str, Any] = {}
     load_error: str | None = None
-    if config_path.exists():
-        try:
-            data = yaml.safe_load(config_path.read_text()) or {}
-        except Exception as exc:
-            load_error = str(exc)
-            data = {}
+    exists = True
+    try:
+        data = load_config_data(config_path) or {}
+    except FileNotFoundError:
+        exists = False
+    except Exception as exc:
+        load_error = str(exc)
+        data = {}
     log_debug(
         operation="debug.config_loaded",
         details={
             "config_path": str(config_path),
-            "exists": config_path.exists(),
-            "loaded": config_path.exists() and load_error is None,
+            "exists": exists,
+            "loaded": exists and load_error is None,
             "error": load_error,
         },
     )
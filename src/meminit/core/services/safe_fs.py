@@ -4,6 +4,7 @@ import os
 import uuid
 
 from pathlib import Path
+from typing import Iterable
 
 from meminit.core.services.error_codes import ErrorCode, MeminitError
 
@@ -56,8 +57,24 @@ def ensure_safe_write_path(*, root_dir: Path, target_path: Path) -> None:
                                 and UnsafePathError for backward compatibility.
     """
     root_dir = Path(root_dir).resolve()
-    target_path = Path(target_path)
+    _check_safe_write_path(root_dir, Path(target_path), set())
+
+
+def ensure_safe_write_paths(*, root_dir: Path, target_paths: Iterable[Path]) -> None:
+    """Apply ``ensure_safe_write_path`` to several targets under one root.
+
+    The root is resolved once and path components already verified not to be
+    symlinks are remembered, so sibling targets share the ancestor checks.
+    """
+    root_dir = Path(root_dir).resolve()
+    checked: set[Path] = set()
+    for target_path in target_paths:
+        _check_safe_write_path(root_dir, Path(target_path), checked)
 
+
+def _check_safe_write_path(root_dir: Path, target_path: Path, checked: set[Path]) -> None:
+    # root_dir must already be resolved; `checked` holds components known not
+    # to be symlinks.
     try:
         resolved = target_path.resolve()
         resolved.relative_to(root_dir)
@@ -78,6 +95,8 @@ def ensure_safe_write_path(*, root_dir: Path, target_path: Path) -> None:
     current = root_dir
     for part in rel.parts:
         current = current / part
+        if current in checked:
+            continue
         if current.is_symlink():
             raise MeminitPathEscapeError(
                 message=f"Path '{target_path}' contains symlink component '{current}'",
@@ -87,6 +106,7 @@ def ensure_safe_write_path(*, root_dir: Path, target_path: Path) -> None:
                     "root_dir": str(root_dir),
                 },
             )
+        checked.add(current)
 
 
 def ensure_existing_regular_file_path(*, root_dir: Path, target_path: Path) -> None:
@@ -78,6 +78,9 @@ class TemplateResolver:
         """
         self.config = repo_config
         self._repo_root = repo_config.root_dir
+        # Decoded template text keyed by path, reused while the file's
+        # (st_mtime_ns, st_size) is unchanged; lives only as long as the resolver.
+        self._text_cache: dict[str, tuple[int, int, str]] = {}
 
     def resolve(self, doc_type: str) -> TemplateResolution:
         """Resolve template for a document type.
@@ -169,6 +172,10 @@ class TemplateResolver:
     def _read_template_text(self, path: Path) -> str:
         """Read template file content as UTF-8 string.
 
+        Content is memoized per path for the lifetime of this resolver and
+        revalidated with a single stat() call, so repeated resolution does not
+        re-read the template.
+
         Args:
             path: Absolute path to template file.
 
@@ -178,14 +185,28 @@ class TemplateResolver:
         Raises:
             MeminitError: With INVALID_TEMPLATE_FILE if decode fails.
         """
+        key = str(path)
+        try:
+            st = path.stat()
+        except OSError:
+            signature = None
+        else:
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = self._text_cache.get(key)
+            if cached is not None and cached[:2] == signature:
+                return cached[2]
+
         try:
-            return path.read_text(encoding="utf-8")
+            text = path.read_text(encoding="utf-8")
         except UnicodeDecodeError as exc:
             raise MeminitError(
                 code=ErrorCode.INVALID_TEMPLATE_FILE,
                 message=f"Template is not valid UTF-8: {relative_path_string(path, self._repo_root)}",
                 details={"path": str(path)},
             ) from exc
+        if signature is not None:
+            self._text_cache[key] = (*signature, text)
+        return text
 
     def _resolve_from_builtin(self, doc_type: str) -> Optional[TemplateResolution]:
         """Check built-in package templates.
@@ -1,5 +1,6 @@
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -74,41 +75,50 @@ class LinkChecker:
         return violations
 
 
+_SchemaLoad = Tuple[Optional[Dict[str, Any]], Optional[Tuple[str, str]], Optional[Draft7Validator]]
+
+
+@lru_cache(maxsize=32)
+def _compile_schema(raw: bytes) -> _SchemaLoad:
+    """Parse and compile a metadata schema, memoized on the file's bytes.
+
+    Every namespace usually points at the same schema file and each command
+    builds fresh validators, so keying on content lets them share one compiled
+    Draft7Validator without ever serving a stale schema after an edit.
+    """
+    try:
+        schema = json.loads(raw.decode("utf-8"))
+    except json.JSONDecodeError as e:
+        return None, ("SCHEMA_INVALID", f"Schema file is invalid JSON: {e}"), None
+
+    try:
+        Draft7Validator.check_schema(schema)
+    except Exception as e:
+        return None, ("SCHEMA_INVALID", f"Schema is not a valid Draft 7 JSON Schema: {e}"), None
+
+    try:
+        validator = Draft7Validator(schema, format_checker=FormatChecker())
+    except Exception as e:
+        # jsonschema can raise if the schema itself is invalid; treat as schema invalid.
+        return None, ("SCHEMA_INVALID", f"Schema is not a valid Draft 7 JSON Schema: {e}"), None
+
+    return schema, None, validator
+
+
 class SchemaValidator:
     def __init__(self, schema_path: str):
         self.schema_path = schema_path
-        self._schema, self._load_error = self._load_schema()
-        self._validator = None
-        if self._schema is not None:
-            try:
-                self._validator = Draft7Validator(self._schema, format_checker=FormatChecker())
-            except Exception as e:
-                # jsonschema can raise if the schema itself is invalid; treat as schema invalid.
-                self._schema = None
-                self._load_error = (
-                    "SCHEMA_INVALID",
-                    f"Schema is not a valid Draft 7 JSON Schema: {e}",
-                )
+        self._schema, self._load_error, self._validator = self._load_schema()
 
-    def _load_schema(self) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[str, str]]]:
+    def _load_schema(self) -> _SchemaLoad:
         try:
-            raw = Path(self.schema_path).read_text(encoding="utf-8")
+            raw = Path(self.schema_path).read_bytes()
         except FileNotFoundError:
-            return None, ("SCHEMA_MISSING", f"Schema file missing at '{self.schema_path}'")
+            return None, ("SCHEMA_MISSING", f"Schema file missing at '{self.schema_path}'"), None
         except (PermissionError, OSError) as e:
-            return None, ("SCHEMA_INVALID", f"Schema file could not be read: {e}")
-
-        try:
-            schema = json.loads(raw)
-        except json.JSONDecodeError as e:
-            return None, ("SCHEMA_INVALID", f"Schema file is invalid JSON: {e}")
-
-        try:
-            Draft7Validator.check_schema(schema)
-        except Exception as e:
-            return None, ("SCHEMA_INVALID", f"Schema is not a valid Draft 7 JSON Schema: {e}")
+            return None, ("SCHEMA_INVALID", f"Schema file could not be read: {e}"), None
 
-        return schema, None
+        return _compile_schema(raw)
 
     def is_ready(self) -> bool:
         return self._validator is not None
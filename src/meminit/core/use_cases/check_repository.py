@@ -1,7 +1,8 @@
 import glob
+import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 import frontmatter
 
@@ -14,6 +15,29 @@ from meminit.core.services.repo_config import RepoConfig, load_repo_layout
 from meminit.core.services.validators import IdValidator, LinkChecker, SchemaValidator
 
 
+def _iter_markdown_files(directory: str) -> Iterator[Path]:
+    """Yield the ``*.md`` files under ``directory``, like ``rglob("*.md")`` filtered to files.
+
+    DirEntry answers the file/directory checks from the directory listing, so there is no
+    extra stat() per entry. Symlinked directories are not descended into, matching rglob.
+    """
+    subdirs: List[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif os.path.normcase(entry.name).endswith(".md") and entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from _iter_markdown_files(subdir)
+
+
 class CheckRepositoryUseCase:
     FILENAME_REGEX = re.compile(r"^[a-z0-9-]+\.md$")
     FILENAME_EXCEPTIONS = {
@@ -93,8 +117,13 @@ class CheckRepositoryUseCase:
         schema_validators: Dict[str, SchemaValidator] = {}
 
         root_resolved = self.root_dir.resolve()
+        expanded_patterns: Set[str] = set()
 
         for pattern in paths:
+            # Repeated patterns (e.g. from shell expansion plus an explicit path) expand once.
+            if pattern in expanded_patterns:
+                continue
+            expanded_patterns.add(pattern)
             pattern_path = Path(pattern)
             if pattern_path.is_absolute():
                 candidate = pattern_path
@@ -124,20 +153,19 @@ class CheckRepositoryUseCase:
             for match in matches:
                 p = Path(match)
                 if p.is_dir():
-                    for nested in p.rglob("*.md"):
-                        if nested.is_file():
-                            all_files.append(nested)
+                    all_files.extend(_iter_markdown_files(match))
                     continue
                 if p.is_file() and p.suffix == ".md":
                     all_files.append(p)
 
-        seen = set()
-        unique_files = []
+        # Resolve each match once; the canonical path is reused for the root and namespace checks.
+        seen: Set[Path] = set()
+        unique_files: List[Tuple[Path, Path]] = []
         for f in all_files:
-            key = str(f.resolve())
-            if key not in seen:
-                seen.add(key)
-                unique_files.append(f)
+            canonical = f.resolve()
+            if canonical not in seen:
+                seen.add(canonical)
+                unique_files.append((f, canonical))
 
         if len(paths) == 1 and not unique_files and not_found_patterns:
             pattern = not_found_patterns[0]
@@ -192,11 +220,10 @@ class CheckRepositoryUseCase:
                 ],
             }
 
-        for file_path in unique_files:
+        for file_path, canonical_path in unique_files:
             try:
-                canonical_path = file_path.resolve()
                 canonical_path.relative_to(root_resolved)
-            except (ValueError, OSError):
+            except ValueError:
                 path_str = str(file_path)
                 raise MeminitError(
                     code=ErrorCode.PATH_ESCAPE,
@@ -6,6 +6,7 @@ import sys
 import tempfile
 import time
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -37,15 +38,76 @@ try:
 except ImportError:  # pragma: no cover - Windows or unsupported platforms
     fcntl = None
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
 ALLOWED_STATUSES = ["Draft", "In Review", "Approved", "Superseded"]
 RELATED_ID_PATTERN = re.compile(r"^[A-Z]{3,10}-[A-Z]{3,10}-\d{3}$")
 ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+FRONTMATTER_BOUNDARY_PATTERN = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+REPEATED_HYPHEN_PATTERN = re.compile(r"-{2,}")
+# Leading bytes inspected before parsing a file for a frontmatter document_id.
+_FRONTMATTER_SNIFF_BYTES = 512
+
+
+@lru_cache(maxsize=64)
+def _id_patterns(id_type: str) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    """Return compiled (filename, document_id) sequence patterns for an ID type segment."""
+    return (
+        re.compile(rf"^{re.escape(id_type.lower())}-(\d{{3}})-", re.IGNORECASE),
+        re.compile(rf"^[A-Z]{{3,10}}-{re.escape(id_type)}-(\d{{3}})$", re.IGNORECASE),
+    )
+
+
+@lru_cache(maxsize=8)
+def _placeholder_pattern(placeholders: tuple[str, ...]) -> re.Pattern[str]:
+    """Return a compiled alternation matching any of the literal placeholders."""
+    return re.compile("|".join(map(re.escape, placeholders)))
+
+
+class _SlugTranslationTable(dict):
+    """str.translate table that drops every character it does not map."""
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+# Keeps [a-z0-9-] and turns spaces into hyphens in a single translate() pass.
+_TITLE_SLUG_TABLE = _SlugTranslationTable(
+    {ord(c): c for c in "abcdefghijklmnopqrstuvwxyz0123456789-"}
+)
+_TITLE_SLUG_TABLE[ord(" ")] = "-"
+
+
+def _split_template_frontmatter(text: str) -> tuple[Dict[str, Any], str]:
+    """Split rendered template text into (frontmatter, body).
+
+    Mirrors python-frontmatter's YAML handler (same fence pattern and
+    stripping) but parses the header directly with the safe loader instead
+    of building a ``frontmatter.Post``.
+
+    Raises:
+        yaml.YAMLError: If the frontmatter block is not valid YAML.
+    """
+    text = text.strip()
+    parts = FRONTMATTER_BOUNDARY_PATTERN.split(text, 2)
+    if len(parts) < 3:
+        return {}, text
+    data = yaml.load(parts[1], Loader=_SafeLoader)
+    return (dict(data) if isinstance(data, dict) else {}), parts[2].strip()
 
 
 class NewDocumentUseCase:
     def __init__(self, root_dir: str):
         self._layout = load_repo_layout(root_dir)
         self.root_dir = self._layout.root_dir
+        # One resolver per namespace so its template text cache is reused
+        # across execute() calls on this use case.
+        self._template_resolvers: Dict[str, TemplateResolver] = {}
 
     def execute(
         self,
@@ -118,6 +180,10 @@ class NewDocumentUseCase:
         reasoning: Optional[List[Dict[str, Any]]],
         ctx: Dict[str, Any],
     ) -> NewDocumentResult:
+        # Resolve the creation date once so the frontmatter, rendered body and
+        # result all agree even if the run straddles midnight.
+        today = date.today().isoformat()
+
         if params.related_ids:
             seen = set()
             unique_related_ids = []
@@ -322,6 +388,7 @@ class NewDocumentUseCase:
                         keywords=params.keywords,
                         related_ids=params.related_ids,
                         superseded_by=params.superseded_by,
+                        today=today,
                     )
                     if reasoning is not None:
                         reasoning.append(
@@ -335,7 +402,7 @@ class NewDocumentUseCase:
                     self._validate_generated_metadata(actual_metadata, ns)
 
                     idempotent_last_updated = self._idempotent_last_updated(
-                        existing_content, post, content
+                        existing_content, post, content, today=today
                     )
                     if idempotent_last_updated is not None:
                         ctx["details"]["document_id"] = doc_id
@@ -412,6 +479,7 @@ class NewDocumentUseCase:
                 keywords=params.keywords,
                 related_ids=params.related_ids,
                 superseded_by=params.superseded_by,
+                today=today,
             )
             if reasoning is not None:
                 reasoning.append(
@@ -438,7 +506,7 @@ class NewDocumentUseCase:
                     version="0.1",
                     owner=owner,
                     area=params.area,
-                    last_updated=date.today().isoformat(),
+                    last_updated=today,
                     docops_version=str(ns.docops_version or "2.0"),
                     description=params.description,
                     keywords=params.keywords,
@@ -509,7 +577,7 @@ class NewDocumentUseCase:
                 version="0.1",
                 owner=owner,
                 area=params.area,
-                last_updated=date.today().isoformat(),
+                last_updated=today,
                 docops_version=str(ns.docops_version or "2.0"),
                 description=params.description,
                 keywords=params.keywords,
@@ -609,7 +677,12 @@ class NewDocumentUseCase:
         config_path = self.root_dir / "docops.config.yaml"
         if config_path.exists():
             try:
-                return yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+                return (
+                    yaml.load(
+                        config_path.read_text(encoding="utf-8"), Loader=_SafeLoader
+                    )
+                    or {}
+                )
             except Exception:
                 return None
         return None
@@ -651,13 +724,19 @@ class NewDocumentUseCase:
                 )
 
     def _idempotent_last_updated(
-        self, existing_content: str, generated_post: Any, generated_content: str
+        self,
+        existing_content: str,
+        generated_post: Any,
+        generated_content: str,
+        today: Optional[str] = None,
     ) -> Optional[str]:
         """Return last_updated for idempotent matches, or None when not idempotent."""
         if existing_content == generated_content:
             generated_meta = dict(getattr(generated_post, "metadata", {}) or {})
             normalized_meta = normalize_yaml_scalar_footguns(generated_meta)
-            return self._coerce_last_updated(normalized_meta.get("last_updated"))
+            return self._coerce_last_updated(
+                normalized_meta.get("last_updated"), today=today
+            )
 
         try:
             existing_post = safe_frontmatter_loads(existing_content)
@@ -692,7 +771,7 @@ class NewDocumentUseCase:
                 return None
 
         return self._coerce_last_updated(
-            existing_last_updated or generated_last_updated
+            existing_last_updated or generated_last_updated, today=today
         )
 
     def _as_iso_date_string(self, value: Any) -> Optional[str]:
@@ -713,11 +792,11 @@ class NewDocumentUseCase:
             normalized = normalized.replace(date_value, "<YYYY-MM-DD>")
         return normalized
 
-    def _coerce_last_updated(self, value: Any) -> str:
+    def _coerce_last_updated(self, value: Any, today: Optional[str] = None) -> str:
         """Return a normalized last_updated string or today's date as fallback."""
         if isinstance(value, str) and value.strip():
             return value
-        return date.today().isoformat()
+        return today or date.today().isoformat()
 
     def _get_lock_timeout_ms(self) -> int:
         """Get the lock acquisition timeout in milliseconds.
@@ -911,10 +990,7 @@ class NewDocumentUseCase:
 
         max_id = 0
         scanned_files = 0
-        regex = re.compile(rf"^{re.escape(id_type.lower())}-(\d{{3}})-", re.IGNORECASE)
-        frontmatter_regex = re.compile(
-            rf"^[A-Z]{{3,10}}-{re.escape(id_type)}-(\d{{3}})$", re.IGNORECASE
-        )
+        regex, frontmatter_regex = _id_patterns(id_type)
 
         for p in target_dir.glob("*.md"):
             scanned_files += 1
@@ -925,8 +1001,20 @@ class NewDocumentUseCase:
                     max_id = num
             else:
                 try:
-                    post = frontmatter.load(p)
-                except (OSError, UnicodeDecodeError, yaml.YAMLError):
+                    with open(p, "rb") as f:
+                        head = f.read(_FRONTMATTER_SNIFF_BYTES)
+                        stripped_head = head.lstrip()
+                        # Cheap prefix sniff: most non-matching files have no
+                        # frontmatter at all, so skip them without decoding or
+                        # raising from the YAML parser.
+                        if len(stripped_head) >= 3 and not stripped_head.startswith(b"---"):
+                            continue
+                        raw = head + f.read()
+                except OSError:
+                    continue
+                try:
+                    post = safe_frontmatter_loads(raw.decode("utf-8"))
+                except (UnicodeDecodeError, yaml.YAMLError):
                     continue
 
                 doc_id = post.metadata.get("document_id")
@@ -990,9 +1078,8 @@ class NewDocumentUseCase:
         Returns:
             Filename string ending in '.md'.
         """
-        safe_title = title.lower().replace(" ", "-")
-        safe_title = re.sub(r"[^a-z0-9-]", "", safe_title)
-        safe_title = re.sub(r"-{2,}", "-", safe_title).strip("-")
+        safe_title = title.lower().translate(_TITLE_SLUG_TABLE)
+        safe_title = REPEATED_HYPHEN_PATTERN.sub("-", safe_title).strip("-")
         if not safe_title:
             safe_title = "untitled"
         parts = doc_id.split("-")
@@ -1067,10 +1154,12 @@ class NewDocumentUseCase:
         description: Optional[str] = None,
         keywords: Optional[List[str]] = None,
         related_ids: Optional[List[str]] = None,
+        today: Optional[str] = None,
     ) -> str:
         """Apply standard placeholder substitutions to template content.
 
-        Replaces common template placeholders with actual values:
+        Replaces common template placeholders with actual values in a single
+        pass (substituted values are not re-scanned for placeholders):
         - {title}: Document title
         - {status}: Document status
         - <REPO>, <PROJECT>: Repository prefix from document ID
@@ -1095,6 +1184,7 @@ class NewDocumentUseCase:
             description: Optional document description.
             keywords: Optional list of keywords.
             related_ids: Optional list of related document IDs.
+            today: ISO date for <YYYY-MM-DD>; defaults to the current date.
 
         Returns:
             Content with all placeholders replaced.
@@ -1106,7 +1196,8 @@ class NewDocumentUseCase:
             repo_prefix = default_ns.repo_prefix
         seq = parts[-1] if len(parts) >= 3 else "001"
 
-        today = date.today().isoformat()
+        if today is None:
+            today = date.today().isoformat()
 
         substitutions = {
             "{title}": title,
@@ -1125,10 +1216,9 @@ class NewDocumentUseCase:
             "{related_ids}": ", ".join(related_ids) if related_ids else "",
         }
 
-        for k, v in substitutions.items():
-            body = body.replace(k, v)
-
-        return body
+        return _placeholder_pattern(tuple(substitutions)).sub(
+            lambda m: substitutions[m.group(0)], body
+        )
 
     # ========== Templates v2 Methods ==========
 
@@ -1145,6 +1235,7 @@ class NewDocumentUseCase:
         keywords: Optional[List[str]] = None,
         related_ids: Optional[List[str]] = None,
         superseded_by: Optional[str] = None,
+        today: Optional[str] = None,
     ) -> tuple[str, dict[str, Any]]:
         """Load and interpolate a template using Templates v2 system.
 
@@ -1163,6 +1254,7 @@ class NewDocumentUseCase:
             keywords: Optional list of keywords.
             related_ids: Optional list of related document IDs.
             superseded_by: Optional superseding document ID.
+            today: ISO date for last_updated; defaults to the current date.
 
         Returns:
             A tuple of (rendered_content, template_info_dict).
@@ -1171,7 +1263,10 @@ class NewDocumentUseCase:
             MeminitError: For template resolution or interpolation errors.
         """
         # Resolve template using precedence chain
-        resolver = TemplateResolver(ns)
+        resolver = self._template_resolvers.get(ns.namespace)
+        if resolver is None or resolver.config is not ns:
+            resolver = TemplateResolver(ns)
+            self._template_resolvers[ns.namespace] = resolver
         resolution = resolver.resolve(doc_type)
 
         # Get template content or use skeleton
@@ -1206,12 +1301,12 @@ class NewDocumentUseCase:
         template_frontmatter: Dict[str, Any] = {}
         if body.strip().startswith("---"):
             try:
-                post = safe_frontmatter_loads(body)
+                template_frontmatter, body = _split_template_frontmatter(body)
             except (yaml.YAMLError, ValueError):
                 pass
-            else:
-                template_frontmatter = dict(post.metadata) if post.metadata else {}
-                body = post.content
+
+        if today is None:
+            today = date.today().isoformat()
 
         # Build generated metadata
         docops_version = str(ns.docops_version or "2.0")
@@ -1221,7 +1316,7 @@ class NewDocumentUseCase:
             "title": title,
             "status": status,
             "version": "0.1",
-            "last_updated": date.today().isoformat(),
+            "last_updated": today,
             "owner": owner,
             "docops_version": docops_version,
         }
@@ -1260,8 +1355,8 @@ class NewDocumentUseCase:
             body = f"{visible_block}\n\n{body.lstrip()}"
 
         # Build final document with frontmatter
-        fm_yaml = yaml.safe_dump(
-            metadata, sort_keys=False, default_flow_style=False
+        fm_yaml = yaml.dump(
+            metadata, Dumper=_SafeDumper, sort_keys=False, default_flow_style=False
         ).strip()
         rendered_content = f"---\n{fm_yaml}\n---\n\n{body}"
 
@@ -5,7 +5,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Mapping, Optional
 
-from meminit.core.services.org_profiles import global_profile_dir, resolve_org_profile
+from meminit.core.services.org_profiles import (
+    REPO_LOCK_RELATIVE_PATH,
+    global_profile_dir,
+    resolve_org_profile,
+)
 
 
 @dataclass(frozen=True)
@@ -45,7 +49,7 @@ class OrgStatusUseCase:
 
         profile = resolve_org_profile(profile_name=profile_name, env=self._env, prefer_global=True)
 
-        lock_path = self._root / ".meminit" / "org-profile.lock.json"
+        lock_path = self._root / REPO_LOCK_RELATIVE_PATH
         repo_lock_present = lock_path.exists()
         lock_digest = None
         matches = None
@@ -64,7 +68,7 @@ class OrgStatusUseCase:
             global_installed=global_installed,
             global_dir=str(global_dir),
             repo_lock_present=repo_lock_present,
-            repo_lock_path=str(lock_path.relative_to(self._root)),
+            repo_lock_path=str(REPO_LOCK_RELATIVE_PATH),
             repo_lock_digest=lock_digest if isinstance(lock_digest, str) else None,
             current_profile_source=profile.source,
             current_profile_digest=profile.digest(),
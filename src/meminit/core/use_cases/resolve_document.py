@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from meminit.core.services.path_utils import load_index_documents
 
@@ -19,15 +19,26 @@ class ResolveDocumentUseCase:
 
         layout = load_repo_layout(root_dir)
         self._index_file = layout.index_file
+        self._index_by_id: Optional[Dict[str, Optional[str]]] = None
 
     def execute(self, document_id: str) -> ResolveResult:
         doc_id = document_id.strip()
-        documents = load_index_documents(self._index_file)
-        for entry in documents:
-            if not isinstance(entry, dict):
-                continue
-            if entry.get("document_id") == doc_id:
+        return ResolveResult(document_id=doc_id, path=self._load_index_by_id().get(doc_id))
+
+    def _load_index_by_id(self) -> Dict[str, Optional[str]]:
+        """Parse the index once per instance into a document_id -> path map."""
+        if self._index_by_id is None:
+            index_by_id: Dict[str, Optional[str]] = {}
+            for entry in load_index_documents(self._index_file):
+                if not isinstance(entry, dict):
+                    continue
+                entry_id = entry.get("document_id")
+                if not isinstance(entry_id, str):
+                    continue
                 path_value = entry.get("path")
-                path = path_value if isinstance(path_value, str) else None
-                return ResolveResult(document_id=doc_id, path=path)
-        return ResolveResult(document_id=doc_id, path=None)
+                # First entry wins, matching the previous linear scan.
+                index_by_id.setdefault(
+                    entry_id, path_value if isinstance(path_value, str) else None
+                )
+            self._index_by_id = index_by_id
+        return self._index_by_id
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 import datetime
 import logging
+import os
+import re
 
 import yaml
 
@@ -25,6 +28,17 @@ TYPE_ALIASES: Dict[str, List[str]] = {
     "GUIDE": ["guides"],
 }
 
+NON_UPPER_ALPHA_PATTERN = re.compile(r"[^A-Z]")
+
+
+def _crosses_symlink(path: Path, depth: int) -> bool:
+    """Return whether *path* or an ancestor deeper than *depth* parts is a symlink."""
+    while len(path.parts) > depth:
+        if path.is_symlink():
+            return True
+        path = path.parent
+    return False
+
 
 @dataclass(frozen=True)
 class ScanReport:
@@ -98,7 +112,10 @@ class ScanRepositoryUseCase:
             markdown_count = len(target_files)
 
         # Always compute namespace-aware counts when possible.
-        configured_namespaces = self._configured_namespaces(layout)
+        prewalked = {docs_dir: target_files} if docs_dir.exists() else {}
+        configured_namespaces = self._configured_namespaces(
+            layout, self._namespace_markdown_files(layout, prewalked)
+        )
         governed_markdown_count = sum(
             int(ns.get("governed_markdown_count") or 0) for ns in configured_namespaces
         )
@@ -112,7 +129,10 @@ class ScanRepositoryUseCase:
         # Only suggest type_directories for the primary docs_root when it exists on disk.
         subdirs = {}
         if docs_dir.exists():
-            subdirs = {p.name.lower(): p.name for p in docs_dir.iterdir() if p.is_dir()}
+            # DirEntry.is_dir() answers from the directory listing without a
+            # per-entry stat() (symlinks are still followed, as before).
+            with os.scandir(docs_dir) as entries:
+                subdirs = {e.name.lower(): e.name for e in entries if e.is_dir()}
 
         for doc_type, default_dir in layout.default_namespace().type_directories.items():
             default_name = default_dir.split("/")[-1].lower()
@@ -244,31 +264,55 @@ class ScanRepositoryUseCase:
                 continue
             # Only suggest if it looks doc-like (has some markdown).
             abs_path = self._root_dir / rel
-            md_count = len(list(abs_path.rglob("*.md")))
-            if md_count == 0:
+            if next(abs_path.rglob("*.md"), None) is None:
                 continue
 
-            name = Path(rel).parts[-2] if len(Path(rel).parts) >= 2 else rel.replace("/", "-")
-            repo_prefix = "".join(c for c in name.upper() if "A" <= c <= "Z")[:10]
+            segments = rel.split("/")
+            name = segments[-2] if len(segments) >= 2 else rel.replace("/", "-")
+            repo_prefix = NON_UPPER_ALPHA_PATTERN.sub("", name.upper())[:10]
             if len(repo_prefix) < 3:
                 repo_prefix = "PKG"
             out.append({"name": name, "docs_root": rel, "repo_prefix_suggestion": repo_prefix})
 
         return out
 
-    def _configured_namespaces(self, layout) -> List[Dict[str, object]]:
+    def _namespace_markdown_files(
+        self, layout, prewalked: Dict[Path, List[Path]]
+    ) -> List[Path]:
+        """Collect markdown under every namespace root, walking each directory once.
+
+        Roots nested inside an already-walked directory (including the
+        ``prewalked`` ones) are covered by that walk and are skipped, unless
+        the path below the walked directory crosses a symlink: ``rglob`` does
+        not descend into symlinked directories, so those roots are walked too.
+        """
+        files: List[Path] = [path for paths in prewalked.values() for path in paths]
+        walked: List[tuple] = [root.parts for root in prewalked]
+        roots = sorted({ns.docs_dir for ns in layout.namespaces}, key=lambda p: len(p.parts))
+        for root in roots:
+            parts = root.parts
+            covering = [len(w) for w in walked if parts[: len(w)] == w]
+            if covering and not _crosses_symlink(root, max(covering)):
+                continue
+            if not root.exists():
+                continue
+            files.extend(root.rglob("*.md"))
+            walked.append(parts)
+        # A prewalked directory nested under a namespace root is seen twice.
+        return list(dict.fromkeys(files))
+
+    def _configured_namespaces(self, layout, md_files: List[Path]) -> List[Dict[str, object]]:
+        governed_counts: Counter = Counter()
+        for path in md_files:
+            owner = layout.namespace_for_path(path)
+            if owner is None or owner.is_excluded(path):
+                continue
+            governed_counts[owner.namespace.lower()] += 1
+
         out: List[Dict[str, object]] = []
         for ns in layout.namespaces:
             exists = ns.docs_dir.exists()
-            governed = 0
-            if exists:
-                for path in ns.docs_dir.rglob("*.md"):
-                    owner = layout.namespace_for_path(path)
-                    if owner is None or owner.namespace.lower() != ns.namespace.lower():
-                        continue
-                    if ns.is_excluded(path):
-                        continue
-                    governed += 1
+            governed = governed_counts[ns.namespace.lower()] if exists else 0
             out.append(
                 {
                     "namespace": ns.namespace,
@@ -287,22 +331,29 @@ class ScanRepositoryUseCase:
             root = str(ns.docs_root or "").strip().strip("/").replace("\\", "/")
             if not root:
                 continue
-            parts = Path(root).parts
-            items.append((ns, root, parts))
-
-        for a, a_root, a_parts in items:
-            for b, b_root, b_parts in items:
-                if a.namespace == b.namespace:
+            parts = tuple(p for p in root.split("/") if p and p != ".")
+            items.append((parts, root, ns))
+
+        # Sweep over roots sorted by path segments: every ancestor of a root is
+        # still on the stack when that root is visited, so nested roots are
+        # found in O(n log n + overlaps) instead of comparing every pair.
+        items.sort(key=lambda item: item[0])
+        stack: List[tuple] = []
+        for parts, root, ns in items:
+            while stack and parts[: len(stack[-1][0])] != stack[-1][0]:
+                stack.pop()
+            for a_parts, a_root, a in stack:
+                if a_parts == parts or a.namespace == ns.namespace:
                     continue
-                if len(a_parts) < len(b_parts) and b_parts[: len(a_parts)] == a_parts:
-                    overlaps.append(
-                        {
-                            "parent_namespace": a.namespace,
-                            "parent_docs_root": a_root,
-                            "child_namespace": b.namespace,
-                            "child_docs_root": b_root,
-                        }
-                    )
+                overlaps.append(
+                    {
+                        "parent_namespace": a.namespace,
+                        "parent_docs_root": a_root,
+                        "child_namespace": ns.namespace,
+                        "child_docs_root": root,
+                    }
+                )
+            stack.append((parts, root, ns))
         # Deterministic ordering for tests and stable output.
         overlaps.sort(
             key=lambda d: (
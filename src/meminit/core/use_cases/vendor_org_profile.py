@@ -1,19 +1,57 @@
 from __future__ import annotations
 
+import copy
 import json
+import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
 from typing import Dict, Mapping, Optional
 
 import yaml
 
-from meminit.core.services.org_profiles import OrgProfile, resolve_org_profile
+from meminit.core.services.org_profiles import (
+    REPO_LOCK_RELATIVE_PATH,
+    TARGET_CREATE,
+    TARGET_UNCHANGED,
+    TARGET_UPDATE,
+    classify_profile_targets,
+    resolve_org_profile,
+)
 from meminit.core.services.repo_config import load_repo_layout
-from meminit.core.services.safe_fs import ensure_safe_write_path
-
-
-@dataclass(frozen=True)
+from meminit.core.services.safe_fs import atomic_write, ensure_safe_write_paths
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+_LOCK_PATH_STR = str(REPO_LOCK_RELATIVE_PATH)
+
+# (profile-relative source, destination suffix under the repo docs root)
+_CORE_FILES = (
+    ("metadata.schema.json", "/00-governance/metadata.schema.json"),
+    ("templates/adr.template.md", "/00-governance/templates/adr.template.md"),
+    ("templates/fdd.template.md", "/00-governance/templates/fdd.template.md"),
+    ("templates/prd.template.md", "/00-governance/templates/prd.template.md"),
+)
+_ORG_DOC_FILES = (
+    ("org_docs/org-gov-001-constitution.md", "/00-governance/org/org-gov-001-constitution.md"),
+    ("org_docs/org-gov-002-metadata-schema.md", "/00-governance/org/org-gov-002-metadata-schema.md"),
+)
+
+
+def _render_lock_json(payload: Mapping[str, str]) -> str:
+    # The lock payload is a flat mapping of strings, so only the values need
+    # escaping; the output is identical to json.dumps(payload, indent=2).
+    body = ",\n".join(f"  {json.dumps(key)}: {json.dumps(value)}" for key, value in payload.items())
+    return "{\n" + body + "\n}"
+
+
+@dataclass(frozen=True, slots=True)
 class OrgVendorReport:
     profile_name: str
     profile_version: str
@@ -27,18 +65,8 @@ class OrgVendorReport:
     message: str
 
     def as_dict(self) -> dict:
-        return {
-            "profile_name": self.profile_name,
-            "profile_version": self.profile_version,
-            "source": self.source,
-            "digest": self.digest,
-            "dry_run": self.dry_run,
-            "updated_files": self.updated_files,
-            "created_files": self.created_files,
-            "unchanged_files": self.unchanged_files,
-            "lock_path": self.lock_path,
-            "message": self.message,
-        }
+        # slots=True makes __slots__ the field names in declaration order.
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class VendorOrgProfileUseCase:
@@ -68,117 +96,101 @@ class VendorOrgProfileUseCase:
         include_org_docs: bool = True,
     ) -> OrgVendorReport:
         profile = resolve_org_profile(profile_name=profile_name, env=self._env, prefer_global=True)
+        digest = profile.digest()
+        # Fields shared by every report this call can return.
+        common = dict(
+            profile_name=profile.name,
+            profile_version=profile.version,
+            source=profile.source,
+            digest=digest,
+            lock_path=_LOCK_PATH_STR,
+        )
         layout = load_repo_layout(self._root)
         repo_docs_root = layout.default_namespace().docs_root.strip("/").replace("\\", "/") or "docs"
 
-        lock_path = self._root / ".meminit" / "org-profile.lock.json"
-        if lock_path.exists() and not force:
+        lock_path = self._root / REPO_LOCK_RELATIVE_PATH
+        if not force and os.path.lexists(lock_path):
             return OrgVendorReport(
-                profile_name=profile.name,
-                profile_version=profile.version,
-                source=profile.source,
-                digest=profile.digest(),
+                **common,
                 dry_run=dry_run,
                 updated_files=0,
                 created_files=0,
                 unchanged_files=0,
-                lock_path=str(lock_path.relative_to(self._root)),
                 message="Lock file exists; refusing to overwrite (use --force to update).",
             )
 
-        mapping: Dict[str, str] = {
-            "metadata.schema.json": f"{repo_docs_root}/00-governance/metadata.schema.json",
-            "templates/adr.template.md": f"{repo_docs_root}/00-governance/templates/adr.template.md",
-            "templates/fdd.template.md": f"{repo_docs_root}/00-governance/templates/fdd.template.md",
-            "templates/prd.template.md": f"{repo_docs_root}/00-governance/templates/prd.template.md",
-        }
-        if include_org_docs:
-            mapping.update(
-                {
-                    "org_docs/org-gov-001-constitution.md": f"{repo_docs_root}/00-governance/org/org-gov-001-constitution.md",
-                    "org_docs/org-gov-002-metadata-schema.md": f"{repo_docs_root}/00-governance/org/org-gov-002-metadata-schema.md",
-                }
-            )
+        pairs = chain(_CORE_FILES, _ORG_DOC_FILES) if include_org_docs else _CORE_FILES
+        mapping: Dict[str, str] = {src_rel: repo_docs_root + dest_suffix for src_rel, dest_suffix in pairs}
 
-        created = updated = same = 0
-        for src_rel, dest_rel in mapping.items():
-            dest = self._root / dest_rel
-            content = profile.files.get(src_rel, b"")
-            if not dest.exists():
-                created += 1
-            else:
-                try:
-                    existing = dest.read_bytes()
-                except OSError:
-                    updated += 1
-                else:
-                    if existing == content:
-                        same += 1
-                    else:
-                        updated += 1
+        targets = classify_profile_targets(profile, self._root, mapping)
+        statuses = [status for _, _, status in targets]
+        created = statuses.count(TARGET_CREATE)
+        updated = statuses.count(TARGET_UPDATE)
+        same = statuses.count(TARGET_UNCHANGED)
 
         if dry_run:
             return OrgVendorReport(
-                profile_name=profile.name,
-                profile_version=profile.version,
-                source=profile.source,
-                digest=profile.digest(),
+                **common,
                 dry_run=True,
                 updated_files=updated,
                 created_files=created,
                 unchanged_files=same,
-                lock_path=str(lock_path.relative_to(self._root)),
                 message="Dry run complete.",
             )
 
-        # Write files
-        for src_rel, dest_rel in mapping.items():
-            dest = self._root / dest_rel
-            ensure_safe_write_path(root_dir=self._root, target_path=dest)
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_bytes(profile.files[src_rel])
+        # Write only files that differ, reusing the classification above.
+        # Every destination is still validated so a symlinked docs root is
+        # refused even when its contents already match.
+        config_path = self._root / "docops.config.yaml"
+        ensure_safe_write_paths(
+            root_dir=self._root,
+            target_paths=[*(dest for _, dest, _ in targets), config_path, lock_path],
+        )
+        files = profile.files
+        pending = [(dest, files[src_rel]) for src_rel, dest, status in targets if status != TARGET_UNCHANGED]
+        for parent in sorted({dest.parent for dest, _ in pending}, key=lambda p: len(p.parts)):
+            parent.mkdir(parents=True, exist_ok=True)
+        for dest, content in pending:
+            atomic_write(dest, content)
 
         # Update docops.config.yaml (do not overwrite; merge).
-        self._ensure_repo_config_for_org(profile, repo_docs_root=repo_docs_root, include_org_docs=include_org_docs)
+        self._ensure_repo_config_for_org(
+            config_path, repo_docs_root=repo_docs_root, include_org_docs=include_org_docs
+        )
 
         lock_path.parent.mkdir(parents=True, exist_ok=True)
-        ensure_safe_write_path(root_dir=self._root, target_path=lock_path)
         lock_payload = {
             "lock_schema_version": "1.0",
             "profile_name": profile.name,
             "profile_version": profile.version,
             "source": profile.source,
-            "digest": profile.digest(),
+            "digest": digest,
             "vendored_at": datetime.now(timezone.utc).isoformat(),
         }
-        lock_path.write_text(json.dumps(lock_payload, indent=2), encoding="utf-8")
+        atomic_write(lock_path, _render_lock_json(lock_payload), encoding="utf-8")
 
         return OrgVendorReport(
-            profile_name=profile.name,
-            profile_version=profile.version,
-            source=profile.source,
-            digest=profile.digest(),
+            **common,
             dry_run=False,
             updated_files=updated,
             created_files=created,
             unchanged_files=same,
-            lock_path=str(lock_path.relative_to(self._root)),
             message="Vendored org profile into repository.",
         )
 
     def _ensure_repo_config_for_org(
-        self, profile: OrgProfile, repo_docs_root: str, include_org_docs: bool
+        self, config_path: Path, repo_docs_root: str, include_org_docs: bool
     ) -> None:
-        config_path = self._root / "docops.config.yaml"
-        ensure_safe_write_path(root_dir=self._root, target_path=config_path)
+        # config_path has already been validated by execute().
         data: dict = {}
         if config_path.exists():
             try:
-                data = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+                data = yaml.load(config_path.read_bytes(), Loader=_SafeLoader) or {}
             except Exception:
                 data = {}
         if not isinstance(data, dict):
             data = {}
+        original = copy.deepcopy(data) if config_path.exists() else None
 
         # Ensure schema_path points at the vendored schema.
         data.setdefault("schema_path", f"{repo_docs_root}/00-governance/metadata.schema.json")
@@ -188,12 +200,20 @@ class VendorOrgProfileUseCase:
             namespaces = data.get("namespaces")
             if not isinstance(namespaces, list):
                 namespaces = []
+            # One pass records whether any namespace has a prefix and whether ORG exists.
+            has_prefix = has_org = False
+            for n in namespaces:
+                if isinstance(n, dict):
+                    prefix = n.get("repo_prefix")
+                    has_prefix = has_prefix or bool(prefix)
+                    has_org = has_org or prefix == "ORG"
             # Make sure there's a "repo" namespace.
-            if not any(isinstance(n, dict) and n.get("repo_prefix") for n in namespaces):
-                repo_prefix = data.get("repo_prefix") or "REPO"
-                namespaces.append({"name": "repo", "repo_prefix": str(repo_prefix), "docs_root": repo_docs_root})
+            if not has_prefix:
+                repo_prefix = str(data.get("repo_prefix") or "REPO")
+                namespaces.append({"name": "repo", "repo_prefix": repo_prefix, "docs_root": repo_docs_root})
+                has_org = repo_prefix == "ORG"
 
-            if not any(isinstance(n, dict) and n.get("repo_prefix") == "ORG" for n in namespaces):
+            if not has_org:
                 namespaces.append(
                     {
                         "name": "org",
@@ -204,4 +224,8 @@ class VendorOrgProfileUseCase:
                 )
             data["namespaces"] = namespaces
 
-        config_path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+        if data == original:
+            return
+        atomic_write(
+            config_path, yaml.dump(data, Dumper=_SafeDumper, sort_keys=False), encoding="utf-8"
+        )
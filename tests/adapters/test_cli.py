@@ -1,43 +1,247 @@
-import inspect
 import json
 import os
+import re
+import shutil
+from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from typing import Iterable
 
+import click
 import pytest
-from click.testing import CliRunner
 
 from meminit.cli.main import cli
 from meminit.core.services.versioning import get_cli_version
 from meminit.core.domain.entities import CheckResult, NewDocumentResult
 from meminit.core.services.error_codes import ErrorCode, MeminitError
+from tests.helpers import assert_json_envelope, last_line, parse_last_json_line
 
 
-def runner_no_mixed_stderr() -> CliRunner:
-    kwargs = {}
-    if "mix_stderr" in inspect.signature(CliRunner).parameters:
-        kwargs["mix_stderr"] = False
-    return CliRunner(**kwargs)
+def _invoke(runner, subcommand: str, args: list[str], **kwargs):
+    """Invoke a leaf subcommand directly, skipping the top-level group's option parsing.
 
+    Tests that exercise group options (``--verbose``, ``--no-color``) still go through ``cli``.
+    """
+    return runner.invoke(cli.commands[subcommand], args, **kwargs)
 
-def test_cli_version():
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--version"])
-    assert result.exit_code == 0
-    assert "meminit" in result.output
-    assert get_cli_version() in result.output
 
+def _assert_all_in(output: str, needles: Iterable[str]) -> None:
+    missing = [needle for needle in needles if needle not in output]
+    assert not missing, f"Missing {missing} in {output!r}"
 
-def test_cli_no_color_sets_env(tmp_path, monkeypatch):
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+
+def _assert_none_in(output: str, needles: Iterable[str]) -> None:
+    present = [needle for needle in needles if needle in output]
+    assert not present, f"Unexpected {present} in {output!r}"
+
+
+def _assert_error_envelope(data: dict, code: str) -> None:
+    """Assert that *data* is a v3 error envelope carrying *code*."""
+    assert data["output_schema_version"] == "3.0"
+    assert data["success"] is False
+    assert data["error"]["code"] == code
+
+
+# First line of CLI output that opens a JSON object (the envelope).
+_JSON_LINE_RE = re.compile(r"^[ \t]*\{.*$", re.MULTILINE)
+
+# Minimal frontmatter schema and ADR-only config shared by the repo fixtures below.
+_METADATA_SCHEMA_BYTES = json.dumps(
+    {
+        "type": "object",
+        "required": [
+            "document_id",
+            "type",
+            "title",
+            "status",
+            "version",
+            "last_updated",
+            "owner",
+            "docops_version",
+        ],
+        "properties": {
+            key: {"type": "string"}
+            for key in (
+                "document_id",
+                "type",
+                "title",
+                "status",
+                "version",
+                "last_updated",
+                "owner",
+                "docops_version",
+            )
+        },
+    },
+    separators=(",", ":"),
+).encode("utf-8")
+
+_MINIMAL_CONFIG_BYTES = b"project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n"
+
+_ADR_CONFIG_BYTES = b"""project_name: TestProject
+repo_prefix: TEST
+docops_version: '2.0'
+document_types:
+  ADR:
+    directory: 45-adr
+"""
+
+# Config declaring several document types, used by the `new --list-types` tests.
+_TYPED_CONFIG_BYTES = b"""project_name: TestProject
+repo_prefix: TEST
+docops_version: '2.0'
+document_types:
+  ADR:
+    directory: 45-adr
+  PRD:
+    directory: 10-prd
+  FDD:
+    directory: 50-fdd
+"""
+
+# ADR config wired to an explicit schema and template, used by the `new` fixtures.
+_ADR_TEMPLATE_CONFIG_BYTES = b"""project_name: TestProject
+repo_prefix: TEST
+docops_version: '2.0'
+schema_path: docs/00-governance/metadata.schema.json
+document_types:
+  ADR:
+    directory: 45-adr
+    template: docs/00-governance/templates/adr.md
+"""
+
+_ADR_TEMPLATE_BYTES = b"""<!-- MEMINIT_METADATA_BLOCK -->
+> Metadata goes here
+<!-- END_MEMINIT_METADATA_BLOCK -->
+# ADR
+"""
+
+
+# Files of an ADR repo with an explicit schema and template, keyed by repo-relative path.
+_ADR_TEMPLATE_LAYOUT = (
+    ("docs/00-governance/templates/adr.md", _ADR_TEMPLATE_BYTES),
+    ("docs/00-governance/metadata.schema.json", _METADATA_SCHEMA_BYTES),
+    ("docops.config.yaml", _ADR_TEMPLATE_CONFIG_BYTES),
+)
+
+
+def _write_adr_template_repo(root: Path) -> Path:
+    """Write ``_ADR_TEMPLATE_LAYOUT`` plus an empty ADR directory under ``root``."""
+    for rel, data in _ADR_TEMPLATE_LAYOUT:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    (root / "docs" / "45-adr").mkdir()
+    return root
+
+
+# Shared, never-mutated CheckResult payloads for the mocked check use case.
+_EMPTY_CLEAN = CheckResult(
+    success=True,
+    files_checked=0,
+    files_passed=0,
+    files_failed=0,
+    violations=[],
+    warnings=[],
+    checked_paths=[],
+)
+_VIOLATION_SINGLE = CheckResult(
+    success=False,
+    files_checked=1,
+    files_passed=0,
+    files_failed=1,
+    violations=[
+        {
+            "path": "docs/bad.md",
+            "violations": [
+                {"code": "TEST_RULE", "message": "Bad Thing", "line": 1}
+            ],
+        }
+    ],
+    warnings=[],
+    checked_paths=["docs/bad.md"],
+    violations_count=1,
+)
+_WARNING_SINGLE = CheckResult(
+    success=True,
+    files_checked=1,
+    files_passed=1,
+    files_failed=0,
+    violations=[],
+    warnings=[
+        {
+            "path": "docs/warn.md",
+            "warnings": [
+                {"code": "WARN_RULE", "message": "Needs attention", "line": 0}
+            ],
+        }
+    ],
+    checked_paths=["docs/warn.md"],
+    warnings_count=1,
+    files_with_warnings=1,
+)
+_VIOLATION_AND_WARNING = CheckResult(
+    success=False,
+    files_checked=1,
+    files_passed=0,
+    files_failed=1,
+    violations=[
+        {
+            "path": "docs/bad.md",
+            "violations": [{"code": "ID_REGEX", "message": "Bad ID", "line": 3}],
+        }
+    ],
+    warnings=[
+        {
+            "path": "docs/bad.md",
+            "warnings": [
+                {"code": "WARN_RULE", "message": "Needs attention", "line": 5}
+            ],
+        }
+    ],
+    checked_paths=["docs/bad.md"],
+    warnings_count=1,
+    violations_count=1,
+)
+# --strict promotes warnings to violations, so the warning arrives as one.
+_WARNING_AS_VIOLATION = CheckResult(
+    success=False,
+    files_checked=1,
+    files_passed=0,
+    files_failed=1,
+    violations=[
+        {
+            "path": "docs/warn.md",
+            "violations": [
+                {"code": "WARN_RULE", "message": "Needs attention", "line": 0}
+            ],
+        }
+    ],
+    warnings=[],
+    checked_paths=["docs/warn.md"],
+    violations_count=1,
+)
+
+# Constant use-case results shared by the resolve/link and org JSON tests.
+_RESOLVED_ADR = SimpleNamespace(path="docs/45-adr/adr-001.md")
+_DEFAULT_PROFILE_REPORT = SimpleNamespace(as_dict=lambda: {"profile": "default"})
+
+
+def test_cli_version(capsys):
+    # --version is handled while parsing, so no CliRunner isolation is needed.
+    with pytest.raises(click.exceptions.Exit) as exc_info:
+        cli.make_context("meminit", ["--version"])
+    assert exc_info.value.exit_code == 0
+    output = capsys.readouterr().out
+    assert "meminit" in output
+    assert get_cli_version() in output
+
+
+def test_cli_no_color_sets_env(tmp_path, monkeypatch, runner):
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
     # Ensure variables are cleared before and restored after the test
     monkeypatch.delenv("NO_COLOR", raising=False)
     monkeypatch.delenv("RICH_NO_COLOR", raising=False)
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["--no-color", "context", "--root", str(tmp_path)])
 
     assert result.exit_code == 0
@@ -45,15 +249,11 @@ def test_cli_no_color_sets_env(tmp_path, monkeypatch):
     assert os.environ.get("RICH_NO_COLOR") == "1"
 
 
-def test_cli_verbose_sets_debug_env(tmp_path, monkeypatch):
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+def test_cli_verbose_sets_debug_env(tmp_path, monkeypatch, runner):
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
     # Ensure variable is cleared before and restored after the test
     monkeypatch.delenv("MEMINIT_DEBUG", raising=False)
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["--verbose", "context", "--root", str(tmp_path)])
 
     assert result.exit_code == 0
@@ -61,13 +261,10 @@ def test_cli_verbose_sets_debug_env(tmp_path, monkeypatch):
     assert os.environ.get("MEMINIT_DEBUG") is None
 
 
-def test_cli_init_json_outputs_created_and_skipped_paths(tmp_path):
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["init", "--root", str(tmp_path), "--format", "json"])
+def test_cli_init_json_outputs_created_and_skipped_paths(tmp_path, runner_no_mixed_stderr):
+    result = _invoke(runner_no_mixed_stderr, "init", ["--root", str(tmp_path), "--format", "json"])
 
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     payload = data["data"]
     assert "created_paths" in payload
     assert "skipped_paths" in payload
@@ -75,122 +272,150 @@ def test_cli_init_json_outputs_created_and_skipped_paths(tmp_path):
     assert "AGENTS.md" in payload["created_paths"]
 
 
-def test_cli_init_md_outputs_created_and_skipped_paths(tmp_path):
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["init", "--root", str(tmp_path), "--format", "md"])
+def test_cli_init_md_outputs_created_and_skipped_paths(tmp_path, runner_no_mixed_stderr):
+    result = _invoke(runner_no_mixed_stderr, "init", ["--root", str(tmp_path), "--format", "md"])
 
     assert result.exit_code == 0
-    assert "# Meminit Init" in result.output
-    assert "Created Paths" in result.output
-    assert "docops.config.yaml" in result.output
-    assert "AGENTS.md" in result.output
+    _assert_all_in(
+        result.output,
+        (
+            "# Meminit Init",
+            "Created Paths",
+            "docops.config.yaml",
+            "AGENTS.md",
+        ),
+    )
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
-def test_cli_check_clean(mock_use_case):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=True,
-        files_checked=0,
-        files_passed=0,
-        files_failed=0,
-        violations=[],
-        warnings=[],
-        checked_paths=[],
+@pytest.fixture(scope="session")
+def _canonical_config(tmp_path_factory):
+    path = tmp_path_factory.mktemp("config") / "docops.config.yaml"
+    path.write_bytes(_MINIMAL_CONFIG_BYTES)
+    return path
+
+
+@pytest.fixture
+def tmp_config(tmp_path, _canonical_config):
+    """Copy the minimal docops.config.yaml into tmp_path and return its path."""
+    return shutil.copyfile(_canonical_config, tmp_path / "docops.config.yaml")
+
+
+def _run_in_process(capsys, subcommand: str, args: Iterable[str]) -> SimpleNamespace:
+    """Run a leaf command directly, without CliRunner's stream isolation.
+
+    Click usage and other ``ClickException`` errors are reported as in
+    standalone mode: the message goes to stderr and the exception's exit code
+    is returned. ``output`` is stdout followed by stderr, not interleaved, so
+    tests that depend on the relative order of the two streams should use the
+    ``runner`` fixture instead.
+    """
+    try:
+        exit_code = cli.commands[subcommand].main(
+            list(args), prog_name=f"meminit {subcommand}", standalone_mode=False
+        )
+    except click.ClickException as exc:
+        exc.show()
+        exit_code = exc.exit_code
+    except SystemExit as exc:
+        exit_code = exc.code
+    captured = capsys.readouterr()
+    return SimpleNamespace(
+        exit_code=exit_code or 0,
+        output=captured.out + captured.err,
+        stdout=captured.out,
+        stderr=captured.err,
     )
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["check"])
+
+@pytest.fixture
+def mock_check(monkeypatch):
+    """Replace CheckRepositoryUseCase in the CLI; set ``.result`` to the summary it returns."""
+    stub = SimpleNamespace(result=None)
+
+    class _CheckUseCaseStub:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def execute_full_summary(self, **kwargs):
+            return stub.result
+
+    monkeypatch.setattr("meminit.cli.main.CheckRepositoryUseCase", _CheckUseCaseStub)
+    return stub
+
+
+def _stub_use_case(monkeypatch, name: str, result) -> None:
+    """Replace ``meminit.cli.main.<name>`` with a class whose execute methods return ``result``."""
+
+    class _UseCaseStub:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def execute(self, *args, **kwargs):
+            return result
+
+        execute_with_params = execute
+
+    monkeypatch.setattr(f"meminit.cli.main.{name}", _UseCaseStub)
+
+
+def test_cli_check_clean(mock_check, capsys):
+    mock_check.result = _EMPTY_CLEAN
+
+    result = _run_in_process(capsys, "check", [])
 
     assert result.exit_code == 0
     assert "No violations found" in result.output
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
-def test_cli_check_clean_quiet_is_silent(mock_use_case, tmp_path):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=True,
-        files_checked=0,
-        files_passed=0,
-        files_failed=0,
-        violations=[],
-        warnings=[],
-        checked_paths=[],
-    )
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: Test\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+def test_cli_check_clean_quiet_is_silent(mock_check, tmp_path, tmp_config, capsys):
+    mock_check.result = _EMPTY_CLEAN
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["check", "--quiet", "--root", str(tmp_path)])
+    result = _run_in_process(capsys, "check", ["--quiet", "--root", str(tmp_path)])
+    output = result.output
 
     assert result.exit_code == 0
-    assert "Success! No violations found." not in result.output
-    assert "Meminit Compliance Check" not in result.output
+    assert "Success! No violations found." not in output
+    assert "Meminit Compliance Check" not in output
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
-def test_cli_check_violations_text(mock_use_case):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=False,
-        files_checked=1,
-        files_passed=0,
-        files_failed=1,
-        violations=[
-            {
-                "path": "docs/bad.md",
-                "violations": [
-                    {"code": "TEST_RULE", "message": "Bad Thing", "line": 1}
-                ],
-            }
-        ],
-        warnings=[],
-        checked_paths=["docs/bad.md"],
-        violations_count=1,
-    )
+@pytest.mark.parametrize(
+    ("format_args", "expected", "unexpected"),
+    [
+        (
+            [],
+            ["docs/bad.md", "TEST_RULE", "Found 1 violations across 1 checked files."],
+            ["Severity.ERROR"],
+        ),
+        (
+            ["--format", "md"],
+            ["# Meminit Compliance Check", "## Findings", "TEST_RULE", "docs/bad.md"],
+            [],
+        ),
+    ],
+    ids=["text", "md"],
+)
+def test_cli_check_violations_rendered(mock_check, capsys, format_args, expected, unexpected):
+    mock_check.result = _VIOLATION_SINGLE
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["check"])
+    result = _run_in_process(capsys, "check", format_args)
+    output = result.output
 
     assert result.exit_code == 1
-    assert "docs/bad.md" in result.output
-    assert "TEST_RULE" in result.output
-    assert "Found 1 violations across 1 checked files." in result.output
-    assert "Severity.ERROR" not in result.output
+    _assert_all_in(output, expected)
+    _assert_none_in(output, unexpected)
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
-def test_cli_check_violations_json(mock_use_case):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=False,
-        files_checked=1,
-        files_passed=0,
-        files_failed=1,
-        violations=[
-            {
-                "path": "docs/bad.md",
-                "violations": [
-                    {"code": "TEST_RULE", "message": "Bad Thing", "line": 1}
-                ],
-            }
-        ],
-        warnings=[],
-        checked_paths=["docs/bad.md"],
-        violations_count=1,
-    )
+def test_cli_check_violations_json(mock_check, runner_no_mixed_stderr):
+    mock_check.result = _VIOLATION_SINGLE
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["check", "--format", "json"])
+    result = _invoke(runner_no_mixed_stderr, "check", ["--format", "json"])
+    output = result.output
 
     assert result.exit_code == 1
     try:
-        data = json.loads(result.output.strip().splitlines()[-1])
+        data = parse_last_json_line(output)
     except json.JSONDecodeError:
-        pytest.fail(f"Output is not valid JSON: {result.output}")
+        pytest.fail(f"Output is not valid JSON: {output}")
 
     assert data["success"] is False
     assert data["output_schema_version"] == "3.0"
@@ -201,32 +426,17 @@ def test_cli_check_violations_json(mock_use_case):
     assert data["violations"][0]["violations"][0]["code"] == "TEST_RULE"
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
 def test_cli_check_json_output_write_failure_returns_json_error(
-    mock_use_case, tmp_path
+    mock_check, tmp_path, tmp_config, runner_no_mixed_stderr
 ):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=True,
-        files_checked=0,
-        files_passed=0,
-        files_failed=0,
-        violations=[],
-        warnings=[],
-        checked_paths=[],
-    )
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: Test\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+    mock_check.result = _EMPTY_CLEAN
     output_dir = tmp_path / "outdir"
     output_dir.mkdir()
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "check",
         [
-            "check",
             "--root",
             str(tmp_path),
             "--format",
@@ -237,39 +447,22 @@ def test_cli_check_json_output_write_failure_returns_json_error(
     )
 
     assert result.exit_code == getattr(os, "EX_CANTCREAT", 73)
-    payload = json.loads(result.output.strip().splitlines()[-1])
-    assert payload["success"] is False
-    assert payload["output_schema_version"] == "3.0"
-    assert payload["error"]["code"] == ErrorCode.UNKNOWN_ERROR.value
+    payload = parse_last_json_line(result.output)
+    _assert_error_envelope(payload, ErrorCode.UNKNOWN_ERROR.value)
     assert payload["error"]["details"]["output_path"] == str(output_dir)
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
 def test_cli_check_json_output_write_failure_preserves_correlation_id(
-    mock_use_case, tmp_path
+    mock_check, tmp_path, tmp_config, runner_no_mixed_stderr
 ):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=True,
-        files_checked=0,
-        files_passed=0,
-        files_failed=0,
-        violations=[],
-        warnings=[],
-        checked_paths=[],
-    )
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: Test\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+    mock_check.result = _EMPTY_CLEAN
     output_dir = tmp_path / "outdir"
     output_dir.mkdir()
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "check",
         [
-            "check",
             "--root",
             str(tmp_path),
             "--format",
@@ -282,35 +475,20 @@ def test_cli_check_json_output_write_failure_preserves_correlation_id(
     )
 
     assert result.exit_code == getattr(os, "EX_CANTCREAT", 73)
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     assert payload["correlation_id"] == "write-fail-trace"
-    assert payload["error"]["code"] == ErrorCode.UNKNOWN_ERROR.value
+    _assert_error_envelope(payload, ErrorCode.UNKNOWN_ERROR.value)
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
-def test_cli_check_json_unsafe_output_path_returns_json_error(mock_use_case, tmp_path):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=True,
-        files_checked=0,
-        files_passed=0,
-        files_failed=0,
-        violations=[],
-        warnings=[],
-        checked_paths=[],
-        warnings_count=0,
-        violations_count=0,
-    )
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: Test\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+def test_cli_check_json_unsafe_output_path_returns_json_error(
+    mock_check, tmp_path, tmp_config, runner_no_mixed_stderr
+):
+    mock_check.result = _EMPTY_CLEAN
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "check",
         [
-            "check",
             "--root",
             str(tmp_path),
             "--format",
@@ -321,39 +499,20 @@ def test_cli_check_json_unsafe_output_path_returns_json_error(mock_use_case, tmp
     )
 
     assert result.exit_code == getattr(os, "EX_NOPERM", 77)
-    payload = json.loads(result.output.strip().splitlines()[-1])
-    assert payload["success"] is False
-    assert payload["output_schema_version"] == "3.0"
-    assert payload["error"]["code"] == ErrorCode.PATH_ESCAPE.value
+    payload = parse_last_json_line(result.output)
+    _assert_error_envelope(payload, ErrorCode.PATH_ESCAPE.value)
     assert payload["error"]["details"]["output_path"] == "/etc/report.json"
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
 def test_cli_check_json_unsafe_output_path_preserves_correlation_id(
-    mock_use_case, tmp_path
+    mock_check, tmp_path, tmp_config, runner_no_mixed_stderr
 ):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=True,
-        files_checked=0,
-        files_passed=0,
-        files_failed=0,
-        violations=[],
-        warnings=[],
-        checked_paths=[],
-        warnings_count=0,
-        violations_count=0,
-    )
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: Test\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+    mock_check.result = _EMPTY_CLEAN
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "check",
         [
-            "check",
             "--root",
             str(tmp_path),
             "--format",
@@ -366,20 +525,19 @@ def test_cli_check_json_unsafe_output_path_preserves_correlation_id(
     )
 
     assert result.exit_code == getattr(os, "EX_NOPERM", 77)
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     assert payload["correlation_id"] == "unsafe-path-trace"
-    assert payload["error"]["code"] == ErrorCode.PATH_ESCAPE.value
+    _assert_error_envelope(payload, ErrorCode.PATH_ESCAPE.value)
 
 
-def test_cli_new_text_output_invalid_root_writes_error_file(tmp_path):
+def test_cli_new_text_output_invalid_root_writes_error_file(tmp_path, runner_no_mixed_stderr):
     output_path = tmp_path / "new-error.txt"
     missing_root = tmp_path / "does-not-exist"
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "new",
         [
-            "new",
             "ADR",
             "Bad Root",
             "--root",
@@ -399,29 +557,16 @@ def test_cli_new_text_output_invalid_root_writes_error_file(tmp_path):
     assert str(missing_root) in content
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
-def test_cli_check_text_output_writes_file_and_not_stdout(mock_use_case, tmp_path):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=True,
-        files_checked=0,
-        files_passed=0,
-        files_failed=0,
-        violations=[],
-        warnings=[],
-        checked_paths=[],
-    )
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: Test\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+def test_cli_check_text_output_writes_file_and_not_stdout(
+    mock_check, tmp_path, tmp_config, runner_no_mixed_stderr
+):
+    mock_check.result = _EMPTY_CLEAN
     output_path = tmp_path / "check-output.txt"
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "check",
         [
-            "check",
             "--root",
             str(tmp_path),
             "--format",
@@ -430,291 +575,153 @@ def test_cli_check_text_output_writes_file_and_not_stdout(mock_use_case, tmp_pat
             str(output_path),
         ],
     )
+    output = result.output
 
     assert result.exit_code == 0
-    assert "Meminit Compliance Check" not in result.output
-    assert f"Scanning root: {tmp_path}" not in result.output
-    assert "Success! No violations found." not in result.output
+    assert "Meminit Compliance Check" not in output
+    assert f"Scanning root: {tmp_path}" not in output
+    assert "Success! No violations found." not in output
     content = output_path.read_text(encoding="utf-8")
     assert "Meminit Compliance Check" in content
     assert f"Scanning root: {tmp_path}" in content
     assert "Success! No violations found." in content
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
-def test_cli_check_violations_md(mock_use_case):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=False,
-        files_checked=1,
-        files_passed=0,
-        files_failed=1,
-        violations=[
-            {
-                "path": "docs/bad.md",
-                "violations": [
-                    {"code": "TEST_RULE", "message": "Bad Thing", "line": 1}
-                ],
-            }
-        ],
-        warnings=[],
-        checked_paths=["docs/bad.md"],
-        violations_count=1,
-    )
-
-    runner = CliRunner()
-    result = runner.invoke(cli, ["check", "--format", "md"])
-
-    assert result.exit_code == 1
-    assert "# Meminit Compliance Check" in result.output
-    assert "## Findings" in result.output
-    assert "TEST_RULE" in result.output
-    assert "docs/bad.md" in result.output
+def test_cli_check_warnings_non_strict(mock_check, capsys):
+    mock_check.result = _WARNING_SINGLE
 
-
-@patch("meminit.cli.main.CheckRepositoryUseCase")
-def test_cli_check_warnings_non_strict(mock_use_case):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=True,
-        files_checked=1,
-        files_passed=1,
-        files_failed=0,
-        violations=[],
-        warnings=[
-            {
-                "path": "docs/warn.md",
-                "warnings": [
-                    {"code": "WARN_RULE", "message": "Needs attention", "line": 0}
-                ],
-            }
-        ],
-        checked_paths=["docs/warn.md"],
-        warnings_count=1,
-        files_with_warnings=1,
-    )
-
-    runner = CliRunner()
-    result = runner.invoke(cli, ["check"])
+    result = _run_in_process(capsys, "check", [])
+    output = result.output
 
     assert result.exit_code == 0
-    assert "Compliance Warnings" in result.output
-    assert "warning" in result.output.lower()
+    assert "Compliance Warnings" in output
+    assert "warning" in output.lower()
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
-def test_cli_check_warnings_quiet_is_silent(mock_use_case, tmp_path):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=True,
-        files_checked=1,
-        files_passed=1,
-        files_failed=0,
-        violations=[],
-        warnings=[
-            {
-                "path": "docs/warn.md",
-                "warnings": [
-                    {"code": "WARN_RULE", "message": "Needs attention", "line": 0}
-                ],
-            }
-        ],
-        checked_paths=["docs/warn.md"],
-        warnings_count=1,
-        files_with_warnings=1,
-    )
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: Test\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+def test_cli_check_warnings_quiet_is_silent(mock_check, tmp_path, tmp_config, capsys):
+    mock_check.result = _WARNING_SINGLE
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["check", "--quiet", "--root", str(tmp_path)])
+    result = _run_in_process(capsys, "check", ["--quiet", "--root", str(tmp_path)])
 
     assert result.exit_code == 0
-    assert "Compliance Warnings" not in result.output
-    assert "WARN_RULE" not in result.output
-    assert "Found 1 warning" not in result.output
+    _assert_none_in(result.output, ("Compliance Warnings", "WARN_RULE", "Found 1 warning"))
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
-def test_cli_check_quiet_outputs_failures_only(mock_use_case, tmp_path):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=False,
-        files_checked=1,
-        files_passed=0,
-        files_failed=1,
-        violations=[
-            {
-                "path": "docs/bad.md",
-                "violations": [{"code": "ID_REGEX", "message": "Bad ID", "line": 3}],
-            }
-        ],
-        warnings=[
-            {
-                "path": "docs/bad.md",
-                "warnings": [
-                    {"code": "WARN_RULE", "message": "Needs attention", "line": 5}
-                ],
-            }
-        ],
-        checked_paths=["docs/bad.md"],
-        warnings_count=1,
-        violations_count=1,
-    )
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: Test\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+def test_cli_check_quiet_outputs_failures_only(mock_check, tmp_path, tmp_config, capsys):
+    mock_check.result = _VIOLATION_AND_WARNING
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["check", "--quiet", "--root", str(tmp_path)])
+    result = _run_in_process(capsys, "check", ["--quiet", "--root", str(tmp_path)])
+    output = result.output
 
     assert result.exit_code == 1
-    assert "FAIL docs/bad.md" in result.output
-    assert "ID_REGEX" in result.output
-    assert "WARN_RULE" not in result.output
+    assert "FAIL docs/bad.md" in output
+    assert "ID_REGEX" in output
+    assert "WARN_RULE" not in output
 
 
-@patch("meminit.cli.main.CheckRepositoryUseCase")
-def test_cli_check_warnings_strict(mock_use_case):
-    instance = mock_use_case.return_value
-    instance.execute_full_summary.return_value = CheckResult(
-        success=False,
-        files_checked=1,
-        files_passed=0,
-        files_failed=1,
-        violations=[
-            {
-                "path": "docs/warn.md",
-                "violations": [
-                    {"code": "WARN_RULE", "message": "Needs attention", "line": 0}
-                ],
-            }
-        ],
-        warnings=[],
-        checked_paths=["docs/warn.md"],
-        violations_count=1,
-    )
+def test_cli_check_warnings_strict(mock_check, capsys):
+    mock_check.result = _WARNING_AS_VIOLATION
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["check", "--strict"])
+    result = _run_in_process(capsys, "check", ["--strict"])
 
     assert result.exit_code == 1
     assert "Compliance Violations" in result.output
 
 
-def test_cli_scan_invalid_root_json_contract(tmp_path):
-    runner = CliRunner()
+def test_cli_scan_invalid_root_json_contract(tmp_path, runner):
     missing = tmp_path / "does-not-exist"
-    result = runner.invoke(cli, ["scan", "--format", "json", "--root", str(missing)])
+    result = _invoke(runner, "scan", ["--format", "json", "--root", str(missing)])
 
     assert result.exit_code == getattr(os, "EX_NOINPUT", 66)
     data = json.loads(result.output)
-    assert data["success"] is False
-    assert data["error"]["code"] == "INVALID_ROOT_PATH"
-    assert data["output_schema_version"] == "3.0"
-
+    _assert_error_envelope(data, "INVALID_ROOT_PATH")
 
-@patch("meminit.cli.main.InstallPrecommitUseCase")
-def test_cli_install_precommit_md_output(mock_use_case, tmp_path):
-    instance = mock_use_case.return_value
-    report = MagicMock()
-    report.status = "created"
-    report.config_path = tmp_path / ".git" / "hooks" / "pre-commit"
-    instance.execute.return_value = report
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli, ["install-precommit", "--root", str(tmp_path), "--format", "md"]
+def test_cli_install_precommit_md_output(monkeypatch, tmp_path, runner):
+    report = SimpleNamespace(
+        status="created", config_path=tmp_path / ".git" / "hooks" / "pre-commit"
     )
+    _stub_use_case(monkeypatch, "InstallPrecommitUseCase", report)
+
+    result = _invoke(runner, "install-precommit", ["--root", str(tmp_path), "--format", "md"])
+    output = result.output
 
     assert result.exit_code == 0
-    assert "# Meminit Install Precommit" in result.output
-    assert "Hook path" in result.output
+    assert "# Meminit Install Precommit" in output
+    assert "Hook path" in output
+
+
+def _make_scan_report(**overrides) -> SimpleNamespace:
+    """Scan report with ambiguous types and one configured namespace; ``overrides`` win."""
+    fields = {
+        "docs_root": "docs",
+        "markdown_count": 42,
+        "governed_markdown_count": 84,
+        "suggested_type_directories": {"ADR": "45-adr"},
+        "ambiguous_types": {"PLAN": ["05-planning", "planning"]},
+        "suggested_namespaces": [
+            {"name": "core", "docs_root": "docs", "repo_prefix_suggestion": "EXAMPLE"}
+        ],
+        "configured_namespaces": [
+            {
+                "namespace": "repo",
+                "docs_root": "docs",
+                "repo_prefix": "EXAMPLE",
+                "docs_root_exists": True,
+                "governed_markdown_count": 42,
+            }
+        ],
+        "overlapping_namespaces": [],
+        "notes": [],
+        "as_dict": lambda: {"docs_root": "docs"},
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
 
 
-@patch("meminit.cli.main.ScanRepositoryUseCase")
-def test_cli_scan_text_does_not_crash_on_ambiguous_types(mock_use_case, tmp_path):
+def test_cli_scan_text_does_not_crash_on_ambiguous_types(monkeypatch, tmp_path, runner):
     # Regression: text scan previously crashed with UnboundLocalError when ambiguous types existed.
-    instance = mock_use_case.return_value
-    report = MagicMock()
-    report.docs_root = "docs"
-    report.markdown_count = 42
-    report.governed_markdown_count = 84
-    report.suggested_type_directories = {"ADR": "45-adr"}
-    report.ambiguous_types = {"PLAN": ["05-planning", "planning"]}
-    report.suggested_namespaces = [
-        {"name": "core", "docs_root": "docs", "repo_prefix_suggestion": "EXAMPLE"}
-    ]
-    report.configured_namespaces = [
-        {
-            "namespace": "repo",
-            "docs_root": "docs",
-            "repo_prefix": "EXAMPLE",
-            "docs_root_exists": True,
-            "governed_markdown_count": 42,
-        }
-    ]
-    report.overlapping_namespaces = []
-    report.notes = ["hello", "world"]
-    report.as_dict.return_value = {"docs_root": "docs"}
-    instance.execute.return_value = report
+    report = _make_scan_report(notes=["hello", "world"])
+    _stub_use_case(monkeypatch, "ScanRepositoryUseCase", report)
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["scan", "--format", "text", "--root", str(tmp_path)])
+    result = _invoke(runner, "scan", ["--format", "text", "--root", str(tmp_path)])
+    output = result.output
 
     assert result.exit_code == 0
-    assert "Meminit Scan" in result.output
-    assert "Ambiguous" in result.output
-
-
-@patch("meminit.cli.main.ScanRepositoryUseCase")
-def test_cli_scan_md_includes_ambiguous_types_and_namespaces(mock_use_case, tmp_path):
-    instance = mock_use_case.return_value
-    report = MagicMock()
-    report.docs_root = "docs"
-    report.markdown_count = 42
-    report.governed_markdown_count = 84
-    report.suggested_type_directories = {"ADR": "45-adr"}
-    report.ambiguous_types = {"PLAN": ["05-planning", "planning"]}
-    report.suggested_namespaces = [
-        {"name": "core", "docs_root": "docs", "repo_prefix_suggestion": "EXAMPLE"}
-    ]
-    report.configured_namespaces = [
-        {
-            "namespace": "repo",
-            "docs_root": "docs",
-            "repo_prefix": "EXAMPLE",
-            "docs_root_exists": True,
-            "governed_markdown_count": 42,
-        }
-    ]
-    report.overlapping_namespaces = [
-        {
-            "parent_namespace": "repo",
-            "parent_docs_root": "docs",
-            "child_namespace": "org",
-            "child_docs_root": "docs/00-governance/org",
-        }
-    ]
-    report.notes = ["note 1"]
-    report.as_dict.return_value = {"docs_root": "docs"}
-    instance.execute.return_value = report
+    assert "Meminit Scan" in output
+    assert "Ambiguous" in output
+
+
+def test_cli_scan_md_includes_ambiguous_types_and_namespaces(monkeypatch, tmp_path, runner):
+    report = _make_scan_report(
+        overlapping_namespaces=[
+            {
+                "parent_namespace": "repo",
+                "parent_docs_root": "docs",
+                "child_namespace": "org",
+                "child_docs_root": "docs/00-governance/org",
+            }
+        ],
+        notes=["note 1"],
+    )
+    _stub_use_case(monkeypatch, "ScanRepositoryUseCase", report)
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["scan", "--format", "md", "--root", str(tmp_path)])
+    result = _invoke(runner, "scan", ["--format", "md", "--root", str(tmp_path)])
 
     assert result.exit_code == 0
-    assert "# Meminit Scan" in result.output
-    assert "## Configured Namespaces" in result.output
-    assert "## Ambiguous Types" in result.output
-    assert "## Suggested Namespaces" in result.output
-    assert "## Overlapping Namespace Roots" in result.output
+    _assert_all_in(
+        result.output,
+        (
+            "# Meminit Scan",
+            "## Configured Namespaces",
+            "## Ambiguous Types",
+            "## Suggested Namespaces",
+            "## Overlapping Namespace Roots",
+        ),
+    )
 
 
-def test_cli_context_json_output(tmp_path):
+def test_cli_context_json_output(tmp_path, runner):
     (tmp_path / "docops.config.yaml").write_text(
         "project_name: TestProject\n"
         "repo_prefix: TEST\n"
@@ -723,65 +730,48 @@ def test_cli_context_json_output(tmp_path):
         encoding="utf-8",
     )
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli, ["context", "--root", str(tmp_path), "--format", "json"]
-    )
+    result = _invoke(runner, "context", ["--root", str(tmp_path), "--format", "json"])
 
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["output_schema_version"] == "3.0"
-    assert data["success"] is True
+    data = assert_json_envelope(result, output_schema_version="3.0", success=True)
     assert data["data"]["project_name"] == "TestProject"
     assert data["data"]["default_owner"] == "TeamA"
 
 
-def test_cli_context_deep_counts_documents(tmp_path):
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+def test_cli_context_deep_counts_documents(tmp_path, runner):
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
     docs_dir = tmp_path / "docs" / "00-governance"
     docs_dir.mkdir(parents=True)
     (docs_dir / "a.md").write_text("# A\n", encoding="utf-8")
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli,
-        ["context", "--root", str(tmp_path), "--format", "json", "--deep"],
+    result = _invoke(
+        runner,
+        "context",
+        ["--root", str(tmp_path), "--format", "json", "--deep"],
     )
 
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert data["data"]["deep_incomplete"] is False
     namespaces = data["data"]["namespaces"]
     default_ns = next(ns for ns in namespaces if ns.get("name") == "default")
     assert default_ns["document_count"] == 1
 
 
-def test_cli_context_md_output(tmp_path):
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+def test_cli_context_md_output(tmp_path, runner):
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["context", "--root", str(tmp_path), "--format", "md"])
+    result = _invoke(runner, "context", ["--root", str(tmp_path), "--format", "md"])
+    output = result.output
 
     assert result.exit_code == 0
-    assert "# Meminit Context" in result.output
-    assert "- Project: `TestProject`" in result.output
+    assert "# Meminit Context" in output
+    assert "- Project: `TestProject`" in output
 
 
-@patch("meminit.cli.main.ContextRepositoryUseCase")
-def test_cli_context_md_emits_warnings(mock_use_case, tmp_path):
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+def test_cli_context_md_emits_warnings(monkeypatch, tmp_path, runner):
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
 
-    instance = mock_use_case.return_value
-    instance.execute.return_value = SimpleNamespace(
+    report = SimpleNamespace(
         data={
             "project_name": "TestProject",
             "config_path": "docops.config.yaml",
@@ -797,26 +787,20 @@ def test_cli_context_md_emits_warnings(mock_use_case, tmp_path):
             }
         ],
     )
+    _stub_use_case(monkeypatch, "ContextRepositoryUseCase", report)
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli, ["context", "--root", str(tmp_path), "--format", "md", "--deep"]
-    )
+    result = _invoke(runner, "context", ["--root", str(tmp_path), "--format", "md", "--deep"])
+    output = result.output
 
     assert result.exit_code == 0
-    assert "## Warnings" in result.output
-    assert "DEEP_BUDGET_EXCEEDED" in result.output
+    assert "## Warnings" in output
+    assert "DEEP_BUDGET_EXCEEDED" in output
 
 
-@patch("meminit.cli.main.ContextRepositoryUseCase")
-def test_cli_context_text_emits_warnings(mock_use_case, tmp_path):
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+def test_cli_context_text_emits_warnings(monkeypatch, tmp_path, runner):
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
 
-    instance = mock_use_case.return_value
-    instance.execute.return_value = SimpleNamespace(
+    report = SimpleNamespace(
         data={
             "project_name": "TestProject",
             "config_path": "docops.config.yaml",
@@ -832,16 +816,17 @@ def test_cli_context_text_emits_warnings(mock_use_case, tmp_path):
             }
         ],
     )
+    _stub_use_case(monkeypatch, "ContextRepositoryUseCase", report)
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["context", "--root", str(tmp_path), "--deep"])
+    result = _invoke(runner, "context", ["--root", str(tmp_path), "--deep"])
+    output = result.output
 
     assert result.exit_code == 0
-    assert "Warnings:" in result.output
-    assert "DEEP_BUDGET_EXCEEDED" in result.output
+    assert "Warnings:" in output
+    assert "DEEP_BUDGET_EXCEEDED" in output
 
 
-def test_cli_index_json_contract(tmp_path):
+def test_cli_index_json_contract(tmp_path, runner_no_mixed_stderr):
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
     (docs_dir / "adr-001.md").write_text(
@@ -859,8 +844,7 @@ def test_cli_index_json_contract(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["index", "--root", str(tmp_path), "--format", "json"])
+    result = _invoke(runner_no_mixed_stderr, "index", ["--root", str(tmp_path), "--format", "json"])
     assert result.exit_code == 0
     data = json.loads(result.output)
     assert data["output_schema_version"] == "3.0"
@@ -872,7 +856,7 @@ def test_cli_index_json_contract(tmp_path):
 
 
 @pytest.mark.parametrize("flag", ["--no-cache", "--rebuild-cache"])
-def test_cli_index_cache_flags_clear_existing_cache(tmp_path, flag):
+def test_cli_index_cache_flags_clear_existing_cache(tmp_path, flag, runner_no_mixed_stderr):
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
     (docs_dir / "adr-001.md").write_text(
@@ -900,9 +884,8 @@ def test_cli_index_cache_flags_clear_existing_cache(tmp_path, flag):
         "{}", encoding="utf-8"
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli, ["index", "--root", str(tmp_path), flag, "--format", "json"]
+    result = _invoke(
+        runner_no_mixed_stderr, "index", ["--root", str(tmp_path), flag, "--format", "json"]
     )
 
     assert result.exit_code == 0
@@ -917,7 +900,7 @@ def test_cli_index_cache_flags_clear_existing_cache(tmp_path, flag):
     assert data["command"] == "index"
 
 
-def test_cli_index_rejects_both_cache_clearing_flags(tmp_path):
+def test_cli_index_rejects_both_cache_clearing_flags(tmp_path, runner_no_mixed_stderr):
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
     (docs_dir / "adr-001.md").write_text(
@@ -942,11 +925,10 @@ def test_cli_index_rejects_both_cache_clearing_flags(tmp_path):
         '{"manifest_schema_version":"1.0"}', encoding="utf-8"
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "index",
         [
-            "index",
             "--root",
             str(tmp_path),
             "--no-cache",
@@ -958,13 +940,15 @@ def test_cli_index_rejects_both_cache_clearing_flags(tmp_path):
 
     assert result.exit_code != 0
     data = json.loads(result.output)
-    assert data["error"]["code"] == "INVALID_FLAG_COMBINATION"
+    _assert_error_envelope(data, "INVALID_FLAG_COMBINATION")
     assert cache_root.exists()
     assert (cache_root / "manifest.json").exists()
 
 
 @pytest.mark.parametrize("flag", ["--no-cache", "--rebuild-cache"])
-def test_cli_index_explain_cache_rejects_cache_clearing_flags(tmp_path, flag):
+def test_cli_index_explain_cache_rejects_cache_clearing_flags(
+    tmp_path, flag, runner_no_mixed_stderr
+):
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
     (docs_dir / "adr-001.md").write_text(
@@ -992,11 +976,10 @@ def test_cli_index_explain_cache_rejects_cache_clearing_flags(tmp_path, flag):
         "{}", encoding="utf-8"
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "index",
         [
-            "index",
             "--root",
             str(tmp_path),
             "--explain-cache",
@@ -1008,12 +991,12 @@ def test_cli_index_explain_cache_rejects_cache_clearing_flags(tmp_path, flag):
 
     assert result.exit_code != 0
     data = json.loads(result.output)
-    assert data["error"]["code"] == "INVALID_FLAG_COMBINATION"
+    _assert_error_envelope(data, "INVALID_FLAG_COMBINATION")
     assert cache_root.exists()
     assert (cache_root / "manifest.json").exists()
 
 
-def test_cli_index_explain_cache_reports_existing_manifest(tmp_path):
+def test_cli_index_explain_cache_reports_existing_manifest(tmp_path, runner_no_mixed_stderr):
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
     (docs_dir / "adr-001.md").write_text(
@@ -1039,11 +1022,10 @@ def test_cli_index_explain_cache_reports_existing_manifest(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "index",
         [
-            "index",
             "--root",
             str(tmp_path),
             "--explain-cache",
@@ -1063,7 +1045,7 @@ def test_cli_index_explain_cache_reports_existing_manifest(tmp_path):
     assert (cache_root / "manifest.json").exists()
 
 
-def test_cli_index_explain_cache_reports_manifest_after_index_run(tmp_path):
+def test_cli_index_explain_cache_reports_manifest_after_index_run(tmp_path, runner_no_mixed_stderr):
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
     (docs_dir / "adr-001.md").write_text(
@@ -1081,14 +1063,13 @@ def test_cli_index_explain_cache_reports_manifest_after_index_run(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
-    index_result = runner.invoke(
-        cli, ["index", "--root", str(tmp_path), "--format", "json"]
+    index_result = _invoke(
+        runner_no_mixed_stderr, "index", ["--root", str(tmp_path), "--format", "json"]
     )
-    explain_result = runner.invoke(
-        cli,
+    explain_result = _invoke(
+        runner_no_mixed_stderr,
+        "index",
         [
-            "index",
             "--root",
             str(tmp_path),
             "--explain-cache",
@@ -1113,7 +1094,7 @@ def test_cli_index_explain_cache_reports_manifest_after_index_run(tmp_path):
     ],
 )
 def test_cli_index_explain_cache_rejects_non_json_formats(
-    tmp_path, format_name, expected_prefix
+    tmp_path, format_name, expected_prefix, runner_no_mixed_stderr
 ):
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
@@ -1132,20 +1113,18 @@ def test_cli_index_explain_cache_rejects_non_json_formats(
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
     args = ["index", "--root", str(tmp_path), "--explain-cache"]
     if format_name != "text":
         args.extend(["--format", format_name])
-    result = runner.invoke(cli, args)
+    result = runner_no_mixed_stderr.invoke(cli, args)
+    output = result.output
 
     assert result.exit_code != 0
-    assert result.output.startswith(expected_prefix)
-    assert "INVALID_FLAG_COMBINATION" in result.output
-    assert "requires --format" in result.output
-    assert "json" in result.output
+    assert output.startswith(expected_prefix)
+    _assert_all_in(output, ("INVALID_FLAG_COMBINATION", "requires --format", "json"))
 
 
-def test_cli_index_json_warnings_schema_validity(tmp_path):
+def test_cli_index_json_warnings_schema_validity(tmp_path, runner_no_mixed_stderr):
     """PRD-007 + v2 Output Contract: Warnings in index --format json must include 'path'."""
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
@@ -1174,8 +1153,7 @@ def test_cli_index_json_warnings_schema_validity(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["index", "--root", str(tmp_path), "--format", "json"])
+    result = _invoke(runner_no_mixed_stderr, "index", ["--root", str(tmp_path), "--format", "json"])
     assert result.exit_code == 0
     data = json.loads(result.output)
     assert data["output_schema_version"] == "3.0"
@@ -1186,7 +1164,7 @@ def test_cli_index_json_warnings_schema_validity(tmp_path):
     assert data["warnings"][0]["path"] == "docs/01-indices/project-state.yaml"
 
 
-def test_cli_index_advice_in_json(tmp_path):
+def test_cli_index_advice_in_json(tmp_path, runner_no_mixed_stderr):
     """Asymmetric related_ids produces advice in JSON envelope."""
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
@@ -1221,8 +1199,7 @@ def test_cli_index_advice_in_json(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["index", "--root", str(tmp_path), "--format", "json"])
+    result = _invoke(runner_no_mixed_stderr, "index", ["--root", str(tmp_path), "--format", "json"])
     assert result.exit_code == 0
     data = json.loads(result.output)
     assert len(data["advice"]) >= 1
@@ -1230,7 +1207,7 @@ def test_cli_index_advice_in_json(tmp_path):
     assert "GRAPH_RELATED_ID_ASYMMETRY" in advice_codes
 
 
-def test_cli_index_fatal_duplicate_id_json(tmp_path):
+def test_cli_index_fatal_duplicate_id_json(tmp_path, runner_no_mixed_stderr):
     """Duplicate document_id surfaces as violation in JSON envelope."""
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
@@ -1250,18 +1227,17 @@ def test_cli_index_fatal_duplicate_id_json(tmp_path):
     (docs_dir / "adr-001.md").write_text(fm, encoding="utf-8")
     (docs_dir / "adr-dup.md").write_text(fm, encoding="utf-8")
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["index", "--root", str(tmp_path), "--format", "json"])
+    result = _invoke(runner_no_mixed_stderr, "index", ["--root", str(tmp_path), "--format", "json"])
     assert result.exit_code != 0
     data = json.loads(result.output)
     assert data["success"] is False
     assert len(data["violations"]) >= 1
     violation_codes = [v["code"] for v in data["violations"]]
     assert "GRAPH_DUPLICATE_DOCUMENT_ID" in violation_codes
-    assert data["error"]["code"] == "GRAPH_DUPLICATE_DOCUMENT_ID"
+    _assert_error_envelope(data, "GRAPH_DUPLICATE_DOCUMENT_ID")
 
 
-def test_cli_index_fatal_supersession_cycle_json(tmp_path):
+def test_cli_index_fatal_supersession_cycle_json(tmp_path, runner_no_mixed_stderr):
     """Supersession cycle surfaces as violation in JSON envelope."""
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
@@ -1296,18 +1272,17 @@ def test_cli_index_fatal_supersession_cycle_json(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["index", "--root", str(tmp_path), "--format", "json"])
+    result = _invoke(runner_no_mixed_stderr, "index", ["--root", str(tmp_path), "--format", "json"])
     assert result.exit_code != 0
     data = json.loads(result.output)
     assert data["success"] is False
     assert len(data["violations"]) >= 1
     violation_codes = [v["code"] for v in data["violations"]]
     assert "GRAPH_SUPERSESSION_CYCLE" in violation_codes
-    assert data["error"]["code"] == "GRAPH_SUPERSESSION_CYCLE"
+    _assert_error_envelope(data, "GRAPH_SUPERSESSION_CYCLE")
 
 
-def test_cli_index_unfiltered_preserves_dangling_edges(tmp_path):
+def test_cli_index_unfiltered_preserves_dangling_edges(tmp_path, runner_no_mixed_stderr):
     """Unfiltered index must preserve dangling edges (e.g. related_ids to non-existent doc)."""
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
@@ -1328,8 +1303,7 @@ def test_cli_index_unfiltered_preserves_dangling_edges(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["index", "--root", str(tmp_path), "--format", "json"])
+    result = _invoke(runner_no_mixed_stderr, "index", ["--root", str(tmp_path), "--format", "json"])
     assert result.exit_code == 0
     data = json.loads(result.output)
     # The dangling edge must be present in stdout JSON (unfiltered path).
@@ -1340,7 +1314,7 @@ def test_cli_index_unfiltered_preserves_dangling_edges(tmp_path):
     assert "GRAPH_DANGLING_RELATED_ID" in warning_codes
 
 
-def test_cli_index_non_graph_error_text_output(tmp_path):
+def test_cli_index_non_graph_error_text_output(tmp_path, runner_no_mixed_stderr):
     """Non-graph MeminitError (e.g. invalid filter) is formatted by command_output_handler in text mode."""
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
@@ -1359,15 +1333,16 @@ def test_cli_index_non_graph_error_text_output(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
     # Use an invalid filter value to trigger E_INVALID_FILTER_VALUE MeminitError.
-    result = runner.invoke(cli, ["index", "--status", "BogusStatus", "--root", str(tmp_path)])
+    result = _invoke(
+        runner_no_mixed_stderr, "index", ["--status", "BogusStatus", "--root", str(tmp_path)]
+    )
     assert result.exit_code != 0
     # Text mode should show the error code in the output (not silently exit).
     assert "E_INVALID_FILTER_VALUE" in result.output
 
 
-def test_cli_index_fatal_duplicate_id_text(tmp_path):
+def test_cli_index_fatal_duplicate_id_text(tmp_path, runner_no_mixed_stderr):
     """Graph fatal (duplicate ID) produces visible error in text mode."""
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
@@ -1387,13 +1362,12 @@ def test_cli_index_fatal_duplicate_id_text(tmp_path):
     (docs_dir / "adr-001.md").write_text(fm, encoding="utf-8")
     (docs_dir / "adr-dup.md").write_text(fm, encoding="utf-8")
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["index", "--root", str(tmp_path)])
+    result = _invoke(runner_no_mixed_stderr, "index", ["--root", str(tmp_path)])
     assert result.exit_code != 0
     assert "GRAPH_DUPLICATE_DOCUMENT_ID" in result.output
 
 
-def test_cli_index_fatal_cycle_md(tmp_path):
+def test_cli_index_fatal_cycle_md(tmp_path, runner_no_mixed_stderr):
     """Graph fatal (supersession cycle) produces visible error in md mode."""
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
@@ -1428,13 +1402,12 @@ def test_cli_index_fatal_cycle_md(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["index", "--root", str(tmp_path), "--format", "md"])
+    result = _invoke(runner_no_mixed_stderr, "index", ["--root", str(tmp_path), "--format", "md"])
     assert result.exit_code != 0
     assert "GRAPH_SUPERSESSION_CYCLE" in result.output
 
 
-def test_cli_index_fatal_multiple_violations_text(tmp_path):
+def test_cli_index_fatal_multiple_violations_text(tmp_path, runner_no_mixed_stderr):
     """Multiple graph fatals all surface in text output."""
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
@@ -1470,13 +1443,12 @@ def test_cli_index_fatal_multiple_violations_text(tmp_path):
     (docs_dir / "adr-002.md").write_text(fm_b, encoding="utf-8")
     (docs_dir / "adr-002b.md").write_text(fm_b, encoding="utf-8")
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["index", "--root", str(tmp_path)])
+    result = _invoke(runner_no_mixed_stderr, "index", ["--root", str(tmp_path)])
     assert result.exit_code != 0
     assert result.output.count("GRAPH_DUPLICATE_DOCUMENT_ID") >= 2
 
 
-def test_cli_index_advice_in_text(tmp_path):
+def test_cli_index_advice_in_text(tmp_path, runner_no_mixed_stderr):
     """Asymmetric related_ids produces visible advice in text mode."""
     docs_dir = tmp_path / "docs" / "45-adr"
     docs_dir.mkdir(parents=True)
@@ -1511,72 +1483,37 @@ def test_cli_index_advice_in_text(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["index", "--root", str(tmp_path)])
+    result = _invoke(runner_no_mixed_stderr, "index", ["--root", str(tmp_path)])
     assert result.exit_code == 0
     assert "GRAPH_RELATED_ID_ASYMMETRY" in result.output
 
 
+@pytest.fixture(scope="session")
+def _typed_repo_template(tmp_path_factory):
+    root = tmp_path_factory.mktemp("typed-repo")
+    (root / "docs" / "00-governance" / "templates").mkdir(parents=True)
+    (root / "docops.config.yaml").write_bytes(_TYPED_CONFIG_BYTES)
+    return root
+
+
+@pytest.fixture(scope="session")
+def _adr_template_repo(tmp_path_factory):
+    return _write_adr_template_repo(tmp_path_factory.mktemp("adr-template-repo"))
+
+
 class TestCliNewJsonOutput:
     """Tests for F1: JSON output for meminit new"""
 
     @pytest.fixture
-    def repo_for_new(self, tmp_path):
-        (tmp_path / "docs" / "00-governance" / "templates").mkdir(parents=True)
-        (tmp_path / "docs" / "00-governance" / "templates" / "adr.md").write_text(
-            """<!-- MEMINIT_METADATA_BLOCK -->
-> Metadata goes here
-<!-- END_MEMINIT_METADATA_BLOCK -->
-# ADR
-"""
-        )
-        (tmp_path / "docs" / "00-governance" / "metadata.schema.json").write_text(
-            """
-{
-  "type": "object",
-  "required": ["document_id", "type", "title", "status", "version", "last_updated", "owner", "docops_version"],
-  "properties": {
-    "document_id": { "type": "string" },
-    "type": { "type": "string" },
-    "title": { "type": "string" },
-    "status": { "type": "string" },
-    "version": { "type": "string" },
-    "last_updated": { "type": "string" },
-    "owner": { "type": "string" },
-    "docops_version": { "type": "string" },
-    "area": { "type": "string" },
-    "description": { "type": "string" },
-    "keywords": { "type": "array", "items": { "type": "string" } },
-    "related_ids": { "type": "array", "items": { "type": "string" } },
-    "superseded_by": { "type": "string" }
-  }
-}
-""".strip()
-        )
-        (tmp_path / "docops.config.yaml").write_text(
-            """project_name: TestProject
-repo_prefix: TEST
-docops_version: '2.0'
-schema_path: docs/00-governance/metadata.schema.json
-document_types:
-  ADR:
-    directory: 45-adr
-    template: docs/00-governance/templates/adr.md
-"""
-        )
-        (tmp_path / "docs" / "45-adr").mkdir(parents=True, exist_ok=True)
-        (tmp_path / "docs" / "00-governance" / "metadata.schema.json").touch()
+    def repo_for_new(self, tmp_path, _adr_template_repo):
+        shutil.copytree(_adr_template_repo, tmp_path, dirs_exist_ok=True)
         return tmp_path
 
-    def test_new_format_json_output(self, repo_for_new):
-        runner_kwargs = {}
-        if "mix_stderr" in inspect.signature(CliRunner).parameters:
-            runner_kwargs["mix_stderr"] = False
-        runner = CliRunner(**runner_kwargs)
-        result = runner.invoke(
-            cli,
+    def test_new_format_json_output(self, repo_for_new, runner_no_mixed_stderr):
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "new",
             [
-                "new",
                 "ADR",
                 "Test Decision",
                 "--root",
@@ -1587,9 +1524,7 @@ document_types:
         )
 
         assert result.exit_code == 0
-        lines = result.output.strip().split("\n")
-        json_line = lines[-1]
-        data = json.loads(json_line)
+        data = parse_last_json_line(result.output)
 
         assert data["output_schema_version"] == "3.0"
         assert data["success"] is True
@@ -1602,12 +1537,11 @@ document_types:
         assert "keywords" in data["data"]
         assert "related_ids" in data["data"]
 
-    def test_new_format_json_with_metadata(self, repo_for_new):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_new_format_json_with_metadata(self, repo_for_new, runner):
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "ADR",
                 "Enhanced Decision",
                 "--root",
@@ -1630,9 +1564,7 @@ document_types:
         )
 
         assert result.exit_code == 0
-        lines = result.output.strip().split("\n")
-        json_line = lines[-1]
-        data = json.loads(json_line)
+        data = parse_last_json_line(result.output)
 
         assert data["success"] is True
         assert data["data"]["owner"] == "TestOwner"
@@ -1641,12 +1573,11 @@ document_types:
         assert data["data"]["keywords"] == ["api", "test"]
         assert data["data"]["related_ids"] == ["TEST-PRD-001"]
 
-    def test_new_format_json_error(self, repo_for_new):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_new_format_json_error(self, repo_for_new, runner):
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "UNKNOWN_TYPE",
                 "Test",
                 "--root",
@@ -1657,58 +1588,36 @@ document_types:
         )
 
         assert result.exit_code != 0
-        lines = result.output.strip().split("\n")
-        json_line = lines[-1]
-        data = json.loads(json_line)
+        data = parse_last_json_line(result.output)
 
-        assert data["output_schema_version"] == "3.0"
-        assert data["success"] is False
         assert "error" in data
-        assert data["error"]["code"] == "UNKNOWN_TYPE"
+        _assert_error_envelope(data, "UNKNOWN_TYPE")
 
 
 class TestCliNewListTypes:
     """Tests for F4: Type Discovery"""
 
     @pytest.fixture
-    def repo_with_types(self, tmp_path):
-        (tmp_path / "docs" / "00-governance" / "templates").mkdir(parents=True)
-        (tmp_path / "docops.config.yaml").write_text(
-            """project_name: TestProject
-repo_prefix: TEST
-docops_version: '2.0'
-document_types:
-  ADR:
-    directory: 45-adr
-  PRD:
-    directory: 10-prd
-  FDD:
-    directory: 50-fdd
-"""
-        )
+    def repo_with_types(self, tmp_path, _typed_repo_template):
+        shutil.copytree(_typed_repo_template, tmp_path, dirs_exist_ok=True)
         return tmp_path
 
-    def test_new_list_types_text(self, repo_with_types):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            ["new", "--list-types", "--root", str(repo_with_types)],
-        )
-
+    def test_new_list_types_text(self, repo_with_types, capsys):
+        result = _run_in_process(capsys, "new", ["--list-types", "--root", str(repo_with_types)])
         assert result.exit_code == 0
-        assert "ADR" in result.output
-        assert "PRD" in result.output
-        assert "FDD" in result.output
+        output = result.output
 
-    def test_new_list_types_json(self, repo_with_types):
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
-            cli,
-            ["new", "--list-types", "--root", str(repo_with_types), "--format", "json"],
-        )
+        assert "ADR" in output
+        assert "PRD" in output
+        assert "FDD" in output
 
+    def test_new_list_types_json(self, repo_with_types, capsys):
+        result = _run_in_process(
+            capsys, "new", ["--list-types", "--root", str(repo_with_types), "--format", "json"]
+        )
         assert result.exit_code == 0
-        data = json.loads(result.output.strip().splitlines()[-1])
+
+        data = parse_last_json_line(result.stdout)
 
         assert data["output_schema_version"] == "3.0"
         assert data["success"] is True
@@ -1719,11 +1628,11 @@ document_types:
         assert "PRD" in types_dict
         assert "FDD" in types_dict
 
-    def test_list_types_with_type_arg_errors(self, repo_with_types):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            ["new", "--list-types", "ADR", "Title", "--root", str(repo_with_types)],
+    def test_list_types_with_type_arg_errors(self, repo_with_types, runner):
+        result = _invoke(
+            runner,
+            "new",
+            ["--list-types", "ADR", "Title", "--root", str(repo_with_types)],
         )
 
         assert result.exit_code != 0
@@ -1733,59 +1642,15 @@ class TestCliNewDryRun:
     """Tests for F3: Dry-Run Mode"""
 
     @pytest.fixture
-    def repo_for_dry_run(self, tmp_path):
-        (tmp_path / "docs" / "00-governance" / "templates").mkdir(parents=True)
-        (tmp_path / "docs" / "00-governance" / "templates" / "adr.md").write_text(
-            """<!-- MEMINIT_METADATA_BLOCK -->
-> Metadata goes here
-<!-- END_MEMINIT_METADATA_BLOCK -->
-# ADR
-"""
-        )
-        (tmp_path / "docs" / "00-governance" / "metadata.schema.json").write_text(
-            """
-{
-  "type": "object",
-  "required": ["document_id", "type", "title", "status", "version", "last_updated", "owner", "docops_version"],
-  "properties": {
-    "document_id": { "type": "string" },
-    "type": { "type": "string" },
-    "title": { "type": "string" },
-    "status": { "type": "string" },
-    "version": { "type": "string" },
-    "last_updated": { "type": "string" },
-    "owner": { "type": "string" },
-    "docops_version": { "type": "string" },
-    "area": { "type": "string" },
-    "description": { "type": "string" },
-    "keywords": { "type": "array", "items": { "type": "string" } },
-    "related_ids": { "type": "array", "items": { "type": "string" } },
-    "superseded_by": { "type": "string" }
-  }
-}
-""".strip()
-        )
-        (tmp_path / "docops.config.yaml").write_text(
-            """project_name: TestProject
-repo_prefix: TEST
-docops_version: '2.0'
-schema_path: docs/00-governance/metadata.schema.json
-document_types:
-  ADR:
-    directory: 45-adr
-    template: docs/00-governance/templates/adr.md
-"""
-        )
-        (tmp_path / "docs" / "45-adr").mkdir(parents=True, exist_ok=True)
-        (tmp_path / "docs" / "00-governance" / "metadata.schema.json").touch()
+    def repo_for_dry_run(self, tmp_path, _adr_template_repo):
+        shutil.copytree(_adr_template_repo, tmp_path, dirs_exist_ok=True)
         return tmp_path
 
-    def test_new_dry_run_no_file_created(self, repo_for_dry_run):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_new_dry_run_no_file_created(self, repo_for_dry_run, runner):
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "ADR",
                 "Dry Run Test",
                 "--root",
@@ -1801,12 +1666,11 @@ document_types:
         doc_path = repo_for_dry_run / "docs" / "45-adr" / "adr-001-dry-run-test.md"
         assert not doc_path.exists()
 
-    def test_new_dry_run_json_output(self, repo_for_dry_run):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_new_dry_run_json_output(self, repo_for_dry_run, runner):
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "ADR",
                 "Dry Run JSON",
                 "--root",
@@ -1818,9 +1682,7 @@ document_types:
         )
 
         assert result.exit_code == 0
-        lines = result.output.strip().split("\n")
-        json_line = lines[-1]
-        data = json.loads(json_line)
+        data = parse_last_json_line(result.output)
 
         assert data["output_schema_version"] == "3.0"
         assert data["success"] is True
@@ -1828,12 +1690,11 @@ document_types:
         assert "would_create" in data["data"]
         assert data["data"]["would_create"]["document_id"] == "TEST-ADR-001"
 
-    def test_new_dry_run_with_metadata_preview(self, repo_for_dry_run):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_new_dry_run_with_metadata_preview(self, repo_for_dry_run, runner):
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "ADR",
                 "Dry Run With Metadata",
                 "--root",
@@ -1849,21 +1710,18 @@ document_types:
         )
 
         assert result.exit_code == 0
-        lines = result.output.strip().split("\n")
-        json_line = lines[-1]
-        data = json.loads(json_line)
+        data = parse_last_json_line(result.output)
 
         assert data["data"]["owner"] == "TestOwner"
         assert data["data"]["area"] == "Backend"
 
-    def test_new_dry_run_md_format_writes_output(self, repo_for_dry_run, tmp_path):
+    def test_new_dry_run_md_format_writes_output(self, repo_for_dry_run, tmp_path, runner):
         output_path = tmp_path / "new-md-error.md"
 
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "ADR",
                 "MD Not Supported",
                 "--root",
@@ -1878,53 +1736,26 @@ document_types:
 
         assert result.exit_code == 0
         assert result.output == ""
-        content = output_path.read_text(encoding="utf-8")
-        assert "# Meminit New" in content
-        assert "- Status: dry-run" in content
-        assert "Would Create" in content
+        content = output_path.read_bytes()
+        assert b"# Meminit New" in content
+        assert b"- Status: dry-run" in content
+        assert b"Would Create" in content
 
 
-class TestCliCheckTargeted:
-    """Tests for F10: Targeted Check"""
+@pytest.fixture(scope="session")
+def _check_repo_template(tmp_path_factory):
+    root = tmp_path_factory.mktemp("check-repo")
+    gov = root / "docs" / "00-governance"
+    gov.mkdir(parents=True)
+    (gov / "metadata.schema.json").write_bytes(_METADATA_SCHEMA_BYTES)
 
-    @pytest.fixture
-    def repo_for_targeted_check(self, tmp_path):
-        gov = tmp_path / "docs" / "00-governance"
-        gov.mkdir(parents=True)
-        (gov / "metadata.schema.json").write_text(
-            """
-{
-  "type": "object",
-  "required": ["document_id", "type", "title", "status", "version", "last_updated", "owner", "docops_version"],
-  "properties": {
-    "document_id": { "type": "string" },
-    "type": { "type": "string" },
-    "title": { "type": "string" },
-    "status": { "type": "string" },
-    "version": { "type": "string" },
-    "last_updated": { "type": "string" },
-    "owner": { "type": "string" },
-    "docops_version": { "type": "string" }
-  }
-}
-""".strip()
-        )
+    (root / "docops.config.yaml").write_bytes(_ADR_CONFIG_BYTES)
 
-        (tmp_path / "docops.config.yaml").write_text(
-            """project_name: TestProject
-repo_prefix: TEST
-docops_version: '2.0'
-document_types:
-  ADR:
-    directory: 45-adr
-"""
-        )
+    adr_dir = root / "docs" / "45-adr"
+    adr_dir.mkdir(parents=True)
 
-        adr_dir = tmp_path / "docs" / "45-adr"
-        adr_dir.mkdir(parents=True)
-
-        (adr_dir / "adr-001-valid.md").write_text(
-            """---
+    (adr_dir / "adr-001-valid.md").write_bytes(
+        b"""---
 document_id: TEST-ADR-001
 type: ADR
 title: Valid
@@ -1936,10 +1767,10 @@ docops_version: 2.0
 ---
 # Valid
 """
-        )
+    )
 
-        (adr_dir / "adr-002-invalid.md").write_text(
-            """---
+    (adr_dir / "adr-002-invalid.md").write_bytes(
+        b"""---
 document_id: BAD-ID
 type: ADR
 title: Invalid
@@ -1951,16 +1782,24 @@ docops_version: 2.0
 ---
 # Invalid
 """
-        )
+    )
+
+    return root
 
+
+class TestCliCheckTargeted:
+    """Tests for F10: Targeted Check"""
+
+    @pytest.fixture
+    def repo_for_targeted_check(self, tmp_path, _check_repo_template):
+        shutil.copytree(_check_repo_template, tmp_path, dirs_exist_ok=True)
         return tmp_path
 
-    def test_check_single_file_json(self, repo_for_targeted_check):
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
-            cli,
+    def test_check_single_file_json(self, repo_for_targeted_check, runner_no_mixed_stderr):
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "check",
             [
-                "check",
                 "docs/45-adr/adr-001-valid.md",
                 "--root",
                 str(repo_for_targeted_check),
@@ -1969,25 +1808,24 @@ docops_version: 2.0
             ],
         )
 
-        assert result.exit_code == 0
-        data = json.loads(result.output.strip().splitlines()[-1])
-
-        assert data["output_schema_version"] == "3.0"
-        assert data["success"] is True
-        assert data["files_checked"] == 1
-        assert data["files_passed"] == 1
-        assert data["files_failed"] == 0
-        assert data["missing_paths_count"] == 0
-        assert data["schema_failures_count"] == 0
-        assert data["violations_count"] == 0
-        assert data["warnings_count"] == 0
+        assert_json_envelope(
+            result,
+            output_schema_version="3.0",
+            success=True,
+            files_checked=1,
+            files_passed=1,
+            files_failed=0,
+            missing_paths_count=0,
+            schema_failures_count=0,
+            violations_count=0,
+            warnings_count=0,
+        )
 
-    def test_check_multiple_files_text_summary(self, repo_for_targeted_check):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_check_multiple_files_text_summary(self, repo_for_targeted_check, runner):
+        result = _invoke(
+            runner,
+            "check",
             [
-                "check",
                 "docs/45-adr/*.md",
                 "--root",
                 str(repo_for_targeted_check),
@@ -1995,17 +1833,21 @@ docops_version: 2.0
         )
 
         assert result.exit_code == 1
-        assert "Checking 2 existing files..." in result.output
-        assert "OK docs/45-adr/adr-001-valid.md" in result.output
-        assert "FAIL docs/45-adr/adr-002-invalid.md" in result.output
-        assert "[ID_REGEX]" in result.output
-
-    def test_check_multiple_files_json(self, repo_for_targeted_check):
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
-            cli,
+        _assert_all_in(
+            result.output,
+            (
+                "Checking 2 existing files...",
+                "OK docs/45-adr/adr-001-valid.md",
+                "FAIL docs/45-adr/adr-002-invalid.md",
+                "[ID_REGEX]",
+            ),
+        )
+
+    def test_check_multiple_files_json(self, repo_for_targeted_check, runner_no_mixed_stderr):
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "check",
             [
-                "check",
                 "docs/45-adr/adr-001-valid.md",
                 "docs/45-adr/adr-002-invalid.md",
                 "--root",
@@ -2015,21 +1857,21 @@ docops_version: 2.0
             ],
         )
 
-        assert result.exit_code == 1
-        data = json.loads(result.output.strip().splitlines()[-1])
-
-        assert data["success"] is False
-        assert data["files_checked"] == 2
-        assert data["files_failed"] == 1
+        data = assert_json_envelope(
+            result,
+            exit_code=1,
+            success=False,
+            files_checked=2,
+            files_failed=1,
+        )
         assert data["violations_count"] >= 1
         assert len(data["violations"]) == 1
 
-    def test_check_glob_pattern_json(self, repo_for_targeted_check):
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
-            cli,
+    def test_check_glob_pattern_json(self, repo_for_targeted_check, runner_no_mixed_stderr):
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "check",
             [
-                "check",
                 "docs/45-adr/*.md",
                 "--root",
                 str(repo_for_targeted_check),
@@ -2038,17 +1880,16 @@ docops_version: 2.0
             ],
         )
 
-        data = json.loads(result.output.strip().splitlines()[-1])
+        data = parse_last_json_line(result.output)
         assert data["files_checked"] == 2
         assert data["files_failed"] == 1
         assert data["missing_paths_count"] == 0
 
-    def test_check_directory_target_json(self, repo_for_targeted_check):
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
-            cli,
+    def test_check_directory_target_json(self, repo_for_targeted_check, runner_no_mixed_stderr):
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "check",
             [
-                "check",
                 "docs/45-adr",
                 "--root",
                 str(repo_for_targeted_check),
@@ -2057,14 +1898,18 @@ docops_version: 2.0
             ],
         )
 
-        assert result.exit_code == 1
-        data = json.loads(result.output.strip().splitlines()[-1])
-        assert data["success"] is False
-        assert data["files_checked"] == 2
-        assert data["files_failed"] == 1
-        assert data["missing_paths_count"] == 0
+        assert_json_envelope(
+            result,
+            exit_code=1,
+            success=False,
+            files_checked=2,
+            files_failed=1,
+            missing_paths_count=0,
+        )
 
-    def test_check_recursive_glob_json_honors_exclusions(self, repo_for_targeted_check):
+    def test_check_recursive_glob_json_honors_exclusions(
+        self, repo_for_targeted_check, runner_no_mixed_stderr
+    ):
         templates_dir = repo_for_targeted_check / "docs" / "00-governance" / "templates"
         templates_dir.mkdir(parents=True, exist_ok=True)
         (templates_dir / "bad-template.md").write_text(
@@ -2072,11 +1917,10 @@ docops_version: 2.0
             encoding="utf-8",
         )
 
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
-            cli,
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "check",
             [
-                "check",
                 "docs/**/*.md",
                 "--root",
                 str(repo_for_targeted_check),
@@ -2085,9 +1929,7 @@ docops_version: 2.0
             ],
         )
 
-        assert result.exit_code == 1
-        data = json.loads(result.output.strip().splitlines()[-1])
-        assert data["files_checked"] == 2
+        data = assert_json_envelope(result, exit_code=1, files_checked=2)
         assert all(
             "docs/00-governance/templates" not in entry["path"]
             for entry in data["violations"]
@@ -2097,12 +1939,11 @@ docops_version: 2.0
             for warning in data["warnings"]
         )
 
-    def test_check_file_not_found_json(self, repo_for_targeted_check):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_check_file_not_found_json(self, repo_for_targeted_check, runner):
+        result = _invoke(
+            runner,
+            "check",
             [
-                "check",
                 "docs/45-adr/nonexistent.md",
                 "--root",
                 str(repo_for_targeted_check),
@@ -2112,12 +1953,9 @@ docops_version: 2.0
         )
 
         assert result.exit_code != 0
-        lines = result.output.strip().split("\n")
-        json_line = lines[-1]
-        data = json.loads(json_line)
-        assert data["success"] is False
+        data = parse_last_json_line(result.output)
         assert "error" in data
-        assert data["error"]["code"] == "FILE_NOT_FOUND"
+        _assert_error_envelope(data, "FILE_NOT_FOUND")
 
 
 class TestCliFlagIncompatibilities:
@@ -2126,23 +1964,14 @@ class TestCliFlagIncompatibilities:
     @pytest.fixture
     def repo_for_flags(self, tmp_path):
         (tmp_path / "docs" / "00-governance" / "templates").mkdir(parents=True)
-        (tmp_path / "docops.config.yaml").write_text(
-            """project_name: TestProject
-repo_prefix: TEST
-docops_version: '2.0'
-document_types:
-  ADR:
-    directory: 45-adr
-"""
-        )
+        (tmp_path / "docops.config.yaml").write_bytes(_ADR_CONFIG_BYTES)
         return tmp_path
 
-    def test_interactive_and_json_incompatible(self, repo_for_flags):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_interactive_and_json_incompatible(self, repo_for_flags, runner):
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "ADR",
                 "Test",
                 "--root",
@@ -2155,14 +1984,13 @@ document_types:
 
         assert result.exit_code != 0
         data = json.loads(result.output)
-        assert data["error"]["code"] == "INVALID_FLAG_COMBINATION"
+        _assert_error_envelope(data, "INVALID_FLAG_COMBINATION")
 
-    def test_edit_and_dry_run_incompatible(self, repo_for_flags):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_edit_and_dry_run_incompatible(self, repo_for_flags, runner):
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "ADR",
                 "Test",
                 "--root",
@@ -2176,14 +2004,13 @@ document_types:
 
         assert result.exit_code != 0
         data = json.loads(result.output)
-        assert data["error"]["code"] == "INVALID_FLAG_COMBINATION"
+        _assert_error_envelope(data, "INVALID_FLAG_COMBINATION")
 
-    def test_edit_and_json_incompatible(self, repo_for_flags):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_edit_and_json_incompatible(self, repo_for_flags, runner):
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "ADR",
                 "Test",
                 "--root",
@@ -2196,14 +2023,13 @@ document_types:
 
         assert result.exit_code != 0
         data = json.loads(result.output)
-        assert data["error"]["code"] == "INVALID_FLAG_COMBINATION"
+        _assert_error_envelope(data, "INVALID_FLAG_COMBINATION")
 
-    def test_list_types_with_positional_args_incompatible(self, repo_for_flags):
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_list_types_with_positional_args_incompatible(self, repo_for_flags, runner):
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "--list-types",
                 "ADR",
                 "Test",
@@ -2216,20 +2042,14 @@ document_types:
 
         assert result.exit_code != 0
         data = json.loads(result.output)
-        assert data["error"]["code"] == "INVALID_FLAG_COMBINATION"
+        _assert_error_envelope(data, "INVALID_FLAG_COMBINATION")
 
-    def test_invalid_flag_incompatibility_works_without_os_ex_constants(
-        self, repo_for_flags, monkeypatch
-    ):
-        monkeypatch.delattr(os, "EX_USAGE", raising=False)
-        monkeypatch.delattr(os, "EX_DATAERR", raising=False)
-        monkeypatch.delattr(os, "EX_CANTCREAT", raising=False)
-
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+    def test_invalid_flag_incompatibility_exits_with_usage_code(self, repo_for_flags, runner):
+        # The sysexits fallback for platforms without os.EX_* is covered in test_exit_codes.
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "--list-types",
                 "ADR",
                 "Test",
@@ -2242,23 +2062,14 @@ document_types:
 
         assert result.exit_code == 64
         data = json.loads(result.output)
-        assert data["error"]["code"] == "INVALID_FLAG_COMBINATION"
+        _assert_error_envelope(data, "INVALID_FLAG_COMBINATION")
 
 
-@patch("subprocess.run")
-@patch("meminit.cli.main.NewDocumentUseCase")
-def test_new_edit_parses_editor_command_with_args(
-    mock_new_document_use_case,
-    mock_subprocess_run,
-    tmp_path,
-    monkeypatch,
-):
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: Test\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
+def test_new_edit_parses_editor_command_with_args(tmp_path, tmp_config, monkeypatch, runner):
     result_path = tmp_path / "docs" / "45-adr" / "adr-001-test.md"
-    mock_new_document_use_case.return_value.execute_with_params.return_value = (
+    _stub_use_case(
+        monkeypatch,
+        "NewDocumentUseCase",
         NewDocumentResult(
             success=True,
             path=result_path,
@@ -2270,87 +2081,38 @@ def test_new_edit_parses_editor_command_with_args(
             owner="TestOwner",
             last_updated="2026-02-19",
             docops_version="2.0",
-        )
+        ),
+    )
+    editor_calls = []
+    monkeypatch.setattr(
+        "subprocess.run", lambda *args, **kwargs: editor_calls.append((args, kwargs))
     )
-    monkeypatch.setenv("EDITOR", "code --wait")
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli,
-        ["new", "ADR", "Test", "--root", str(tmp_path), "--edit"],
+    result = _invoke(
+        runner,
+        "new",
+        ["ADR", "Test", "--root", str(tmp_path), "--edit"],
+        env={"EDITOR": "code --wait"},
     )
 
     assert result.exit_code == 0
-    mock_subprocess_run.assert_called_once_with(
-        ["code", "--wait", str(result_path)],
-        check=False,
-    )
+    assert editor_calls == [((["code", "--wait", str(result_path)],), {"check": False})]
 
 
 class TestCliJsonOutputFormat:
     """Tests for F1.2: JSON output must be single-line."""
 
     @pytest.fixture
-    def repo_for_json_check(self, tmp_path):
-        gov = tmp_path / "docs" / "00-governance"
-        gov.mkdir(parents=True)
-        (gov / "metadata.schema.json").write_text(
-            """
-{
-  "type": "object",
-  "required": ["document_id", "type", "title", "status", "version", "last_updated", "owner", "docops_version"],
-  "properties": {
-    "document_id": { "type": "string" },
-    "type": { "type": "string" },
-    "title": { "type": "string" },
-    "status": { "type": "string" },
-    "version": { "type": "string" },
-    "last_updated": { "type": "string" },
-    "owner": { "type": "string" },
-    "docops_version": { "type": "string" }
-  }
-}
-""".strip()
-        )
-
-        (tmp_path / "docops.config.yaml").write_text(
-            """project_name: TestProject
-repo_prefix: TEST
-docops_version: '2.0'
-document_types:
-  ADR:
-    directory: 45-adr
-"""
-        )
-
-        adr_dir = tmp_path / "docs" / "45-adr"
-        adr_dir.mkdir(parents=True)
-
-        (adr_dir / "adr-001-valid.md").write_text(
-            """---
-document_id: TEST-ADR-001
-type: ADR
-title: Valid
-status: Draft
-version: 0.1
-last_updated: 2025-01-01
-owner: TestOwner
-docops_version: 2.0
----
-# Valid
-"""
-        )
-        (tmp_path / "docs" / "00-governance" / "metadata.schema.json").touch()
-
+    def repo_for_json_check(self, tmp_path, _check_repo_template):
+        shutil.copytree(_check_repo_template, tmp_path, dirs_exist_ok=True)
         return tmp_path
 
-    def test_json_output_is_single_line(self, repo_for_json_check):
+    def test_json_output_is_single_line(self, repo_for_json_check, runner_no_mixed_stderr):
         """Per F1.2, JSON output must be single-line."""
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
-            cli,
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "check",
             [
-                "check",
                 "docs/45-adr/adr-001-valid.md",
                 "--root",
                 str(repo_for_json_check),
@@ -2360,16 +2122,15 @@ docops_version: 2.0
         )
 
         assert result.exit_code == 0
-        json_line = result.output.strip().splitlines()[-1]
+        json_line = last_line(result.output)
         assert "\n" not in json_line
 
-    def test_json_output_error_is_single_line(self, repo_for_json_check):
+    def test_json_output_error_is_single_line(self, repo_for_json_check, runner_no_mixed_stderr):
         """Per F1.2, JSON error output must be single-line."""
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
-            cli,
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "check",
             [
-                "check",
                 "docs/45-adr/nonexistent.md",
                 "--root",
                 str(repo_for_json_check),
@@ -2378,7 +2139,7 @@ docops_version: 2.0
             ],
         )
 
-        json_line = result.output.strip().splitlines()[-1]
+        json_line = last_line(result.output)
         assert "\n" not in json_line
 
 
@@ -2386,50 +2147,15 @@ class TestCliSinglePathNotFound:
     """Tests for F10.6: Single missing path should return error envelope."""
 
     @pytest.fixture
-    def repo_for_single_path_check(self, tmp_path):
-        gov = tmp_path / "docs" / "00-governance"
-        gov.mkdir(parents=True)
-        (gov / "metadata.schema.json").write_text(
-            """
-{
-  "type": "object",
-  "required": ["document_id", "type", "title", "status", "version", "last_updated", "owner", "docops_version"],
-  "properties": {
-    "document_id": { "type": "string" },
-    "type": { "type": "string" },
-    "title": { "type": "string" },
-    "status": { "type": "string" },
-    "version": { "type": "string" },
-    "last_updated": { "type": "string" },
-    "owner": { "type": "string" },
-    "docops_version": { "type": "string" }
-  }
-}
-""".strip()
-        )
-
-        (tmp_path / "docops.config.yaml").write_text(
-            """project_name: TestProject
-repo_prefix: TEST
-docops_version: '2.0'
-document_types:
-  ADR:
-    directory: 45-adr
-"""
-        )
-
-        adr_dir = tmp_path / "docs" / "45-adr"
-        adr_dir.mkdir(parents=True)
-        (tmp_path / "docs" / "00-governance" / "metadata.schema.json").touch()
-
+    def repo_for_single_path_check(self, tmp_path, _check_repo_template):
+        shutil.copytree(_check_repo_template, tmp_path, dirs_exist_ok=True)
         return tmp_path
 
     def test_single_path_not_found_returns_error_envelope(
-        self, repo_for_single_path_check
+        self, repo_for_single_path_check, runner_no_mixed_stderr
     ):
         """F10.6: Single missing path should return error envelope."""
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
+        result = runner_no_mixed_stderr.invoke(
             cli,
             [
                 "--verbose",
@@ -2443,16 +2169,14 @@ document_types:
         )
 
         assert result.exit_code != 0
-        data = json.loads(result.output.strip().splitlines()[-1])
-        assert data["success"] is False
+        data = parse_last_json_line(result.output)
         assert "error" in data
-        assert data["error"]["code"] == "FILE_NOT_FOUND"
+        _assert_error_envelope(data, "FILE_NOT_FOUND")
 
     def test_single_path_not_found_logs_failed_operation(
-        self, repo_for_single_path_check
+        self, repo_for_single_path_check, runner_no_mixed_stderr
     ):
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
+        result = runner_no_mixed_stderr.invoke(
             cli,
             [
                 "--verbose",
@@ -2480,53 +2204,18 @@ class TestCliAbsolutePathEscape:
     """Tests for F10.4: Absolute paths outside root should return PATH_ESCAPE."""
 
     @pytest.fixture
-    def repo_for_path_escape_check(self, tmp_path):
-        gov = tmp_path / "docs" / "00-governance"
-        gov.mkdir(parents=True)
-        (gov / "metadata.schema.json").write_text(
-            """
-{
-  "type": "object",
-  "required": ["document_id", "type", "title", "status", "version", "last_updated", "owner", "docops_version"],
-  "properties": {
-    "document_id": { "type": "string" },
-    "type": { "type": "string" },
-    "title": { "type": "string" },
-    "status": { "type": "string" },
-    "version": { "type": "string" },
-    "last_updated": { "type": "string" },
-    "owner": { "type": "string" },
-    "docops_version": { "type": "string" }
-  }
-}
-""".strip()
-        )
-
-        (tmp_path / "docops.config.yaml").write_text(
-            """project_name: TestProject
-repo_prefix: TEST
-docops_version: '2.0'
-document_types:
-  ADR:
-    directory: 45-adr
-"""
-        )
-
-        adr_dir = tmp_path / "docs" / "45-adr"
-        adr_dir.mkdir(parents=True)
-        (tmp_path / "docs" / "00-governance" / "metadata.schema.json").touch()
-
+    def repo_for_path_escape_check(self, tmp_path, _check_repo_template):
+        shutil.copytree(_check_repo_template, tmp_path, dirs_exist_ok=True)
         return tmp_path
 
     def test_absolute_path_outside_root_returns_path_escape(
-        self, repo_for_path_escape_check
+        self, repo_for_path_escape_check, runner_no_mixed_stderr
     ):
         """F10.4: Absolute path outside root should return PATH_ESCAPE error."""
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
-            cli,
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "check",
             [
-                "check",
                 "/nonexistent/path.md",
                 "--root",
                 str(repo_for_path_escape_check),
@@ -2536,59 +2225,48 @@ document_types:
         )
 
         assert result.exit_code != 0
-        data = json.loads(result.output.strip().splitlines()[-1])
-        assert data["success"] is False
+        data = parse_last_json_line(result.output)
         assert "error" in data
-        assert data["error"]["code"] == "PATH_ESCAPE"
+        _assert_error_envelope(data, "PATH_ESCAPE")
 
 
-def test_config_missing_when_docs_exists_but_no_config(tmp_path):
+def test_config_missing_when_docs_exists_but_no_config(tmp_path, runner):
     """F9.1: CONFIG_MISSING when docops.config.yaml is missing even if docs/ exists."""
     (tmp_path / "docs").mkdir()
     (tmp_path / "docs" / "test.md").write_text("# Test")
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli, ["new", "ADR", "Test", "--root", str(tmp_path), "--format", "json"]
-    )
+    result = _invoke(runner, "new", ["ADR", "Test", "--root", str(tmp_path), "--format", "json"])
 
     data = json.loads(result.output)
-    assert data["success"] is False
-    assert data["error"]["code"] == "CONFIG_MISSING"
+    _assert_error_envelope(data, "CONFIG_MISSING")
 
 
-def test_config_missing_when_config_path_is_directory(tmp_path):
+def test_config_missing_when_config_path_is_directory(tmp_path, runner):
     """F9.1: CONFIG_MISSING when docops.config.yaml exists but is not a file."""
     (tmp_path / "docs").mkdir()
     (tmp_path / "docops.config.yaml").mkdir()
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["check", "--root", str(tmp_path), "--format", "json"])
+    result = _invoke(runner, "check", ["--root", str(tmp_path), "--format", "json"])
 
     data = json.loads(result.output)
-    assert data["success"] is False
-    assert data["error"]["code"] == "CONFIG_MISSING"
+    _assert_error_envelope(data, "CONFIG_MISSING")
     assert (
         data["error"]["details"]["required"] == "regular file (not directory/symlink)"
     )
 
 
-def test_new_rejects_non_file_config_path(tmp_path):
+def test_new_rejects_non_file_config_path(tmp_path, runner):
     """F9.1: new must reject directory docops.config.yaml."""
     (tmp_path / "docs").mkdir()
     (tmp_path / "docops.config.yaml").mkdir()
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli, ["new", "ADR", "Test", "--root", str(tmp_path), "--format", "json"]
-    )
+    result = _invoke(runner, "new", ["ADR", "Test", "--root", str(tmp_path), "--format", "json"])
 
     data = json.loads(result.output)
-    assert data["success"] is False
-    assert data["error"]["code"] == "CONFIG_MISSING"
+    _assert_error_envelope(data, "CONFIG_MISSING")
 
 
-def test_config_missing_when_config_path_is_symlink(tmp_path):
+def test_config_missing_when_config_path_is_symlink(tmp_path, runner):
     """F9.1: CONFIG_MISSING when docops.config.yaml exists as a symlink."""
     if not hasattr(os, "symlink"):
         pytest.skip("Symlinks are not supported on this platform")
@@ -2605,60 +2283,65 @@ def test_config_missing_when_config_path_is_symlink(tmp_path):
     except OSError as exc:
         pytest.skip(f"Unable to create symlink on this platform: {exc}")
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["check", "--root", str(tmp_path), "--format", "json"])
+    result = _invoke(runner, "check", ["--root", str(tmp_path), "--format", "json"])
 
     data = json.loads(result.output)
-    assert data["success"] is False
-    assert data["error"]["code"] == "CONFIG_MISSING"
+    _assert_error_envelope(data, "CONFIG_MISSING")
 
 
-def test_config_missing_when_docops_version_is_null(tmp_path):
+def test_config_missing_when_config_path_is_dangling_symlink(tmp_path, runner):
+    """F9.1: a dangling docops.config.yaml symlink reports the config as missing."""
+    if not hasattr(os, "symlink"):
+        pytest.skip("Symlinks are not supported on this platform")
+
+    try:
+        os.symlink(tmp_path / "absent.yaml", tmp_path / "docops.config.yaml")
+    except OSError as exc:
+        pytest.skip(f"Unable to create symlink on this platform: {exc}")
+
+    result = _invoke(runner, "check", ["--root", str(tmp_path), "--format", "json"])
+
+    data = json.loads(result.output)
+    _assert_error_envelope(data, "CONFIG_MISSING")
+    assert data["error"]["details"]["reason"] == "missing"
+
+
+def test_config_missing_when_docops_version_is_null(tmp_path, runner):
     """F9.1: CONFIG_MISSING when docops_version is null."""
     (tmp_path / "docs").mkdir()
     (tmp_path / "docops.config.yaml").write_text(
         "project_name: Test\nrepo_prefix: TEST\ndocops_version:\n"
     )
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli, ["check", "--root", str(tmp_path), "--format", "json"]
-    )
+    result = _invoke(runner, "check", ["--root", str(tmp_path), "--format", "json"])
 
     data = json.loads(result.output)
-    assert data["success"] is False
-    assert data["error"]["code"] == "CONFIG_MISSING"
+    _assert_error_envelope(data, "CONFIG_MISSING")
 
 
-def test_config_missing_when_config_is_invalid_utf8(tmp_path):
+def test_config_missing_when_config_is_invalid_utf8(tmp_path, runner):
     """F9.1: invalid UTF-8 config bytes are reported as malformed config."""
     (tmp_path / "docs").mkdir()
     (tmp_path / "docops.config.yaml").write_bytes(b"\xff\xfe\xfa")
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli, ["check", "--root", str(tmp_path), "--format", "json"]
-    )
+    result = _invoke(runner, "check", ["--root", str(tmp_path), "--format", "json"])
 
     data = json.loads(result.output)
-    assert data["success"] is False
-    assert data["error"]["code"] == "CONFIG_MISSING"
+    _assert_error_envelope(data, "CONFIG_MISSING")
     assert data["error"]["details"]["reason"] == "unparseable"
     assert data["error"]["details"]["file"] == "docops.config.yaml"
 
 
-def test_adr_new_requires_initialized_repo(tmp_path):
+def test_adr_new_requires_initialized_repo(tmp_path, runner):
     (tmp_path / "docs").mkdir()
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["adr", "new", "Alias Test", "--root", str(tmp_path)])
 
     assert result.exit_code == getattr(os, "EX_NOINPUT", 66)
     assert "CONFIG_MISSING" in result.output
 
 
-@patch("meminit.cli.main.DoctorRepositoryUseCase")
-def test_cli_doctor_json_output(mock_use_case, tmp_path):
+def test_cli_doctor_json_output(monkeypatch, tmp_path, runner_no_mixed_stderr):
     issues = [
         SimpleNamespace(
             severity=SimpleNamespace(value="warning"),
@@ -2675,13 +2358,14 @@ def test_cli_doctor_json_output(mock_use_case, tmp_path):
             message="Error message",
         ),
     ]
-    mock_use_case.return_value.execute.return_value = issues
+    _stub_use_case(monkeypatch, "DoctorRepositoryUseCase", issues)
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["doctor", "--root", str(tmp_path), "--format", "json"])
+    result = _invoke(
+        runner_no_mixed_stderr, "doctor", ["--root", str(tmp_path), "--format", "json"]
+    )
 
     assert result.exit_code == 1
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     assert payload["command"] == "doctor"
     assert payload["success"] is False
     assert len(payload["warnings"]) == 1
@@ -2690,9 +2374,8 @@ def test_cli_doctor_json_output(mock_use_case, tmp_path):
     assert payload["violations"][0]["code"] == "DOCOPS_ERR"
 
 
-@patch("meminit.cli.main.DoctorRepositoryUseCase")
-def test_cli_doctor_json_strict_warnings_fail(mock_use_case, tmp_path):
-    mock_use_case.return_value.execute.return_value = [
+def test_cli_doctor_json_strict_warnings_fail(monkeypatch, tmp_path, runner_no_mixed_stderr):
+    issues = [
         SimpleNamespace(
             severity=SimpleNamespace(value="warning"),
             rule="DOCOPS_WARN",
@@ -2701,15 +2384,16 @@ def test_cli_doctor_json_strict_warnings_fail(mock_use_case, tmp_path):
             message="Warning message",
         )
     ]
+    _stub_use_case(monkeypatch, "DoctorRepositoryUseCase", issues)
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
-        ["doctor", "--root", str(tmp_path), "--format", "json", "--strict"],
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "doctor",
+        ["--root", str(tmp_path), "--format", "json", "--strict"],
     )
 
     assert result.exit_code == 1
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     assert payload["command"] == "doctor"
     assert payload["success"] is False
     assert payload["data"]["status"] == "warn"
@@ -2717,8 +2401,7 @@ def test_cli_doctor_json_strict_warnings_fail(mock_use_case, tmp_path):
     assert len(payload["violations"]) == 1
 
 
-@patch("meminit.cli.main.FixRepositoryUseCase")
-def test_cli_fix_json_output(mock_use_case, tmp_path):
+def test_cli_fix_json_output(monkeypatch, tmp_path, runner_no_mixed_stderr):
     report = SimpleNamespace(
         fixed_violations=[1, 2],
         remaining_violations=[
@@ -2731,16 +2414,16 @@ def test_cli_fix_json_output(mock_use_case, tmp_path):
             )
         ],
     )
-    mock_use_case.return_value.execute.return_value = report
+    _stub_use_case(monkeypatch, "FixRepositoryUseCase", report)
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
-        ["fix", "--root", str(tmp_path), "--format", "json", "--dry-run"],
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "fix",
+        ["--root", str(tmp_path), "--format", "json", "--dry-run"],
     )
 
     assert result.exit_code == 1
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     assert payload["command"] == "fix"
     assert payload["success"] is False
     assert payload["data"]["fixed"] == 2
@@ -2750,35 +2433,30 @@ def test_cli_fix_json_output(mock_use_case, tmp_path):
     assert payload["violations"][0]["path"] == "docs/bad.md"
 
 
-@patch("meminit.cli.main.MigrateIdsUseCase")
-def test_cli_migrate_ids_json_output(mock_use_case, tmp_path):
+def test_cli_migrate_ids_json_output(monkeypatch, tmp_path, runner_no_mixed_stderr):
     report = SimpleNamespace(as_dict=lambda: {"actions": [], "skipped_files": []})
-    mock_use_case.return_value.execute.return_value = report
+    _stub_use_case(monkeypatch, "MigrateIdsUseCase", report)
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
-        ["migrate-ids", "--root", str(tmp_path), "--format", "json", "--dry-run"],
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "migrate-ids",
+        ["--root", str(tmp_path), "--format", "json", "--dry-run"],
     )
 
     assert result.exit_code == 0
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     assert payload["command"] == "migrate-ids"
     assert payload["data"]["report"]["actions"] == []
 
 
-@patch("meminit.cli.main.IdentifyDocumentUseCase")
-def test_cli_identify_json_output(mock_use_case, tmp_path):
-    mock_use_case.return_value.execute.return_value = SimpleNamespace(
-        document_id="TEST-ADR-001",
-        path="docs/45-adr/adr-001.md",
-    )
+def test_cli_identify_json_output(monkeypatch, tmp_path, runner_no_mixed_stderr):
+    report = SimpleNamespace(document_id="TEST-ADR-001", path="docs/45-adr/adr-001.md")
+    _stub_use_case(monkeypatch, "IdentifyDocumentUseCase", report)
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "identify",
         [
-            "identify",
             "docs/45-adr/adr-001.md",
             "--root",
             str(tmp_path),
@@ -2788,149 +2466,118 @@ def test_cli_identify_json_output(mock_use_case, tmp_path):
     )
 
     assert result.exit_code == 0
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     assert payload["command"] == "identify"
     assert payload["data"]["document_id"] == "TEST-ADR-001"
 
 
-@patch("meminit.cli.main.ResolveDocumentUseCase")
-def test_cli_resolve_json_output(mock_use_case, tmp_path):
-    mock_use_case.return_value.execute.return_value = SimpleNamespace(
-        path="docs/45-adr/adr-001.md"
-    )
-
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
-        ["resolve", "TEST-ADR-001", "--root", str(tmp_path), "--format", "json"],
-    )
-
-    assert result.exit_code == 0
-    payload = json.loads(result.output.strip().splitlines()[-1])
-    assert payload["command"] == "resolve"
-    assert payload["data"]["document_id"] == "TEST-ADR-001"
-
-
-@patch("meminit.cli.main.ResolveDocumentUseCase")
-def test_cli_link_json_output(mock_use_case, tmp_path):
-    mock_use_case.return_value.execute.return_value = SimpleNamespace(
-        path="docs/45-adr/adr-001.md"
-    )
-
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
-        ["link", "TEST-ADR-001", "--root", str(tmp_path), "--format", "json"],
-    )
-
-    assert result.exit_code == 0
-    payload = json.loads(result.output.strip().splitlines()[-1])
-    assert payload["command"] == "link"
-    assert payload["data"]["document_id"] == "TEST-ADR-001"
-    assert payload["data"]["link"].startswith("[TEST-ADR-001]")
-
-
-@patch("meminit.cli.main.InstallOrgProfileUseCase")
-def test_cli_org_install_json_output(mock_use_case):
-    report = SimpleNamespace(as_dict=lambda: {"profile": "default"})
-    mock_use_case.return_value.execute.return_value = report
+@pytest.mark.parametrize(
+    ("use_case", "argv", "report", "command", "expected_data"),
+    [
+        pytest.param(
+            "ResolveDocumentUseCase",
+            ["resolve", "TEST-ADR-001", "--root", "{root}"],
+            _RESOLVED_ADR,
+            "resolve",
+            {"document_id": "TEST-ADR-001"},
+            id="resolve",
+        ),
+        pytest.param(
+            "ResolveDocumentUseCase",
+            ["link", "TEST-ADR-001", "--root", "{root}"],
+            _RESOLVED_ADR,
+            "link",
+            {"document_id": "TEST-ADR-001", "link": "[TEST-ADR-001](docs/45-adr/adr-001.md)"},
+            id="link",
+        ),
+        pytest.param(
+            "InstallOrgProfileUseCase",
+            ["org", "install"],
+            _DEFAULT_PROFILE_REPORT,
+            "org install",
+            {"profile": "default"},
+            id="org-install",
+        ),
+        pytest.param(
+            "VendorOrgProfileUseCase",
+            ["org", "vendor", "--root", "{root}"],
+            _DEFAULT_PROFILE_REPORT,
+            "org vendor",
+            {"profile": "default"},
+            id="org-vendor",
+        ),
+        pytest.param(
+            "OrgStatusUseCase",
+            ["org", "status", "--root", "{root}"],
+            SimpleNamespace(as_dict=lambda: {"profile": "default", "status": "ok"}),
+            "org status",
+            {"status": "ok"},
+            id="org-status",
+        ),
+    ],
+)
+def test_cli_use_case_json_output(
+    use_case, argv, report, command, expected_data, monkeypatch, tmp_path, runner_no_mixed_stderr
+):
+    _stub_use_case(monkeypatch, use_case, report)
+    args = [str(tmp_path) if arg == "{root}" else arg for arg in argv]
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(cli, ["org", "install", "--format", "json"])
+    result = runner_no_mixed_stderr.invoke(cli, [*args, "--format", "json"])
 
     assert result.exit_code == 0
-    payload = json.loads(result.output.strip().splitlines()[-1])
-    assert payload["command"] == "org install"
-    assert payload["data"]["profile"] == "default"
+    payload = parse_last_json_line(result.output)
+    assert payload["command"] == command
+    assert {key: payload["data"][key] for key in expected_data} == expected_data
 
 
-@patch("meminit.cli.main.VendorOrgProfileUseCase")
-def test_cli_org_vendor_json_output(mock_use_case, tmp_path):
-    report = SimpleNamespace(as_dict=lambda: {"profile": "default"})
-    mock_use_case.return_value.execute.return_value = report
+@pytest.mark.parametrize("output_format", ["text", "json"])
+@pytest.mark.parametrize(
+    ("argv", "repo_template", "expected_text"),
+    [
+        pytest.param(["new", "ADR", "Smoke Test"], "_adr_template_repo", "Created ADR", id="new"),
+        pytest.param(
+            ["check", "docs/45-adr/adr-001-valid.md"],
+            "_check_repo_template",
+            "Success! No violations found.",
+            id="check",
+        ),
+        pytest.param(["index"], "_check_repo_template", "Index written", id="index"),
+    ],
+)
+def test_cli_group_dispatch_smoke(
+    argv, repo_template, expected_text, output_format, request, tmp_path, runner_no_mixed_stderr
+):
+    """Run core commands through the ``cli`` group so its console setup stays covered."""
+    shutil.copytree(request.getfixturevalue(repo_template), tmp_path, dirs_exist_ok=True)
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
-        ["org", "vendor", "--root", str(tmp_path), "--format", "json"],
+    result = runner_no_mixed_stderr.invoke(
+        cli, [*argv, "--root", str(tmp_path), "--format", output_format]
     )
 
-    assert result.exit_code == 0
-    payload = json.loads(result.output.strip().splitlines()[-1])
-    assert payload["command"] == "org vendor"
-    assert payload["data"]["profile"] == "default"
-
-
-@patch("meminit.cli.main.OrgStatusUseCase")
-def test_cli_org_status_json_output(mock_use_case, tmp_path):
-    report = SimpleNamespace(as_dict=lambda: {"profile": "default", "status": "ok"})
-    mock_use_case.return_value.execute.return_value = report
+    assert result.exit_code == 0, result.output
+    if output_format == "json":
+        payload = parse_last_json_line(result.output)
+        assert payload["success"] is True
+        assert payload["command"] == argv[0]
+    else:
+        assert expected_text in result.output
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
-        ["org", "status", "--root", str(tmp_path), "--format", "json"],
-    )
 
-    assert result.exit_code == 0
-    payload = json.loads(result.output.strip().splitlines()[-1])
-    assert payload["command"] == "org status"
-    assert payload["data"]["status"] == "ok"
+@pytest.fixture
+def repo_for_verbose_json(tmp_path, _adr_template_repo):
+    shutil.copytree(_adr_template_repo, tmp_path, dirs_exist_ok=True)
+    return tmp_path
 
 
 class TestCliVerboseJsonStderr:
     """Tests for F3.3: Verbose reasoning should go to stderr with --format json."""
 
-    @pytest.fixture
-    def repo_for_verbose_json(self, tmp_path):
-        (tmp_path / "docs" / "00-governance" / "templates").mkdir(parents=True)
-        (tmp_path / "docs" / "00-governance" / "templates" / "adr.md").write_text(
-            """<!-- MEMINIT_METADATA_BLOCK -->
-> Metadata goes here
-<!-- END_MEMINIT_METADATA_BLOCK -->
-# ADR
-"""
-        )
-        (tmp_path / "docs" / "00-governance" / "metadata.schema.json").write_text(
-            """
-{
-  "type": "object",
-  "required": ["document_id", "type", "title", "status", "version", "last_updated", "owner", "docops_version"],
-  "properties": {
-    "document_id": { "type": "string" },
-    "type": { "type": "string" },
-    "title": { "type": "string" },
-    "status": { "type": "string" },
-    "version": { "type": "string" },
-    "last_updated": { "type": "string" },
-    "owner": { "type": "string" },
-    "docops_version": { "type": "string" }
-  }
-}
-""".strip()
-        )
-        (tmp_path / "docops.config.yaml").write_text(
-            """project_name: TestProject
-repo_prefix: TEST
-docops_version: '2.0'
-schema_path: docs/00-governance/metadata.schema.json
-document_types:
-  ADR:
-    directory: 45-adr
-    template: docs/00-governance/templates/adr.md
-"""
-        )
-        (tmp_path / "docs" / "45-adr").mkdir(parents=True, exist_ok=True)
-        (tmp_path / "docs" / "00-governance" / "metadata.schema.json").touch()
-        return tmp_path
-
-    def test_verbose_json_routes_reasoning_to_stderr(self, repo_for_verbose_json):
+    def test_verbose_json_routes_reasoning_to_stderr(self, repo_for_verbose_json, runner):
         """F3.3: Verbose reasoning should go to stderr with --format json."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
+        result = _invoke(
+            runner,
+            "new",
             [
-                "new",
                 "ADR",
                 "Test",
                 "--root",
@@ -2943,19 +2590,22 @@ document_types:
             catch_exceptions=False,
         )
 
-        lines = [line for line in result.output.splitlines() if line.strip()]
-        json_index = next(
-            i for i, line in enumerate(lines) if line.lstrip().startswith("{")
+        match = _JSON_LINE_RE.search(result.output)
+        data = json.loads(match.group(0))
+        stderr_output = getattr(result, "stderr", None)
+        # With mixed streams the reasoning lines sit on either side of the envelope.
+        stderr_parts = (
+            (stderr_output,)
+            if stderr_output
+            else (result.output[: match.start()], result.output[match.end() :])
         )
-        data = json.loads(lines[json_index])
-        stderr_output = result.stderr if getattr(result, "stderr", None) else ""
-        if not stderr_output:
-            stderr_output = "\n".join(lines[:json_index] + lines[json_index + 1 :])
         assert "reasoning" not in data
         assert data["success"] is True
 
-        assert (
-            "directory_selected" in stderr_output or "owner_resolved" in stderr_output
+        assert any(
+            marker in part
+            for part in stderr_parts
+            for marker in ("directory_selected", "owner_resolved")
         )
 
 
@@ -2966,24 +2616,15 @@ class TestCliEdgeCases:
     def repo_for_edge_cases(self, tmp_path):
         (tmp_path / "docs" / "00-governance" / "templates").mkdir(parents=True)
         (tmp_path / "docs" / "45-adr").mkdir(parents=True)
-        (tmp_path / "docops.config.yaml").write_text(
-            """project_name: TestProject
-repo_prefix: TEST
-docops_version: '2.0'
-document_types:
-  ADR:
-    directory: 45-adr
-"""
-        )
+        (tmp_path / "docops.config.yaml").write_bytes(_ADR_CONFIG_BYTES)
         return tmp_path
 
-    def test_new_empty_title_returns_error_json(self, repo_for_edge_cases):
+    def test_new_empty_title_returns_error_json(self, repo_for_edge_cases, runner_no_mixed_stderr):
         """Test that empty title returns appropriate error in JSON format."""
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
-            cli,
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "new",
             [
-                "new",
                 "ADR",
                 "",
                 "--root",
@@ -2994,19 +2635,20 @@ document_types:
         )
 
         assert result.exit_code != 0
-        data = json.loads(result.output.strip().splitlines()[-1])
+        data = parse_last_json_line(result.output)
         assert data["success"] is False
         assert "error" in data
         assert data["output_schema_version"] == "3.0"
         assert "TYPE and TITLE are required" in data["error"]["message"]
 
-    def test_new_invalid_document_type_returns_error_json(self, repo_for_edge_cases):
+    def test_new_invalid_document_type_returns_error_json(
+        self, repo_for_edge_cases, runner_no_mixed_stderr
+    ):
         """Test that invalid document type returns appropriate error in JSON format."""
-        runner = runner_no_mixed_stderr()
-        result = runner.invoke(
-            cli,
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "new",
             [
-                "new",
                 "INVALID_TYPE",
                 "Test Title",
                 "--root",
@@ -3017,36 +2659,39 @@ document_types:
         )
 
         assert result.exit_code != 0
-        data = json.loads(result.output.strip().splitlines()[-1])
+        data = parse_last_json_line(result.output)
         assert data["success"] is False
         assert "error" in data
         assert data["output_schema_version"] == "3.0"
 
-    def test_error_json_includes_error_code_and_message(self, repo_for_edge_cases):
+    def test_error_json_includes_error_code_and_message(
+        self, repo_for_edge_cases, runner_no_mixed_stderr
+    ):
         """Test that JSON errors include correct error code and message."""
-        runner = runner_no_mixed_stderr()
         missing = repo_for_edge_cases / "does-not-exist"
-        result = runner.invoke(
-            cli,
-            ["check", "--format", "json", "--root", str(missing)],
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "check",
+            ["--format", "json", "--root", str(missing)],
         )
 
         assert result.exit_code != 0
-        data = json.loads(result.output.strip().splitlines()[-1])
-        assert data["success"] is False
+        data = parse_last_json_line(result.output)
         assert "error" in data
         assert "code" in data["error"]
         assert "message" in data["error"]
-        assert data["error"]["code"] == "INVALID_ROOT_PATH"
+        _assert_error_envelope(data, "INVALID_ROOT_PATH")
         assert "Path does not exist" in data["error"]["message"]
 
-    def test_error_ndjson_includes_error_code_and_message(self, repo_for_edge_cases):
+    def test_error_ndjson_includes_error_code_and_message(
+        self, repo_for_edge_cases, runner_no_mixed_stderr
+    ):
         """Test that NDJSON errors include correct error code and message."""
-        runner = runner_no_mixed_stderr()
         missing = repo_for_edge_cases / "does-not-exist"
-        result = runner.invoke(
-            cli,
-            ["index", "--format", "ndjson", "--root", str(missing)],
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "index",
+            ["--format", "ndjson", "--root", str(missing)],
         )
 
         assert result.exit_code != 0
@@ -3060,30 +2705,26 @@ document_types:
         assert records[-1]["error"]["code"] == "INVALID_ROOT_PATH"
         assert "Path does not exist" in records[-1]["error"]["message"]
 
-    def test_error_json_is_single_line(self, repo_for_edge_cases):
+    def test_error_json_is_single_line(self, repo_for_edge_cases, runner_no_mixed_stderr):
         """Test that JSON error output is single-line (not multi-line)."""
-        runner = runner_no_mixed_stderr()
         missing = repo_for_edge_cases / "does-not-exist"
-        result = runner.invoke(
-            cli,
-            ["check", "--format", "json", "--root", str(missing)],
+        result = _invoke(
+            runner_no_mixed_stderr,
+            "check",
+            ["--format", "json", "--root", str(missing)],
         )
 
         assert result.exit_code != 0
-        json_line = result.output.strip().splitlines()[-1]
+        json_line = last_line(result.output)
         assert "\n" not in json_line
         data = json.loads(json_line)
         assert data["success"] is False
 
 
-@patch("meminit.cli.main.MigrateTemplatesUseCase")
-def test_cli_migrate_templates_command_exists(mock_use_case, tmp_path):
+def test_cli_migrate_templates_command_exists(monkeypatch, tmp_path, runner):
     """Test that migrate-templates command is registered with the CLI."""
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
-    mock_use_case.return_value.execute.return_value = MagicMock(
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
+    report = SimpleNamespace(
         dry_run=True,
         success=True,
         config_file=str(tmp_path / "docops.config.yaml"),
@@ -3124,22 +2765,19 @@ def test_cli_migrate_templates_command_exists(mock_use_case, tmp_path):
             "changes": [],
         },
     )
+    _stub_use_case(monkeypatch, "MigrateTemplatesUseCase", report)
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["migrate-templates", "--root", str(tmp_path)])
+    result = _invoke(runner, "migrate-templates", ["--root", str(tmp_path)])
+    output = result.output
 
     assert result.exit_code == 0
-    assert "migrate-templates" in result.output or "DRY RUN" in result.output
+    assert "migrate-templates" in output or "DRY RUN" in output
 
 
-@patch("meminit.cli.main.MigrateTemplatesUseCase")
-def test_cli_migrate_templates_dry_run_default(mock_use_case, tmp_path):
+def test_cli_migrate_templates_dry_run_default(monkeypatch, tmp_path, runner):
     """Test that --dry-run is the default behavior."""
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
-    mock_use_case.return_value.execute.return_value = MagicMock(
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
+    report = SimpleNamespace(
         dry_run=True,
         success=True,
         config_file=str(tmp_path / "docops.config.yaml"),
@@ -3174,26 +2812,18 @@ def test_cli_migrate_templates_dry_run_default(mock_use_case, tmp_path):
             "changes": [],
         },
     )
+    _stub_use_case(monkeypatch, "MigrateTemplatesUseCase", report)
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli, ["migrate-templates", "--root", str(tmp_path), "--format", "json"]
-    )
+    result = _invoke(runner, "migrate-templates", ["--root", str(tmp_path), "--format", "json"])
 
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["command"] == "migrate-templates"
+    data = assert_json_envelope(result, command="migrate-templates")
     assert data["data"]["dry_run"] is True
 
 
-@patch("meminit.cli.main.MigrateTemplatesUseCase")
-def test_cli_migrate_templates_json_output(mock_use_case, tmp_path):
+def test_cli_migrate_templates_json_output(monkeypatch, tmp_path, runner_no_mixed_stderr):
     """Test that --format json outputs correct JSON structure."""
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
-    mock_use_case.return_value.execute.return_value = MagicMock(
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
+    report = SimpleNamespace(
         dry_run=False,
         success=True,
         config_file=str(tmp_path / "docops.config.yaml"),
@@ -3228,12 +2858,12 @@ def test_cli_migrate_templates_json_output(mock_use_case, tmp_path):
             "changes": [],
         },
     )
+    _stub_use_case(monkeypatch, "MigrateTemplatesUseCase", report)
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "migrate-templates",
         [
-            "migrate-templates",
             "--root",
             str(tmp_path),
             "--format",
@@ -3243,7 +2873,7 @@ def test_cli_migrate_templates_json_output(mock_use_case, tmp_path):
     )
 
     assert result.exit_code == 0
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     assert payload["command"] == "migrate-templates"
     assert payload["success"] is True
     assert payload["output_schema_version"] == "3.0"
@@ -3255,14 +2885,10 @@ def test_cli_migrate_templates_json_output(mock_use_case, tmp_path):
     assert len(payload["warnings"]) == 1
 
 
-@patch("meminit.cli.main.MigrateTemplatesUseCase")
-def test_cli_migrate_templates_no_dry_run_applies_changes(mock_use_case, tmp_path):
+def test_cli_migrate_templates_no_dry_run_applies_changes(monkeypatch, tmp_path, runner):
     """Test that --no-dry-run flag actually applies changes."""
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
-    mock_use_case.return_value.execute.return_value = MagicMock(
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
+    report = SimpleNamespace(
         dry_run=False,
         success=True,
         config_file=str(tmp_path / "docops.config.yaml"),
@@ -3291,39 +2917,32 @@ def test_cli_migrate_templates_no_dry_run_applies_changes(mock_use_case, tmp_pat
             "changes": [],
         },
     )
+    _stub_use_case(monkeypatch, "MigrateTemplatesUseCase", report)
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli, ["migrate-templates", "--root", str(tmp_path), "--no-dry-run"]
-    )
+    result = _invoke(runner, "migrate-templates", ["--root", str(tmp_path), "--no-dry-run"])
+    output = result.output
 
     assert result.exit_code == 0
-    assert "DRY RUN" not in result.output
-    assert "APPLY" in result.output or "migrated" in result.output.lower()
+    assert "DRY RUN" not in output
+    assert "APPLY" in output or "migrated" in output.lower()
 
 
-def test_cli_migrate_templates_missing_config_json(tmp_path):
+def test_cli_migrate_templates_missing_config_json(tmp_path, runner_no_mixed_stderr):
     """Test that migrate-templates returns proper error when config is missing."""
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli, ["migrate-templates", "--root", str(tmp_path), "--format", "json"]
+    result = _invoke(
+        runner_no_mixed_stderr, "migrate-templates", ["--root", str(tmp_path), "--format", "json"]
     )
 
     assert result.exit_code != 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is False
+    data = parse_last_json_line(result.output)
     assert "error" in data
-    assert data["error"]["code"] == "CONFIG_MISSING"
+    _assert_error_envelope(data, "CONFIG_MISSING")
 
 
-@patch("meminit.cli.main.MigrateTemplatesUseCase")
-def test_cli_migrate_templates_md_output(mock_use_case, tmp_path):
+def test_cli_migrate_templates_md_output(monkeypatch, tmp_path, runner):
     """Test that --format md outputs markdown format."""
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
-    mock_use_case.return_value.execute.return_value = MagicMock(
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
+    report = SimpleNamespace(
         dry_run=True,
         success=True,
         config_file=str(tmp_path / "docops.config.yaml"),
@@ -3344,35 +2963,34 @@ def test_cli_migrate_templates_md_output(mock_use_case, tmp_path):
         warnings=["Sample warning"],
         skipped_files=[],
     )
+    _stub_use_case(monkeypatch, "MigrateTemplatesUseCase", report)
 
-    runner = CliRunner()
-    result = runner.invoke(
-        cli, ["migrate-templates", "--root", str(tmp_path), "--format", "md"]
-    )
+    result = _invoke(runner, "migrate-templates", ["--root", str(tmp_path), "--format", "md"])
 
     assert result.exit_code == 0
-    assert "# Meminit Template Migration" in result.output
-    assert "DRY RUN" in result.output
-    assert "Config entries found: 1" in result.output
-    assert "Config entries migrated: 1" in result.output
-    assert "Template files found: 2" in result.output
-    assert "Template files renamed: 2" in result.output
-    assert "Placeholder replacements: 3" in result.output
-    assert "## Warnings" in result.output
-    assert "Sample warning" in result.output
-    assert "Rename docs/00-governance/templates/template-001-adr.md" in result.output
-
-
-@patch("meminit.cli.main.MigrateTemplatesUseCase")
+    _assert_all_in(
+        result.output,
+        (
+            "# Meminit Template Migration",
+            "DRY RUN",
+            "Config entries found: 1",
+            "Config entries migrated: 1",
+            "Template files found: 2",
+            "Template files renamed: 2",
+            "Placeholder replacements: 3",
+            "## Warnings",
+            "Sample warning",
+            "Rename docs/00-governance/templates/template-001-adr.md",
+        ),
+    )
+
+
 def test_cli_migrate_templates_json_failure_returns_error_envelope(
-    mock_use_case, tmp_path
+    monkeypatch, tmp_path, runner_no_mixed_stderr
 ):
     """JSON migrate-templates failures must remain schema-valid and machine-readable."""
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
-    mock_use_case.return_value.execute.return_value = MagicMock(
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
+    report = SimpleNamespace(
         dry_run=True,
         success=False,
         config_file=str(tmp_path / "docops.config.yaml"),
@@ -3404,30 +3022,27 @@ def test_cli_migrate_templates_json_failure_returns_error_envelope(
             "skipped_files": [],
         },
     )
+    _stub_use_case(monkeypatch, "MigrateTemplatesUseCase", report)
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli, ["migrate-templates", "--root", str(tmp_path), "--format", "json"]
+    result = _invoke(
+        runner_no_mixed_stderr, "migrate-templates", ["--root", str(tmp_path), "--format", "json"]
     )
 
     assert result.exit_code == 1
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     assert payload["command"] == "migrate-templates"
-    assert payload["success"] is False
-    assert payload["error"]["code"] == ErrorCode.VALIDATION_ERROR.value
+    _assert_error_envelope(payload, ErrorCode.VALIDATION_ERROR.value)
     assert payload["error"]["message"] == "Failed to parse config: malformed yaml"
     assert payload["data"]["success"] is False
     assert payload["warnings"][0]["message"] == "Failed to parse config: malformed yaml"
 
 
-@patch("meminit.cli.main.MigrateTemplatesUseCase")
-def test_cli_migrate_templates_md_failure_exits_non_zero(mock_use_case, tmp_path):
+def test_cli_migrate_templates_md_failure_exits_non_zero(
+    monkeypatch, tmp_path, runner_no_mixed_stderr
+):
     """Markdown migrate-templates failures must propagate a failing exit code."""
-    (tmp_path / "docops.config.yaml").write_text(
-        "project_name: TestProject\nrepo_prefix: TEST\ndocops_version: '2.0'\n",
-        encoding="utf-8",
-    )
-    mock_use_case.return_value.execute.return_value = MagicMock(
+    (tmp_path / "docops.config.yaml").write_bytes(_MINIMAL_CONFIG_BYTES)
+    report = SimpleNamespace(
         dry_run=True,
         success=False,
         config_file=str(tmp_path / "docops.config.yaml"),
@@ -3442,19 +3057,24 @@ def test_cli_migrate_templates_md_failure_exits_non_zero(mock_use_case, tmp_path
         warnings=["Failed to parse config: malformed yaml"],
         skipped_files=[],
     )
+    _stub_use_case(monkeypatch, "MigrateTemplatesUseCase", report)
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli, ["migrate-templates", "--root", str(tmp_path), "--format", "md"]
+    result = _invoke(
+        runner_no_mixed_stderr, "migrate-templates", ["--root", str(tmp_path), "--format", "md"]
     )
 
     assert result.exit_code == 1
-    assert "# Meminit Template Migration" in result.output
-    assert "## Warnings" in result.output
-    assert "Failed to parse config: malformed yaml" in result.output
+    _assert_all_in(
+        result.output,
+        (
+            "# Meminit Template Migration",
+            "## Warnings",
+            "Failed to parse config: malformed yaml",
+        ),
+    )
 
 
-def test_cli_migrate_templates_e2e_real_execution(tmp_path):
+def test_cli_migrate_templates_e2e_real_execution(tmp_path, runner_no_mixed_stderr):
     """E2E test that creates real legacy repo and runs actual migrate-templates command."""
     templates_dir = tmp_path / "docs" / "00-governance" / "templates"
     templates_dir.mkdir(parents=True)
@@ -3488,11 +3108,10 @@ def test_cli_migrate_templates_e2e_real_execution(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "migrate-templates",
         [
-            "migrate-templates",
             "--root",
             str(tmp_path),
             "--format",
@@ -3500,11 +3119,7 @@ def test_cli_migrate_templates_e2e_real_execution(tmp_path):
         ],
     )
 
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-
-    assert data["success"] is True
-    assert data["command"] == "migrate-templates"
+    data = assert_json_envelope(result, success=True, command="migrate-templates")
     assert data["data"]["dry_run"] is True
 
     summary = data["data"]["summary"]
@@ -3534,11 +3149,10 @@ def test_cli_migrate_templates_e2e_real_execution(tmp_path):
     assert (templates_dir / "template-001-adr.md").exists()
     assert (templates_dir / "template-002-prd.md").exists()
 
-    runner = runner_no_mixed_stderr()
-    result = runner.invoke(
-        cli,
+    result = _invoke(
+        runner_no_mixed_stderr,
+        "migrate-templates",
         [
-            "migrate-templates",
             "--root",
             str(tmp_path),
             "--format",
@@ -3548,7 +3162,7 @@ def test_cli_migrate_templates_e2e_real_execution(tmp_path):
     )
 
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
 
     assert data["data"]["dry_run"] is False
 
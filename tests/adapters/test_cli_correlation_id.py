@@ -7,6 +7,7 @@ import pytest
 from click.testing import CliRunner
 
 from meminit.cli.main import cli
+from tests.helpers import first_line
 
 
 @pytest.fixture
@@ -21,8 +22,7 @@ def initialized_repo(tmp_path):
     return tmp_path
 
 
-def test_correlation_id_echoed_in_json_output(initialized_repo):
-    runner = CliRunner()
+def test_correlation_id_echoed_in_json_output(initialized_repo, runner):
     result = runner.invoke(
         cli,
         ["context", "--format", "json", "--root", str(initialized_repo),
@@ -33,8 +33,7 @@ def test_correlation_id_echoed_in_json_output(initialized_repo):
     assert data["correlation_id"] == "trace-abc-42"
 
 
-def test_correlation_id_omitted_when_not_provided(initialized_repo):
-    runner = CliRunner()
+def test_correlation_id_omitted_when_not_provided(initialized_repo, runner):
     result = runner.invoke(
         cli,
         ["context", "--format", "json", "--root", str(initialized_repo)],
@@ -67,22 +66,20 @@ def test_correlation_id_cli_flag_overrides_env_var(initialized_repo):
     assert data["correlation_id"] == "cli-trace-77"
 
 
-def test_correlation_id_whitespace_rejected_as_json_envelope(initialized_repo):
-    runner = CliRunner()
+def test_correlation_id_whitespace_rejected_as_json_envelope(initialized_repo, runner):
     result = runner.invoke(
         cli,
         ["context", "--format", "json", "--root", str(initialized_repo),
          "--correlation-id", "has space"],
     )
     assert result.exit_code != 0
-    data = json.loads(result.output.strip().splitlines()[0])
+    data = json.loads(first_line(result.output))
     assert data["success"] is False
     assert data["error"]["code"] == "INVALID_FLAG_COMBINATION"
     assert "whitespace" in data["error"]["message"]
 
 
-def test_correlation_id_too_long_rejected_as_json_envelope(initialized_repo):
-    runner = CliRunner()
+def test_correlation_id_too_long_rejected_as_json_envelope(initialized_repo, runner):
     long_cid = "a" * 129
     result = runner.invoke(
         cli,
@@ -90,14 +87,13 @@ def test_correlation_id_too_long_rejected_as_json_envelope(initialized_repo):
          "--correlation-id", long_cid],
     )
     assert result.exit_code != 0
-    data = json.loads(result.output.strip().splitlines()[0])
+    data = json.loads(first_line(result.output))
     assert data["success"] is False
     assert data["error"]["code"] == "INVALID_FLAG_COMBINATION"
     assert "128" in data["error"]["message"]
 
 
-def test_correlation_id_appears_after_run_id_in_key_order(initialized_repo):
-    runner = CliRunner()
+def test_correlation_id_appears_after_run_id_in_key_order(initialized_repo, runner):
     result = runner.invoke(
         cli,
         ["context", "--format", "json", "--root", str(initialized_repo),
@@ -109,8 +105,7 @@ def test_correlation_id_appears_after_run_id_in_key_order(initialized_repo):
     assert keys.index("correlation_id") == keys.index("run_id") + 1
 
 
-def test_correlation_id_echoed_in_error_envelope(initialized_repo):
-    runner = CliRunner()
+def test_correlation_id_echoed_in_error_envelope(initialized_repo, runner):
     result = runner.invoke(
         cli,
         ["context", "--format", "json", "--root", str(initialized_repo) + "/nonexistent",
@@ -1,4 +1,3 @@
-import inspect
 import json
 from pathlib import Path
 
@@ -9,13 +8,6 @@ from jsonschema import Draft7Validator
 from meminit.cli.main import cli
 
 
-def runner_no_mixed_stderr() -> CliRunner:
-    kwargs = {}
-    if "mix_stderr" in inspect.signature(CliRunner).parameters:
-        kwargs["mix_stderr"] = False
-    return CliRunner(**kwargs)
-
-
 @pytest.fixture(scope="module")
 def agent_output_schema():
     schema_path = (
@@ -316,6 +308,7 @@ def test_cli_json_command_matrix_emits_schema_valid_envelopes(
     repo_kind,
     args_fn,
     prepare_fn,
+    runner_no_mixed_stderr,
 ):
     root = tmp_path / case_name.replace(" ", "-")
     root.mkdir(parents=True, exist_ok=True)
@@ -325,7 +318,7 @@ def test_cli_json_command_matrix_emits_schema_valid_envelopes(
     elif repo_kind == "legacy":
         _write_legacy_templates_repo(root)
 
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     if prepare_fn is not None:
         prepare_fn(runner, root, agent_output_schema)
 
@@ -345,9 +338,10 @@ def test_verbose_json_keeps_stdout_machine_safe_for_representative_commands(
     tmp_path,
     agent_output_schema,
     args,
+    runner_no_mixed_stderr,
 ):
     _write_initialized_repo(tmp_path)
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
 
     result = runner.invoke(
         cli,
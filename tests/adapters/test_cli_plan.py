@@ -1,18 +1,10 @@
 import json
-from click.testing import CliRunner
 from meminit.cli.main import cli
+from tests.helpers import parse_last_json_line
 import frontmatter
 
-def runner_no_mixed_stderr() -> CliRunner:
-    # Small helper for click > 8.0 compatibility
-    import inspect
-    kwargs = {}
-    if "mix_stderr" in inspect.signature(CliRunner).parameters:
-        kwargs["mix_stderr"] = False
-    return CliRunner(**kwargs)
 
-
-def test_cli_plan_driven_migration_e2e(tmp_path):
+def test_cli_plan_driven_migration_e2e(tmp_path, runner_no_mixed_stderr):
     """
     E2E test for the PRD-004 plan-driven migration workflow.
     - Runs scan --plan to generate a plan
@@ -39,13 +31,13 @@ def test_cli_plan_driven_migration_e2e(tmp_path):
     )
 
     plan_path = tmp_path / "migration.plan.json"
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
 
     # ====== STAGE 1: SCAN --PLAN ======
     result = runner.invoke(cli, ["scan", "--plan", str(plan_path), "--format", "json", "--root", str(tmp_path)])
     assert result.exit_code == 0, f"Scan failed: {result.output}"
     
-    scan_envelope = json.loads(result.output.strip().splitlines()[-1])
+    scan_envelope = parse_last_json_line(result.output)
     assert scan_envelope["success"] is True
     
     # Verify the plan file was written separately and correctly
@@ -71,7 +63,7 @@ def test_cli_plan_driven_migration_e2e(tmp_path):
     # Actually wait, fix outputs exit code 0 or >0 based on remaining violations
     # But since it's dry run, it didn't fix them.
     # Let's just check the envelope
-    fix_dry_env = json.loads(fix_dry_result.output.strip().splitlines()[-1])
+    fix_dry_env = parse_last_json_line(fix_dry_result.output)
     assert fix_dry_env["output_schema_version"] == "3.0"
     
     # The file should NOT be moved yet
@@ -82,7 +74,7 @@ def test_cli_plan_driven_migration_e2e(tmp_path):
     fix_apply_result = runner.invoke(cli, ["fix", "--plan", str(plan_path), "--no-dry-run", "--format", "json", "--root", str(tmp_path)])
     # The command might exit with 77 due to other structural violations (like missing 00-governance in the minimal test repo)
     # But it should successfully fix the ADR
-    fix_apply_env = json.loads(fix_apply_result.output.strip().splitlines()[-1])
+    fix_apply_env = parse_last_json_line(fix_apply_result.output)
     assert fix_apply_env["data"]["fixed"] > 0
     # remaining defaults to >0 because of the repo layout check failures
     
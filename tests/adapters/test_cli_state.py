@@ -4,16 +4,9 @@ from pathlib import Path
 
 import pytest
 import yaml
-from click.testing import CliRunner
 
 from meminit.cli.main import cli
-
-def runner_no_mixed_stderr() -> CliRunner:
-    import inspect
-    kwargs = {}
-    if "mix_stderr" in inspect.signature(CliRunner).parameters:
-        kwargs["mix_stderr"] = False
-    return CliRunner(**kwargs)
+from tests.helpers import assert_json_envelope, parse_last_json_line
 
 @pytest.fixture
 def repo_with_docs(tmp_path):
@@ -35,7 +28,7 @@ def repo_with_docs(tmp_path):
     
     return tmp_path
 
-def test_cli_state_list_accepts_templates_v2_list_namespaces(tmp_path):
+def test_cli_state_list_accepts_templates_v2_list_namespaces(tmp_path, runner_no_mixed_stderr):
     """State commands accept the normal Templates v2 list-form namespaces config."""
     (tmp_path / "docs" / "00-governance").mkdir(parents=True)
     (tmp_path / "docs" / "00-governance" / "metadata.schema.json").write_text("{}")
@@ -55,18 +48,16 @@ def test_cli_state_list_accepts_templates_v2_list_namespaces(tmp_path):
         encoding="utf-8",
     )
 
-    result = runner_no_mixed_stderr().invoke(
+    result = runner_no_mixed_stderr.invoke(
         cli, ["state", "list", "--root", str(tmp_path), "--format", "json"]
     )
 
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert data["data"]["entries"] == []
 
-def test_cli_state_set_notes_only(repo_with_docs):
+def test_cli_state_set_notes_only(repo_with_docs, runner_no_mixed_stderr):
     """P2 Regression: Allow state set --notes without --impl-state."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     
     # First set a state
     runner.invoke(cli, ["state", "set", "TEST-ADR-001", "--impl-state", "In Progress", "--root", str(repo_with_docs)])
@@ -74,15 +65,13 @@ def test_cli_state_set_notes_only(repo_with_docs):
     # Now update only notes
     result = runner.invoke(cli, ["state", "set", "TEST-ADR-001", "--notes", "Updated notes", "--root", str(repo_with_docs), "--format", "json"])
     
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert data["data"]["impl_state"] == "In Progress"
     assert data["data"]["notes"] == "Updated notes"
 
-def test_cli_index_filtering_does_not_persist(repo_with_docs):
+def test_cli_index_filtering_does_not_persist(repo_with_docs, runner_no_mixed_stderr):
     """P1 Regression: Filtered index run should not overwrite the canonical index file with a subset."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     
     # 1. Run full index
     runner.invoke(cli, ["index", "--root", str(repo_with_docs)])
@@ -95,7 +84,7 @@ def test_cli_index_filtering_does_not_persist(repo_with_docs):
     assert result.exit_code == 0
 
     # Check JSON output in stdout (should be filtered)
-    stdout_data = json.loads(result.output.strip().splitlines()[-1])
+    stdout_data = parse_last_json_line(result.output)
     assert stdout_data["data"]["node_count"] == 1
     assert stdout_data["data"]["filtered"] is True
     assert stdout_data["data"]["nodes"][0]["document_id"] == "TEST-ADR-002"
@@ -111,9 +100,9 @@ def test_cli_index_filtering_does_not_persist(repo_with_docs):
     assert len(disk_data["data"]["nodes"]) == 2, "Canonical index file was incorrectly filtered!"
 
 
-def test_cli_index_filtered_md_output(repo_with_docs):
+def test_cli_index_filtered_md_output(repo_with_docs, runner_no_mixed_stderr):
     """Filtered index in md format reports correct node and edge counts."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
 
     result = runner.invoke(cli, ["index", "--status", "Draft", "--root", str(repo_with_docs), "--format", "md"])
     assert result.exit_code == 0
@@ -123,33 +112,29 @@ def test_cli_index_filtered_md_output(repo_with_docs):
     assert "Edges: 0" in result.output
 
 
-def test_cli_state_list_json(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_json(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, ["state", "set", "TEST-ADR-001", "--impl-state", "Done", "--root", str(repo_with_docs)])
     
     result = runner.invoke(cli, ["state", "list", "--root", str(repo_with_docs), "--format", "json"])
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert len(data["data"]["entries"]) == 1
     assert data["data"]["entries"][0]["document_id"] == "TEST-ADR-001"
 
-def test_cli_state_get_json(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_get_json(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, ["state", "set", "TEST-ADR-001", "--impl-state", "Blocked", "--root", str(repo_with_docs)])
     
     result = runner.invoke(cli, ["state", "get", "TEST-ADR-001", "--root", str(repo_with_docs), "--format", "json"])
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert data["data"]["impl_state"] == "Blocked"
     assert data["data"]["ready"] is False
     assert data["data"]["open_blockers"] == []
     assert data["data"]["unblocks"] == []
 
 
-def test_cli_state_get_json_propagates_warnings(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_get_json_propagates_warnings(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, ["state", "set", "TEST-ADR-001", "--impl-state", "Not Started", "--root", str(repo_with_docs)])
     runner.invoke(cli, ["state", "set", "TEST-ADR-002", "--impl-state", "Not Started", "--root", str(repo_with_docs)])
 
@@ -162,41 +147,37 @@ def test_cli_state_get_json_propagates_warnings(repo_with_docs):
     )
 
     result = runner.invoke(cli, ["state", "get", "TEST-ADR-001", "--root", str(repo_with_docs), "--format", "json"])
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert data["warnings"]
     assert any(w["code"] == "STATE_DEPENDENCY_CYCLE" for w in data["warnings"])
 
-def test_cli_state_clear_json(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_clear_json(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, ["state", "set", "TEST-ADR-001", "--impl-state", "Done", "--root", str(repo_with_docs)])
     
     result = runner.invoke(cli, ["state", "set", "TEST-ADR-001", "--clear", "--root", str(repo_with_docs), "--format", "json"])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert data["data"]["action"] == "clear"
     assert data["data"]["document_id"] == "TEST-ADR-001"
     
     list_result = runner.invoke(cli, ["state", "list", "--root", str(repo_with_docs), "--format", "json"])
-    list_data = json.loads(list_result.output.strip().splitlines()[-1])
+    list_data = parse_last_json_line(list_result.output)
     assert len(list_data["data"]["entries"]) == 0
 
 
-def test_cli_state_set_priority(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_set_priority(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--priority", "P0", "--root", str(repo_with_docs), "--format", "json",
     ])
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert data["data"]["priority"] == "P0"
 
 
-def test_cli_state_set_text_shows_planning_fields(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_set_text_shows_planning_fields(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--priority", "P0", "--assignee", "agent:codex",
@@ -209,8 +190,8 @@ def test_cli_state_set_text_shows_planning_fields(repo_with_docs):
     assert "Next Action: Review PR" in result.output
 
 
-def test_cli_state_set_invalid_priority(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_set_invalid_priority(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--priority", "P9", "--root", str(repo_with_docs), "--format", "json",
@@ -218,33 +199,31 @@ def test_cli_state_set_invalid_priority(repo_with_docs):
     assert result.exit_code != 0
 
 
-def test_cli_state_set_assignee_and_next_action(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_set_assignee_and_next_action(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--assignee", "agent:codex", "--next-action", "Implement schema",
         "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert data["data"]["assignee"] == "agent:codex"
     assert data["data"]["next_action"] == "Implement schema"
 
 
-def test_cli_state_next_empty_queue(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_next_empty_queue(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "next", "--root", str(repo_with_docs), "--format", "json",
     ])
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert data["data"]["entry"] is None
     assert data["data"]["reason"] == "state_missing"
 
 
-def test_cli_state_next_with_ready_item(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_next_with_ready_item(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--priority", "P1", "--root", str(repo_with_docs),
@@ -253,15 +232,15 @@ def test_cli_state_next_with_ready_item(repo_with_docs):
         "state", "next", "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert data["data"]["entry"] is not None
     assert data["data"]["entry"]["document_id"] == "TEST-ADR-001"
     assert data["data"]["selection"]["rule"] == "priority > unblocks > updated > document_id"
     assert data["data"]["reason"] is None
 
 
-def test_cli_state_blockers_empty(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_blockers_empty(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs),
@@ -270,13 +249,13 @@ def test_cli_state_blockers_empty(repo_with_docs):
         "state", "blockers", "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert data["data"]["blocked"] == []
     assert data["data"]["summary"]["ready"] >= 1
 
 
-def test_cli_state_blockers_with_blocked_entry(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_blockers_with_blocked_entry(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--add-depends-on", "TEST-ADR-002", "--root", str(repo_with_docs),
@@ -285,13 +264,13 @@ def test_cli_state_blockers_with_blocked_entry(repo_with_docs):
         "state", "blockers", "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert len(data["data"]["blocked"]) == 1
     assert data["data"]["blocked"][0]["document_id"] == "TEST-ADR-001"
 
 
-def test_cli_state_set_depends_on_additive(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_set_depends_on_additive(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--add-depends-on", "TEST-ADR-002", "--root", str(repo_with_docs),
@@ -302,13 +281,13 @@ def test_cli_state_set_depends_on_additive(repo_with_docs):
         "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert "TEST-ADR-002" in data["data"]["depends_on"]
     assert "TEST-ADR-003" in data["data"]["depends_on"]
 
 
-def test_cli_state_next_rejects_invalid_priority_at_least(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_next_rejects_invalid_priority_at_least(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs),
@@ -321,8 +300,8 @@ def test_cli_state_next_rejects_invalid_priority_at_least(repo_with_docs):
     assert "E_INVALID_FILTER_VALUE" in result.output
 
 
-def test_cli_state_list_ready_filter(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_ready_filter(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs),
@@ -334,16 +313,14 @@ def test_cli_state_list_ready_filter(repo_with_docs):
     result = runner.invoke(cli, [
         "state", "list", "--ready", "--root", str(repo_with_docs), "--format", "json",
     ])
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     ready_ids = [e["document_id"] for e in data["data"]["entries"]]
     assert "TEST-ADR-001" in ready_ids
     assert "TEST-ADR-002" not in ready_ids
 
 
-def test_cli_state_list_blocked_filter(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_blocked_filter(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--add-depends-on", "TEST-ADR-002", "--root", str(repo_with_docs),
@@ -352,13 +329,13 @@ def test_cli_state_list_blocked_filter(repo_with_docs):
         "state", "list", "--blocked", "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert len(data["data"]["entries"]) == 1
     assert data["data"]["entries"][0]["document_id"] == "TEST-ADR-001"
 
 
-def test_cli_state_list_priority_filter(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_priority_filter(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--priority", "P0", "--root", str(repo_with_docs),
@@ -372,13 +349,13 @@ def test_cli_state_list_priority_filter(repo_with_docs):
         "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert len(data["data"]["entries"]) == 1
     assert data["data"]["entries"][0]["document_id"] == "TEST-ADR-001"
 
 
-def test_cli_state_list_assignee_filter(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_assignee_filter(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--assignee", "agent:codex", "--root", str(repo_with_docs),
@@ -392,13 +369,13 @@ def test_cli_state_list_assignee_filter(repo_with_docs):
         "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert len(data["data"]["entries"]) == 1
     assert data["data"]["entries"][0]["assignee"] == "agent:codex"
 
 
-def test_cli_state_list_includes_derived_fields(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_includes_derived_fields(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs),
@@ -407,15 +384,15 @@ def test_cli_state_list_includes_derived_fields(repo_with_docs):
         "state", "list", "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     entry = data["data"]["entries"][0]
     assert "ready" in entry
     assert "open_blockers" in entry
     assert "unblocks" in entry
 
 
-def test_cli_state_list_includes_summary(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_includes_summary(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs),
@@ -424,14 +401,14 @@ def test_cli_state_list_includes_summary(repo_with_docs):
         "state", "list", "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert "summary" in data["data"]
     assert data["data"]["summary"]["total"] == 1
     assert data["data"]["summary"]["returned"] == 1
 
 
-def test_cli_state_list_conflicting_ready_flags(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_conflicting_ready_flags(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "list", "--ready", "--no-ready",
         "--root", str(repo_with_docs), "--format", "json",
@@ -440,8 +417,8 @@ def test_cli_state_list_conflicting_ready_flags(repo_with_docs):
     assert "E_INVALID_FILTER_VALUE" in result.output
 
 
-def test_cli_state_list_conflicting_blocked_flags(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_conflicting_blocked_flags(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "list", "--blocked", "--no-blocked",
         "--root", str(repo_with_docs), "--format", "json",
@@ -450,8 +427,8 @@ def test_cli_state_list_conflicting_blocked_flags(repo_with_docs):
     assert "E_INVALID_FILTER_VALUE" in result.output
 
 
-def test_cli_state_list_ready_and_blocked_rejected(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_ready_and_blocked_rejected(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "list", "--ready", "--blocked",
         "--root", str(repo_with_docs), "--format", "json",
@@ -460,8 +437,8 @@ def test_cli_state_list_ready_and_blocked_rejected(repo_with_docs):
     assert "E_INVALID_FILTER_VALUE" in result.output
 
 
-def test_cli_state_list_impl_state_filter(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_impl_state_filter(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "In Progress",
         "--root", str(repo_with_docs),
@@ -475,14 +452,14 @@ def test_cli_state_list_impl_state_filter(repo_with_docs):
         "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert len(data["data"]["entries"]) == 1
     assert data["data"]["entries"][0]["document_id"] == "TEST-ADR-001"
     assert data["data"]["entries"][0]["impl_state"] == "In Progress"
 
 
-def test_cli_state_list_impl_state_repeatable(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_impl_state_repeatable(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "In Progress",
         "--root", str(repo_with_docs),
@@ -496,7 +473,7 @@ def test_cli_state_list_impl_state_repeatable(repo_with_docs):
         "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert len(data["data"]["entries"]) == 2
 
 
@@ -514,8 +491,8 @@ class TestCliStateSetMixedMutationModeRejection:
         ["--add-blocked-by", "B", "--clear-blocked-by"],
         ["--remove-blocked-by", "B", "--clear-blocked-by"],
     ])
-    def test_cli_rejects_mixed_modes(self, repo_with_docs, flags):
-        runner = runner_no_mixed_stderr()
+    def test_cli_rejects_mixed_modes(self, repo_with_docs, flags, runner_no_mixed_stderr):
+        runner = runner_no_mixed_stderr
         result = runner.invoke(cli, [
             "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
             *flags, "--root", str(repo_with_docs), "--format", "json",
@@ -523,19 +500,17 @@ class TestCliStateSetMixedMutationModeRejection:
         assert result.exit_code != 0
         assert "STATE_MIXED_MUTATION_MODE" in result.output
 
-    def test_cli_single_replace_mode_succeeds(self, repo_with_docs):
-        runner = runner_no_mixed_stderr()
+    def test_cli_single_replace_mode_succeeds(self, repo_with_docs, runner_no_mixed_stderr):
+        runner = runner_no_mixed_stderr
         result = runner.invoke(cli, [
             "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
             "--depends-on", "TEST-ADR-002",
             "--root", str(repo_with_docs), "--format", "json",
         ])
-        assert result.exit_code == 0
-        data = json.loads(result.output.strip().splitlines()[-1])
-        assert data["success"] is True
+        assert_json_envelope(result, success=True)
 
-    def test_cli_single_additive_mode_succeeds(self, repo_with_docs):
-        runner = runner_no_mixed_stderr()
+    def test_cli_single_additive_mode_succeeds(self, repo_with_docs, runner_no_mixed_stderr):
+        runner = runner_no_mixed_stderr
         result = runner.invoke(cli, [
             "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
             "--add-depends-on", "TEST-ADR-002",
@@ -544,12 +519,12 @@ class TestCliStateSetMixedMutationModeRejection:
         assert result.exit_code == 0
 
 
-def test_cli_state_next_invalid_priority_warning_has_path(repo_with_docs):
+def test_cli_state_next_invalid_priority_warning_has_path(repo_with_docs, runner_no_mixed_stderr):
     """BV-2 regression: invalid priority warnings must include 'path' for schema compliance."""
     import jsonschema
     from pathlib import Path as P
 
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs),
@@ -564,7 +539,7 @@ def test_cli_state_next_invalid_priority_warning_has_path(repo_with_docs):
         "state", "next", "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    envelope = json.loads(result.output.strip().splitlines()[-1])
+    envelope = parse_last_json_line(result.output)
     assert envelope["success"] is True
     assert envelope["warnings"] is not None
     pip_w = [w for w in envelope["warnings"] if w["code"] == "STATE_INVALID_PRIORITY"]
@@ -582,7 +557,7 @@ def test_cli_state_next_invalid_priority_warning_has_path(repo_with_docs):
     jsonschema.validate(warning, issue_schema)
 
 
-def test_cli_state_next_invalid_priority_uses_dynamic_path(tmp_path):
+def test_cli_state_next_invalid_priority_uses_dynamic_path(tmp_path, runner_no_mixed_stderr):
     """Finding 3 regression: warning path must reflect the actual docs_root, not a hardcoded value."""
     import yaml
 
@@ -610,12 +585,12 @@ def test_cli_state_next_invalid_priority_uses_dynamic_path(tmp_path):
         encoding="utf-8",
     )
 
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "next", "--root", str(tmp_path), "--format", "json",
     ])
     assert result.exit_code == 0
-    envelope = json.loads(result.output.strip().splitlines()[-1])
+    envelope = parse_last_json_line(result.output)
     warning = envelope["warnings"][0]
     assert warning["path"] == "documentation/01-indices/project-state.yaml"
 
@@ -624,8 +599,8 @@ def test_cli_state_next_invalid_priority_uses_dynamic_path(tmp_path):
 # --clear exclusivity: --clear + other flags must be rejected
 # ---------------------------------------------------------------------------
 
-def test_cli_state_set_clear_with_impl_state_rejected(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_set_clear_with_impl_state_rejected(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--clear", "--impl-state", "Done",
         "--root", str(repo_with_docs), "--format", "json",
@@ -634,8 +609,8 @@ def test_cli_state_set_clear_with_impl_state_rejected(repo_with_docs):
     assert "STATE_CLEAR_MUTATION_CONFLICT" in result.output
 
 
-def test_cli_state_set_clear_with_notes_rejected(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_set_clear_with_notes_rejected(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--clear", "--notes", "x",
         "--root", str(repo_with_docs), "--format", "json",
@@ -644,8 +619,8 @@ def test_cli_state_set_clear_with_notes_rejected(repo_with_docs):
     assert "STATE_CLEAR_MUTATION_CONFLICT" in result.output
 
 
-def test_cli_state_set_clear_with_priority_rejected(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_set_clear_with_priority_rejected(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--clear", "--priority", "P0",
         "--root", str(repo_with_docs), "--format", "json",
@@ -654,8 +629,8 @@ def test_cli_state_set_clear_with_priority_rejected(repo_with_docs):
     assert "STATE_CLEAR_MUTATION_CONFLICT" in result.output
 
 
-def test_cli_state_set_clear_alone_succeeds(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_set_clear_alone_succeeds(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs), "--format", "json",
@@ -666,7 +641,7 @@ def test_cli_state_set_clear_alone_succeeds(repo_with_docs):
         "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert data["data"]["action"] == "clear"
     assert data["data"]["document_id"] == "TEST-ADR-001"
 
@@ -675,8 +650,8 @@ def test_cli_state_set_clear_alone_succeeds(repo_with_docs):
 # Markdown escaping for user-controlled planning fields (Issue 2)
 # ---------------------------------------------------------------------------
 
-def test_cli_state_next_md_escapes_assignee_bold(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_next_md_escapes_assignee_bold(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--assignee", "**bold**", "--root", str(repo_with_docs), "--format", "json",
@@ -689,8 +664,8 @@ def test_cli_state_next_md_escapes_assignee_bold(repo_with_docs):
     assert "**bold**" not in result.output.replace("\\*", "")
 
 
-def test_cli_state_next_md_escapes_next_action_link(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_next_md_escapes_next_action_link(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--next-action", "[click](http://evil)", "--root", str(repo_with_docs), "--format", "json",
@@ -704,8 +679,8 @@ def test_cli_state_next_md_escapes_next_action_link(repo_with_docs):
     assert raw_markdown_link not in result.output
 
 
-def test_cli_state_blockers_md_escapes_assignee_html(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_blockers_md_escapes_assignee_html(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--assignee", "<img onerror=alert(1)>",
@@ -720,8 +695,8 @@ def test_cli_state_blockers_md_escapes_assignee_html(repo_with_docs):
     assert "&lt;img" in result.output
 
 
-def test_cli_state_list_md_escapes_assignee_html(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_md_escapes_assignee_html(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--assignee", "<img src=x onerror=alert(1)>",
@@ -735,8 +710,8 @@ def test_cli_state_list_md_escapes_assignee_html(repo_with_docs):
     assert "&lt;img" in result.output
 
 
-def test_cli_state_next_md_escapes_backslash(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_next_md_escapes_backslash(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--next-action", "test \\ text", "--root", str(repo_with_docs), "--format", "json",
@@ -748,8 +723,8 @@ def test_cli_state_next_md_escapes_backslash(repo_with_docs):
     assert "\\\\ text" in result.output
 
 
-def test_cli_state_list_md_escapes_warning_message(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_md_escapes_warning_message(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs), "--format", "json",
@@ -763,8 +738,8 @@ def test_cli_state_list_md_escapes_warning_message(repo_with_docs):
     assert "P*bold*" not in result.output.replace("\\*", "")
 
 
-def test_cli_state_next_md_escapes_warning_message(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_next_md_escapes_warning_message(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs), "--format", "json",
@@ -778,8 +753,8 @@ def test_cli_state_next_md_escapes_warning_message(repo_with_docs):
     assert "P*bold*" not in result.output.replace("\\*", "")
 
 
-def test_cli_state_blockers_md_escapes_warning_message(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_blockers_md_escapes_warning_message(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--add-depends-on", "TEST-ADR-002",
@@ -794,8 +769,8 @@ def test_cli_state_blockers_md_escapes_warning_message(repo_with_docs):
     assert "P*bold*" not in result.output.replace("\\*", "")
 
 
-def test_cli_state_blockers_md_escapes_document_id_heading(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_blockers_md_escapes_document_id_heading(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--add-depends-on", "TEST-ADR-002",
@@ -809,8 +784,10 @@ def test_cli_state_blockers_md_escapes_document_id_heading(repo_with_docs):
     assert any("TEST-ADR-001" in l for l in heading_line)
 
 
-def test_cli_state_blockers_md_escapes_impl_state_in_blocker_detail(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_blockers_md_escapes_impl_state_in_blocker_detail(
+    repo_with_docs, runner_no_mixed_stderr
+):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "In Progress",
         "--add-depends-on", "TEST-ADR-002",
@@ -836,8 +813,8 @@ def _corrupt_priority_in_state(repo_with_docs, doc_id="TEST-ADR-001", priority="
     state_file.write_text(_yaml.dump(raw, default_flow_style=False, allow_unicode=True, sort_keys=True))
 
 
-def test_cli_state_list_json_includes_validation_warnings(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_list_json_includes_validation_warnings(repo_with_docs, runner_no_mixed_stderr):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs), "--format", "json",
@@ -846,16 +823,16 @@ def test_cli_state_list_json_includes_validation_warnings(repo_with_docs):
     result = runner.invoke(cli, [
         "state", "list", "--root", str(repo_with_docs), "--format", "json",
     ])
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert "warnings" in data
     codes = [w["code"] for w in data["warnings"]]
     assert "STATE_INVALID_PRIORITY" in codes
 
 
-def test_cli_state_blockers_json_includes_validation_warnings(repo_with_docs):
-    runner = runner_no_mixed_stderr()
+def test_cli_state_blockers_json_includes_validation_warnings(
+    repo_with_docs, runner_no_mixed_stderr
+):
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--add-depends-on", "TEST-ADR-002",
@@ -865,17 +842,15 @@ def test_cli_state_blockers_json_includes_validation_warnings(repo_with_docs):
     result = runner.invoke(cli, [
         "state", "blockers", "--root", str(repo_with_docs), "--format", "json",
     ])
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert "warnings" in data
     codes = [w["code"] for w in data["warnings"]]
     assert "STATE_INVALID_PRIORITY" in codes
 
 
-def test_cli_state_list_md_includes_validation_warnings(repo_with_docs):
+def test_cli_state_list_md_includes_validation_warnings(repo_with_docs, runner_no_mixed_stderr):
     """Human-readable md output surfaces validation warnings."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs), "--format", "json",
@@ -889,9 +864,9 @@ def test_cli_state_list_md_includes_validation_warnings(repo_with_docs):
     assert "## Warnings" in result.output
 
 
-def test_cli_state_blockers_md_includes_validation_warnings(repo_with_docs):
+def test_cli_state_blockers_md_includes_validation_warnings(repo_with_docs, runner_no_mixed_stderr):
     """Human-readable md blockers output surfaces validation warnings."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--add-depends-on", "TEST-ADR-002",
@@ -906,9 +881,11 @@ def test_cli_state_blockers_md_includes_validation_warnings(repo_with_docs):
     assert "## Warnings" in result.output
 
 
-def test_cli_state_list_output_file_orders_text_before_warnings(repo_with_docs, tmp_path):
+def test_cli_state_list_output_file_orders_text_before_warnings(
+    repo_with_docs, tmp_path, runner_no_mixed_stderr
+):
     """state list --output keeps warnings after the main text artifact."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs), "--format", "json",
@@ -925,9 +902,11 @@ def test_cli_state_list_output_file_orders_text_before_warnings(repo_with_docs,
     assert artifact.index("No entries found") < artifact.index("Warning (STATE_INVALID_PRIORITY)")
 
 
-def test_cli_state_next_output_file_orders_text_before_warnings(repo_with_docs, tmp_path):
+def test_cli_state_next_output_file_orders_text_before_warnings(
+    repo_with_docs, tmp_path, runner_no_mixed_stderr
+):
     """state next --output keeps warnings after the main text artifact."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--root", str(repo_with_docs), "--format", "json",
@@ -944,9 +923,11 @@ def test_cli_state_next_output_file_orders_text_before_warnings(repo_with_docs,
     assert artifact.index("No ready items") < artifact.index("Warning (STATE_INVALID_PRIORITY)")
 
 
-def test_cli_state_blockers_output_file_orders_text_before_warnings(repo_with_docs, tmp_path):
+def test_cli_state_blockers_output_file_orders_text_before_warnings(
+    repo_with_docs, tmp_path, runner_no_mixed_stderr
+):
     """state blockers --output keeps warnings after the main text artifact."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--add-depends-on", "TEST-ADR-002",
@@ -964,9 +945,9 @@ def test_cli_state_blockers_output_file_orders_text_before_warnings(repo_with_do
     assert artifact.index("Summary:") < artifact.index("Warning (STATE_INVALID_PRIORITY)")
 
 
-def test_cli_state_set_md_escapes_assignee(repo_with_docs):
+def test_cli_state_set_md_escapes_assignee(repo_with_docs, runner_no_mixed_stderr):
     """User-controlled fields in state set md output are escaped."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--assignee", "**bold**",
@@ -976,11 +957,11 @@ def test_cli_state_set_md_escapes_assignee(repo_with_docs):
     assert "\\*\\*bold\\*\\*" in result.output
 
 
-def test_cli_state_list_tolerates_broken_repo_layout(repo_with_docs):
+def test_cli_state_list_tolerates_broken_repo_layout(repo_with_docs, runner_no_mixed_stderr):
     """state list succeeds with canonical fallback vocabularies when layout fails."""
     from unittest import mock
 
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     with mock.patch(
         "meminit.core.services.repo_config.load_repo_layout",
         side_effect=ValueError("broken config"),
@@ -988,15 +969,13 @@ def test_cli_state_list_tolerates_broken_repo_layout(repo_with_docs):
         result = runner.invoke(cli, [
             "state", "list", "--root", str(repo_with_docs), "--format", "json",
         ])
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert "Not Started" in data["data"]["valid_impl_states"]
 
 
-def test_cli_state_set_clears_notes_with_empty_string(repo_with_docs):
+def test_cli_state_set_clears_notes_with_empty_string(repo_with_docs, runner_no_mixed_stderr):
     """--notes '' clears an existing notes field."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--notes", "some notes",
@@ -1006,15 +985,13 @@ def test_cli_state_set_clears_notes_with_empty_string(repo_with_docs):
         "state", "set", "TEST-ADR-001", "--notes", "",
         "--root", str(repo_with_docs), "--format", "json",
     ])
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert data["data"]["notes"] == ""
 
 
-def test_cli_state_set_md_renders_warnings(repo_with_docs):
+def test_cli_state_set_md_renders_warnings(repo_with_docs, runner_no_mixed_stderr):
     """state set --format md surfaces warnings (e.g. undefined dependency)."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--add-depends-on", "TEST-ADR-999",
@@ -1025,9 +1002,9 @@ def test_cli_state_set_md_renders_warnings(repo_with_docs):
     assert "STATE_UNDEFINED_DEPENDENCY" in result.output or "STATE\\_UNDEFINED\\_DEPENDENCY" in result.output
 
 
-def test_cli_state_set_console_renders_warnings(repo_with_docs):
+def test_cli_state_set_console_renders_warnings(repo_with_docs, runner_no_mixed_stderr):
     """state set default (console) format surfaces warnings."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
         "--add-depends-on", "TEST-ADR-999",
@@ -1038,9 +1015,9 @@ def test_cli_state_set_console_renders_warnings(repo_with_docs):
     assert "STATE_UNDEFINED_DEPENDENCY" in result.output
 
 
-def test_cli_state_list_json_puts_advisories_in_envelope(repo_with_docs):
+def test_cli_state_list_json_puts_advisories_in_envelope(repo_with_docs, runner_no_mixed_stderr):
     """state list --format json exposes advisories at the envelope level."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Done",
         "--add-depends-on", "TEST-ADR-002",
@@ -1054,15 +1031,15 @@ def test_cli_state_list_json_puts_advisories_in_envelope(repo_with_docs):
         "state", "list", "--root", str(repo_with_docs), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     advice_codes = [a["code"] for a in data["advice"]]
     assert "STATE_DEPENDENCY_STATUS_CONFLICT" in advice_codes
     assert "advice" not in data["data"]
 
 
-def test_cli_state_list_md_renders_advisories(repo_with_docs):
+def test_cli_state_list_md_renders_advisories(repo_with_docs, runner_no_mixed_stderr):
     """state list --format md surfaces advisories (e.g. status conflict)."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Done",
         "--add-depends-on", "TEST-ADR-002",
@@ -1080,9 +1057,9 @@ def test_cli_state_list_md_renders_advisories(repo_with_docs):
     assert "STATE_DEPENDENCY_STATUS_CONFLICT" in result.output or "STATE\\_DEPENDENCY\\_STATUS\\_CONFLICT" in result.output
 
 
-def test_cli_state_list_console_renders_advisories(repo_with_docs):
+def test_cli_state_list_console_renders_advisories(repo_with_docs, runner_no_mixed_stderr):
     """state list default (console) format surfaces advisories."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Done",
         "--add-depends-on", "TEST-ADR-002",
@@ -1099,7 +1076,9 @@ def test_cli_state_list_console_renders_advisories(repo_with_docs):
     assert "Advisory" in result.output
 
 
-def test_cli_state_list_accepts_initialized_top_level_templates_v2_config(tmp_path):
+def test_cli_state_list_accepts_initialized_top_level_templates_v2_config(
+    tmp_path, runner_no_mixed_stderr
+):
     """State commands accept the top-level Templates v2 config written by init."""
     gov_dir = tmp_path / "docs" / "00-governance"
     gov_dir.mkdir(parents=True)
@@ -1114,19 +1093,17 @@ def test_cli_state_list_accepts_initialized_top_level_templates_v2_config(tmp_pa
         "    description: Architecture Decision Record\n",
         encoding="utf-8",
     )
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     result = runner.invoke(cli, [
         "state", "list", "--root", str(tmp_path), "--format", "json",
     ])
-    assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
-    assert data["success"] is True
+    data = assert_json_envelope(result, success=True)
     assert data["data"]["entries"] == []
 
 
-def test_cli_state_list_summary_counts_respect_filters(repo_with_docs):
+def test_cli_state_list_summary_counts_respect_filters(repo_with_docs, runner_no_mixed_stderr):
     """Summary counts (ready, blocked) should be scoped to the active filter."""
-    runner = runner_no_mixed_stderr()
+    runner = runner_no_mixed_stderr
     # Entry 1: Ready, Assignee Alice
     runner.invoke(cli, [
         "state", "set", "TEST-ADR-001", "--impl-state", "Not Started",
@@ -1142,7 +1119,7 @@ def test_cli_state_list_summary_counts_respect_filters(repo_with_docs):
     result = runner.invoke(cli, [
         "state", "list", "--root", str(repo_with_docs), "--format", "json",
     ])
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert data["data"]["summary"]["ready"] == 2
 
     # Filtered by Bob: 1 ready (TEST-ADR-002 only)
@@ -1150,7 +1127,7 @@ def test_cli_state_list_summary_counts_respect_filters(repo_with_docs):
     result = runner.invoke(cli, [
         "state", "list", "--assignee", "Bob", "--root", str(repo_with_docs), "--format", "json",
     ])
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     assert len(data["data"]["entries"]) == 1
     assert data["data"]["entries"][0]["document_id"] == "TEST-ADR-002"
     assert data["data"]["summary"]["ready"] == 1
@@ -5,7 +5,6 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
-from click.testing import CliRunner
 from jsonschema import Draft7Validator
 
 from meminit.cli.main import cli
@@ -39,9 +38,9 @@ def test_stream_schema_copies_are_identical():
     assert docs == packaged
 
 
-def test_index_ndjson_outputs_header_items_and_summary(tmp_path):
+def test_index_ndjson_outputs_header_items_and_summary(tmp_path, runner):
     create_initialized_repo(tmp_path)
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli, ["index", "--root", str(tmp_path), "--format", "ndjson"]
     )
     assert result.exit_code == 0, result.output
@@ -55,9 +54,8 @@ def test_index_ndjson_outputs_header_items_and_summary(tmp_path):
         assert not list(_validator().iter_errors(record))
 
 
-def test_index_ndjson_reports_incremental_on_second_run(tmp_path):
+def test_index_ndjson_reports_incremental_on_second_run(tmp_path, runner):
     create_initialized_repo(tmp_path)
-    runner = CliRunner()
 
     first = runner.invoke(
         cli, ["index", "--root", str(tmp_path), "--format", "ndjson"]
@@ -73,8 +71,8 @@ def test_index_ndjson_reports_incremental_on_second_run(tmp_path):
     assert summary["data"]["rebuild"]["mode"] == "incremental"
 
 
-def test_scan_ndjson_summary_preserves_diagnostics(tmp_path):
-    result = CliRunner().invoke(
+def test_scan_ndjson_summary_preserves_diagnostics(tmp_path, runner):
+    result = runner.invoke(
         cli, ["scan", "--root", str(tmp_path), "--format", "ndjson"]
     )
     assert result.exit_code == 0, result.output
@@ -87,13 +85,13 @@ def test_scan_ndjson_summary_preserves_diagnostics(tmp_path):
     assert "configured_namespaces" in summary
 
 
-def test_scan_ndjson_emits_real_file_items(tmp_path):
+def test_scan_ndjson_emits_real_file_items(tmp_path, runner):
     create_initialized_repo(tmp_path)
     extra_file = tmp_path / "docs" / "20-specs" / "spec-001-test.md"
     extra_file.parent.mkdir(parents=True, exist_ok=True)
     extra_file.write_text("# Spec\n", encoding="utf-8")
 
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli, ["scan", "--root", str(tmp_path), "--format", "ndjson"]
     )
     assert result.exit_code == 0, result.output
@@ -114,7 +112,7 @@ def test_scan_ndjson_emits_real_file_items(tmp_path):
     assert records[-1]["counts"]["file"] == len(file_items)
 
 
-def test_scan_ndjson_summary_preserves_overlapping_namespace_diagnostics(tmp_path):
+def test_scan_ndjson_summary_preserves_overlapping_namespace_diagnostics(tmp_path, runner):
     (tmp_path / "docs" / "00-governance" / "org").mkdir(parents=True, exist_ok=True)
     (tmp_path / "docs" / "readme.md").write_text("# Root doc\n", encoding="utf-8")
     (tmp_path / "docs" / "00-governance" / "org" / "org-gov-001.md").write_text(
@@ -134,7 +132,7 @@ def test_scan_ndjson_summary_preserves_overlapping_namespace_diagnostics(tmp_pat
         encoding="utf-8",
     )
 
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli, ["scan", "--root", str(tmp_path), "--format", "ndjson"]
     )
     assert result.exit_code == 0, result.output
@@ -149,9 +147,9 @@ def test_scan_ndjson_summary_preserves_overlapping_namespace_diagnostics(tmp_pat
     )
 
 
-def test_ndjson_header_uses_real_timestamp(tmp_path):
+def test_ndjson_header_uses_real_timestamp(tmp_path, runner):
     create_initialized_repo(tmp_path)
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli,
         [
             "context",
@@ -171,7 +169,7 @@ def test_ndjson_header_uses_real_timestamp(tmp_path):
     assert delta_seconds < 60
 
 
-def test_index_ndjson_graph_fatal_emits_terminal_error(tmp_path):
+def test_index_ndjson_graph_fatal_emits_terminal_error(tmp_path, runner):
     create_initialized_repo(tmp_path)
     (tmp_path / "docs" / "45-adr" / "adr-dup.md").write_text(
         "---\n"
@@ -191,7 +189,7 @@ def test_index_ndjson_graph_fatal_emits_terminal_error(tmp_path):
         encoding="utf-8",
     )
 
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli, ["index", "--root", str(tmp_path), "--format", "ndjson"]
     )
     assert result.exit_code != 0
@@ -201,9 +199,9 @@ def test_index_ndjson_graph_fatal_emits_terminal_error(tmp_path):
     assert records[-1]["error"]["code"] == ErrorCode.GRAPH_DUPLICATE_DOCUMENT_ID.value
 
 
-def test_context_ndjson_requires_deep(tmp_path):
+def test_context_ndjson_requires_deep(tmp_path, runner):
     create_initialized_repo(tmp_path)
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli, ["context", "--root", str(tmp_path), "--format", "ndjson"]
     )
     assert result.exit_code == 64
@@ -212,10 +210,10 @@ def test_context_ndjson_requires_deep(tmp_path):
     assert records[-1]["error"]["code"] == ErrorCode.STREAM_UNSUPPORTED_FORMAT.value
 
 
-def test_context_ndjson_requires_deep_respects_output_path(tmp_path):
+def test_context_ndjson_requires_deep_respects_output_path(tmp_path, runner):
     create_initialized_repo(tmp_path)
     output = tmp_path / "context.ndjson"
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli,
         [
             "context",
@@ -234,8 +232,8 @@ def test_context_ndjson_requires_deep_respects_output_path(tmp_path):
     assert records[-1]["error"]["code"] == ErrorCode.STREAM_UNSUPPORTED_FORMAT.value
 
 
-def test_check_ndjson_emits_structured_unsupported_error(tmp_path):
-    result = CliRunner().invoke(
+def test_check_ndjson_emits_structured_unsupported_error(tmp_path, runner):
+    result = runner.invoke(
         cli, ["check", "--root", str(tmp_path), "--format", "ndjson"]
     )
     assert result.exit_code == 64
@@ -245,9 +243,9 @@ def test_check_ndjson_emits_structured_unsupported_error(tmp_path):
     assert records[-1]["error"]["code"] == ErrorCode.STREAM_UNSUPPORTED_FORMAT.value
 
 
-def test_context_deep_ndjson_includes_documents(tmp_path):
+def test_context_deep_ndjson_includes_documents(tmp_path, runner):
     create_initialized_repo(tmp_path)
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli, ["context", "--root", str(tmp_path), "--deep", "--format", "ndjson"]
     )
     assert result.exit_code == 0, result.output
@@ -275,7 +273,7 @@ def test_context_deep_ndjson_includes_documents(tmp_path):
 
 
 @patch("meminit.cli.main.ContextRepositoryUseCase")
-def test_context_deep_ndjson_streams_documents_from_use_case(mock_use_case, tmp_path):
+def test_context_deep_ndjson_streams_documents_from_use_case(mock_use_case, tmp_path, runner):
     (tmp_path / "docops.config.yaml").write_text(
         "project_name: Example\nrepo_prefix: EXAMPLE\ndocops_version: '2.0'\n",
         encoding="utf-8",
@@ -312,7 +310,7 @@ def test_context_deep_ndjson_streams_documents_from_use_case(mock_use_case, tmp_
         ],
     )
 
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli, ["context", "--root", str(tmp_path), "--deep", "--format", "ndjson"]
     )
 
@@ -334,11 +332,11 @@ def test_context_deep_ndjson_streams_documents_from_use_case(mock_use_case, tmp_
     ]
 
 
-def test_index_ndjson_allows_external_output_path(tmp_path):
+def test_index_ndjson_allows_external_output_path(tmp_path, runner):
     root = tmp_path / "repo"
     create_initialized_repo(root)
     output = tmp_path / "index.ndjson"
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli,
         [
             "index",
@@ -357,9 +355,9 @@ def test_index_ndjson_allows_external_output_path(tmp_path):
     assert records[-1]["success"] is True
 
 
-def test_index_ndjson_summary_preserves_metadata_for_artifacts(tmp_path):
+def test_index_ndjson_summary_preserves_metadata_for_artifacts(tmp_path, runner):
     create_initialized_repo(tmp_path)
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli,
         [
             "index",
@@ -384,11 +382,11 @@ def test_index_ndjson_summary_preserves_metadata_for_artifacts(tmp_path):
     assert "edges" not in summary
 
 
-def test_index_ndjson_rejects_unsafe_output_path(tmp_path):
+def test_index_ndjson_rejects_unsafe_output_path(tmp_path, runner):
     create_initialized_repo(tmp_path)
     output = tmp_path / "unsafe" / "index.ndjson"
     with patch("meminit.cli.streaming.is_safe_cli_output_path", return_value=False):
-        result = CliRunner().invoke(
+        result = runner.invoke(
             cli,
             [
                 "index",
@@ -409,9 +407,9 @@ def test_index_ndjson_rejects_unsafe_output_path(tmp_path):
     assert records[-1]["error"]["code"] == ErrorCode.PATH_ESCAPE.value
 
 
-def test_index_explain_cache_ndjson_is_rejected(tmp_path):
+def test_index_explain_cache_ndjson_is_rejected(tmp_path, runner):
     create_initialized_repo(tmp_path)
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli,
         [
             "index",
@@ -432,9 +430,9 @@ def test_index_explain_cache_ndjson_is_rejected(tmp_path):
     assert records[-1]["error"]["code"] == ErrorCode.STREAM_UNSUPPORTED_FORMAT.value
 
 
-def test_check_ndjson_invalid_correlation_id_is_structured(tmp_path):
+def test_check_ndjson_invalid_correlation_id_is_structured(tmp_path, runner):
     create_initialized_repo(tmp_path)
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli,
         [
             "check",
@@ -456,12 +454,12 @@ def test_check_ndjson_invalid_correlation_id_is_structured(tmp_path):
     assert records[-1]["error"]["code"] == ErrorCode.INVALID_FLAG_COMBINATION.value
 
 
-def test_index_ndjson_open_failure_emits_terminal_error(tmp_path):
+def test_index_ndjson_open_failure_emits_terminal_error(tmp_path, runner):
     create_initialized_repo(tmp_path)
     output = tmp_path / "index.ndjson"
 
     with patch("meminit.cli.streaming.Path.open", side_effect=OSError("boom")):
-        result = CliRunner().invoke(
+        result = runner.invoke(
             cli,
             [
                 "index",
@@ -481,12 +479,12 @@ def test_index_ndjson_open_failure_emits_terminal_error(tmp_path):
     assert records[-1]["error"]["code"] == ErrorCode.UNKNOWN_ERROR.value
 
 
-def test_scan_ndjson_pre_streaming_exception_uses_command_error_handler(tmp_path):
+def test_scan_ndjson_pre_streaming_exception_uses_command_error_handler(tmp_path, runner):
     with patch(
         "meminit.cli.main.ScanRepositoryUseCase.execute",
         side_effect=RuntimeError("boom"),
     ):
-        result = CliRunner().invoke(
+        result = runner.invoke(
             cli, ["scan", "--root", str(tmp_path), "--format", "ndjson"]
         )
 
@@ -497,7 +495,7 @@ def test_scan_ndjson_pre_streaming_exception_uses_command_error_handler(tmp_path
     assert records[-1]["error"]["code"] == ErrorCode.UNKNOWN_ERROR.value
 
 
-def test_index_ndjson_emits_failed_summary_for_error_severity_state(tmp_path):
+def test_index_ndjson_emits_failed_summary_for_error_severity_state(tmp_path, runner):
     root = tmp_path / "repo"
     create_initialized_repo(root)
     state_dir = root / "docs" / "01-indices"
@@ -511,7 +509,7 @@ def test_index_ndjson_emits_failed_summary_for_error_severity_state(tmp_path):
         encoding="utf-8",
     )
 
-    result = CliRunner().invoke(
+    result = runner.invoke(
         cli, ["index", "--root", str(root), "--format", "ndjson"]
     )
     assert result.exit_code == 1, result.output
@@ -524,8 +522,8 @@ def test_index_ndjson_emits_failed_summary_for_error_severity_state(tmp_path):
     )
 
 
-def test_capabilities_advertises_streaming(tmp_path):
-    result = CliRunner().invoke(cli, ["capabilities", "--format", "json"])
+def test_capabilities_advertises_streaming(tmp_path, runner):
+    result = runner.invoke(cli, ["capabilities", "--format", "json"])
     assert result.exit_code == 0, result.output
     payload = json.loads(result.output)
     assert payload["data"]["features"]["streaming"] is True
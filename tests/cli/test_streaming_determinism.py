@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import json
 
-from click.testing import CliRunner
-
 from meminit.cli.main import cli
 
 
@@ -22,13 +20,12 @@ def _stable_non_header_lines(output: str) -> list[str]:
     return lines
 
 
-def test_streaming_outputs_are_deterministic_modulo_run_id(initialized_repo):
+def test_streaming_outputs_are_deterministic_modulo_run_id(initialized_repo, runner):
     commands = [
         ["index", "--root", str(initialized_repo), "--format", "ndjson"],
         ["scan", "--root", str(initialized_repo), "--format", "ndjson"],
         ["context", "--root", str(initialized_repo), "--deep", "--format", "ndjson"],
     ]
-    runner = CliRunner()
 
     for command in commands:
         warmup = runner.invoke(cli, command)
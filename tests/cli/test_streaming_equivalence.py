@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import json
 
-from click.testing import CliRunner
-
 from meminit.cli.main import _scan_suggestion_items, cli
 from tests.cli.streaming_helpers import records
 
@@ -16,8 +14,7 @@ def _items_by_kind(stream_records, kind: str) -> list[dict]:
     ]
 
 
-def test_index_json_and_ndjson_are_equivalent(initialized_repo):
-    runner = CliRunner()
+def test_index_json_and_ndjson_are_equivalent(initialized_repo, runner):
     json_result = runner.invoke(
         cli, ["index", "--root", str(initialized_repo), "--format", "json"]
     )
@@ -45,8 +42,7 @@ def test_index_json_and_ndjson_are_equivalent(initialized_repo):
     assert summary["edge_count"] == envelope["data"]["edge_count"]
 
 
-def test_scan_json_and_ndjson_summaries_are_equivalent(initialized_repo):
-    runner = CliRunner()
+def test_scan_json_and_ndjson_summaries_are_equivalent(initialized_repo, runner):
     json_result = runner.invoke(
         cli, ["scan", "--root", str(initialized_repo), "--format", "json"]
     )
@@ -78,8 +74,7 @@ def test_scan_suggestions_sort_by_severity_code_and_path():
     ]
 
 
-def test_context_json_and_ndjson_are_equivalent(initialized_repo):
-    runner = CliRunner()
+def test_context_json_and_ndjson_are_equivalent(initialized_repo, runner):
     json_result = runner.invoke(
         cli, ["context", "--root", str(initialized_repo), "--deep", "--format", "json"]
     )
@@ -1,18 +1,14 @@
 from __future__ import annotations
 
-import inspect
-
 from click.testing import CliRunner
 
 from meminit.cli.main import cli
 from tests.cli.streaming_helpers import records
+from tests.helpers import NO_MIXED_STDERR_KWARGS
 
 
 def _runner() -> CliRunner:
-    kwargs = {}
-    if "mix_stderr" in inspect.signature(CliRunner).parameters:
-        kwargs["mix_stderr"] = False
-    return CliRunner(**kwargs)
+    return CliRunner(**NO_MIXED_STDERR_KWARGS)
 
 
 def test_streaming_commands_emit_only_json_lines_on_stdout(
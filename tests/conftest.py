@@ -1,8 +1,10 @@
 """Shared pytest fixtures."""
 
 import pytest
+from click.testing import CliRunner
 from meminit.core.services.output_formatter import _reset_schema_cache
 
+from tests.helpers import NO_MIXED_STDERR_KWARGS
 from tests.helpers import parse_first_json_line  # noqa: F401 — re-export for backward compat
 
 
@@ -12,3 +14,15 @@ def reset_schema_cache():
     _reset_schema_cache()
     yield
     _reset_schema_cache()
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Shared CliRunner; invoke() isolates each call, so one instance suffices."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def runner_no_mixed_stderr() -> CliRunner:
+    """Shared CliRunner that keeps stderr out of result.output on older Click."""
+    return CliRunner(**NO_MIXED_STDERR_KWARGS)
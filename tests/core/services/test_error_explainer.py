@@ -1,7 +1,5 @@
 """Tests for the error explanation registry and use case."""
 
-from click.testing import CliRunner
-
 from meminit.core.services.error_codes import ERROR_EXPLANATIONS, ErrorCode
 from meminit.core.use_cases.explain_error import ExplainErrorUseCase
 from meminit.cli.main import cli
@@ -95,9 +93,8 @@ def test_list_codes_includes_all():
 # ---------------------------------------------------------------------------
 
 
-def test_explain_invalid_code_puts_requested_code_in_data():
+def test_explain_invalid_code_puts_requested_code_in_data(runner):
     """Invalid error code must place requested_code in data, not error.details."""
-    runner = CliRunner()
     result = runner.invoke(cli, ["explain", "NONEXISTENT_CODE", "--format", "json"])
     assert result.exit_code != 0
     data = parse_first_json_line(result.output)
@@ -107,9 +104,8 @@ def test_explain_invalid_code_puts_requested_code_in_data():
     assert data["error"]["code"] == "UNKNOWN_ERROR_CODE"
 
 
-def test_explain_valid_code_has_no_error_object():
+def test_explain_valid_code_has_no_error_object(runner):
     """Valid error code must not include an error object in the envelope."""
-    runner = CliRunner()
     result = runner.invoke(cli, ["explain", "DUPLICATE_ID", "--format", "json"])
     assert result.exit_code == 0
     data = parse_first_json_line(result.output)
@@ -1,5 +1,7 @@
 """Tests for the exit_codes module."""
 
+from types import SimpleNamespace
+
 import pytest
 from meminit.core.services.error_codes import ErrorCode
 from meminit.core.services.exit_codes import (
@@ -9,6 +11,7 @@ from meminit.core.services.exit_codes import (
     EX_NOINPUT,
     EX_NOPERM,
     EX_USAGE,
+    _sysexit,
     exit_code_for_error,
 )
 
@@ -103,3 +106,18 @@ def test_exit_code_for_error_fallback():
     assert exit_code_for_error(None) == EX_DATAERR  # type: ignore
     assert exit_code_for_error("NOT_A_CODE") == EX_DATAERR  # type: ignore
     assert exit_code_for_error(object()) == EX_DATAERR  # type: ignore
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("EX_USAGE", 64),
+        ("EX_DATAERR", 65),
+        ("EX_NOINPUT", 66),
+        ("EX_CANTCREAT", 73),
+        ("EX_NOPERM", 77),
+    ],
+)
+def test_sysexit_falls_back_when_platform_lacks_constant(name, expected):
+    """Platforms without os.EX_* (e.g. Windows) still get the sysexits.h values."""
+    assert _sysexit(name, source=SimpleNamespace()) == expected
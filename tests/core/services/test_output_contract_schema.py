@@ -1,14 +1,13 @@
-import inspect
 import json
 from pathlib import Path
 
-from click.testing import CliRunner
 from jsonschema import Draft7Validator
 
 from meminit.cli.main import cli
+from tests.helpers import parse_last_json_line
 
 
-def test_check_json_output_conforms_to_agent_schema(tmp_path):
+def test_check_json_output_conforms_to_agent_schema(tmp_path, runner_no_mixed_stderr):
     (tmp_path / "docs" / "00-governance").mkdir(parents=True)
     (tmp_path / "docs" / "45-adr").mkdir(parents=True)
 
@@ -74,11 +73,7 @@ docops_version: 2.0
     )
     schema = json.loads(schema_path.read_text(encoding="utf-8"))
 
-    runner_kwargs = {}
-    if "mix_stderr" in inspect.signature(CliRunner).parameters:
-        runner_kwargs["mix_stderr"] = False
-    runner = CliRunner(**runner_kwargs)
-    result = runner.invoke(
+    result = runner_no_mixed_stderr.invoke(
         cli,
         [
             "check",
@@ -91,12 +86,14 @@ docops_version: 2.0
     )
 
     assert result.exit_code == 0
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     errors = sorted(Draft7Validator(schema).iter_errors(payload), key=str)
     assert not errors
 
 
-def test_check_json_failure_without_error_conforms_to_agent_schema(tmp_path):
+def test_check_json_failure_without_error_conforms_to_agent_schema(
+    tmp_path, runner_no_mixed_stderr
+):
     (tmp_path / "docs" / "00-governance").mkdir(parents=True)
     (tmp_path / "docs" / "45-adr").mkdir(parents=True)
 
@@ -162,11 +159,7 @@ docops_version: 2.0
     )
     schema = json.loads(schema_path.read_text(encoding="utf-8"))
 
-    runner_kwargs = {}
-    if "mix_stderr" in inspect.signature(CliRunner).parameters:
-        runner_kwargs["mix_stderr"] = False
-    runner = CliRunner(**runner_kwargs)
-    result = runner.invoke(
+    result = runner_no_mixed_stderr.invoke(
         cli,
         [
             "check",
@@ -179,7 +172,7 @@ docops_version: 2.0
     )
 
     assert result.exit_code != 0
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     assert payload["success"] is False
     assert "error" not in payload
     assert "violations" in payload
@@ -187,7 +180,7 @@ docops_version: 2.0
     assert not errors
 
 
-def test_check_json_output_is_deterministic_ignoring_run_id(tmp_path):
+def test_check_json_output_is_deterministic_ignoring_run_id(tmp_path, runner_no_mixed_stderr):
     (tmp_path / "docs" / "00-governance").mkdir(parents=True)
     (tmp_path / "docs" / "45-adr").mkdir(parents=True)
 
@@ -248,12 +241,7 @@ docops_version: 2.0
         encoding="utf-8",
     )
 
-    runner_kwargs = {}
-    if "mix_stderr" in inspect.signature(CliRunner).parameters:
-        runner_kwargs["mix_stderr"] = False
-    runner = CliRunner(**runner_kwargs)
-
-    result1 = runner.invoke(
+    result1 = runner_no_mixed_stderr.invoke(
         cli,
         [
             "check",
@@ -265,7 +253,7 @@ docops_version: 2.0
             "--include-timestamp",
         ],
     )
-    result2 = runner.invoke(
+    result2 = runner_no_mixed_stderr.invoke(
         cli,
         [
             "check",
@@ -281,8 +269,8 @@ docops_version: 2.0
     assert result1.exit_code == 0
     assert result2.exit_code == 0
 
-    payload1 = json.loads(result1.output.strip().splitlines()[-1])
-    payload2 = json.loads(result2.output.strip().splitlines()[-1])
+    payload1 = parse_last_json_line(result1.output)
+    payload2 = parse_last_json_line(result2.output)
     assert "run_id" in payload1
     assert "run_id" in payload2
     assert "timestamp" in payload1
@@ -293,17 +281,13 @@ docops_version: 2.0
     payload2.pop("timestamp", None)
     assert payload1 == payload2
 
-def test_operational_error_envelope_conforms_to_agent_schema(tmp_path):
+def test_operational_error_envelope_conforms_to_agent_schema(tmp_path, runner_no_mixed_stderr):
     schema_path = (
         Path(__file__).resolve().parents[3] / "docs" / "20-specs" / "agent-output.schema.v3.json"
     )
     schema = json.loads(schema_path.read_text(encoding="utf-8"))
 
-    runner_kwargs = {}
-    if "mix_stderr" in inspect.signature(CliRunner).parameters:
-        runner_kwargs["mix_stderr"] = False
-    runner = CliRunner(**runner_kwargs)
-    result = runner.invoke(
+    result = runner_no_mixed_stderr.invoke(
         cli,
         [
             "check",
@@ -315,7 +299,7 @@ def test_operational_error_envelope_conforms_to_agent_schema(tmp_path):
     )
 
     assert result.exit_code != 0
-    payload = json.loads(result.output.strip().splitlines()[-1])
+    payload = parse_last_json_line(result.output)
     assert payload["success"] is False
     assert "error" in payload
     errors = sorted(Draft7Validator(schema).iter_errors(payload), key=str)
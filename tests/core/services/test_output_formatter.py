@@ -4,12 +4,13 @@ from pathlib import Path
 
 import pytest
 
+from meminit.core.services.error_codes import ErrorCode
 from meminit.core.services.output_formatter import (
-    normalize_correlation_id,
+    canonical_json_dumps,
     format_envelope,
     format_error_envelope,
+    normalize_correlation_id,
 )
-from meminit.core.services.error_codes import ErrorCode
 
 
 def test_format_envelope_is_deterministic_and_sorted(tmp_path):
@@ -419,3 +420,7 @@ def test_format_error_envelope_omits_root_when_none():
     payload = json.loads(output)
     assert "root" not in payload
 
+
+def test_canonical_json_dumps_sorts_nested_keys_compactly():
+    payload = {"b": [{"z": 1, "a": Path("x")}], "a": {"d": None, "c": True}}
+    assert canonical_json_dumps(payload) == '{"a":{"c":true,"d":null},"b":[{"a":"x","z":1}]}'
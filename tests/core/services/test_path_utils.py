@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
-from meminit.core.services.path_utils import is_safe_cli_output_path
+from meminit.core.services.path_utils import compute_file_hash, is_safe_cli_output_path
 
 
 def test_is_safe_cli_output_path_rejects_forbidden_system_paths():
@@ -11,3 +12,11 @@ def test_is_safe_cli_output_path_rejects_forbidden_system_paths():
 
 def test_is_safe_cli_output_path_allows_regular_relative_paths():
     assert is_safe_cli_output_path(Path("out/meminit-output.json"))
+
+
+def test_compute_file_hash_matches_sha256_of_contents(tmp_path):
+    path = tmp_path / "docops.config.yaml"
+    content = b"project_name: Example\n" * 10000
+    path.write_bytes(content)
+
+    assert compute_file_hash(path) == f"sha256:{hashlib.sha256(content).hexdigest()}"
@@ -1,6 +1,8 @@
 import json
+import os
 
-from meminit.core.services.repo_config import load_repo_layout
+from meminit.core.services import repo_config
+from meminit.core.services.repo_config import load_config_data, load_repo_layout
 from meminit.core.use_cases.check_repository import CheckRepositoryUseCase
 from meminit.core.use_cases.identify_document import IdentifyDocumentUseCase
 from meminit.core.use_cases.index_repository import IndexRepositoryUseCase
@@ -39,6 +41,39 @@ namespaces:
     assert layout.get_namespace("phyla").docs_root == "packages/phyla/docs"
 
 
+def test_namespace_for_path_prefers_most_specific_docs_root(tmp_path):
+    (tmp_path / "docops.config.yaml").write_text(
+        """
+project_name: Example
+docops_version: '2.0'
+namespaces:
+  - name: repo
+    repo_prefix: EXAMPLE
+    docs_root: docs
+  - name: org
+    repo_prefix: ORG
+    docs_root: docs/00-governance/org
+  - name: sibling
+    repo_prefix: SIBLING
+    docs_root: docs-extra
+""".lstrip(),
+        encoding="utf-8",
+    )
+
+    layout = load_repo_layout(tmp_path)
+    root = layout.root_dir
+
+    assert layout.namespace_for_path(root / "docs" / "a.md").namespace == "repo"
+    assert layout.namespace_for_path(root / "docs" / "00-governance" / "b.md").namespace == "repo"
+    assert (
+        layout.namespace_for_path(root / "docs" / "00-governance" / "org" / "c.md").namespace
+        == "org"
+    )
+    assert layout.namespace_for_path(root / "docs-extra" / "d.md").namespace == "sibling"
+    assert layout.namespace_for_path(root / "src" / "e.md") is None
+    assert layout.namespace_for_path(root / "docs").namespace == "repo"
+
+
 def test_load_repo_layout_defaults_catalog_name_to_catalogue(tmp_path):
     (tmp_path / "docops.config.yaml").write_text(
         """
@@ -97,6 +132,52 @@ catalog_name: catalog.md
     assert "docs/01-indices/catalog.md" in layout.namespaces[0].excluded_files
 
 
+def test_namespace_for_path_folds_case_where_the_platform_does(tmp_path, monkeypatch):
+    (tmp_path / "docops.config.yaml").write_text(
+        """
+project_name: Example
+docops_version: '2.0'
+namespaces:
+  - name: repo
+    repo_prefix: EXAMPLE
+    docs_root: docs/00-Governance
+""".lstrip(),
+        encoding="utf-8",
+    )
+    layout = load_repo_layout(tmp_path)
+    mixed = layout.root_dir / "DOCS" / "00-governance" / "a.md"
+
+    assert layout.namespace_for_path(mixed) is None
+
+    # Emulate Windows, where os.path.normcase lower-cases path components.
+    monkeypatch.setattr(repo_config.os.path, "normcase", str.lower)
+    layout = load_repo_layout(tmp_path)
+    assert layout.namespace_for_path(mixed).namespace == "repo"
+
+
+def test_load_config_data_returns_independent_copies(tmp_path):
+    config_path = tmp_path / "docops.config.yaml"
+    config_path.write_bytes(b"project_name: Example\ndocops_version: '2.0'\n")
+
+    first = load_config_data(config_path)
+    first["project_name"] = "Mutated"
+
+    assert load_config_data(config_path)["project_name"] == "Example"
+
+
+def test_load_config_data_sees_same_size_rewrite_with_same_mtime(tmp_path):
+    config_path = tmp_path / "docops.config.yaml"
+    config_path.write_bytes(b"project_name: Example-A\ndocops_version: '2.0'\n")
+    st = config_path.stat()
+    assert load_config_data(config_path)["project_name"] == "Example-A"
+
+    config_path.write_bytes(b"project_name: Example-B\ndocops_version: '2.0'\n")
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert load_config_data(config_path)["project_name"] == "Example-B"
+    assert load_repo_layout(tmp_path).project_name == "Example-B"
+
+
 def test_monorepo_check_and_index_and_resolve(tmp_path):
     (tmp_path / "docops.config.yaml").write_text(
         """
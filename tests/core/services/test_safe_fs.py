@@ -6,6 +6,7 @@ from pathlib import Path
 
 from meminit.core.services.safe_fs import (
     ensure_safe_write_path,
+    ensure_safe_write_paths,
     ensure_existing_regular_file_path,
     UnsafePathError,
     MeminitFileTypeError,
@@ -152,3 +153,21 @@ def test_ensure_existing_regular_file_symlink_escape_is_path_escape(tmp_path):
     with pytest.raises(MeminitPathEscapeError) as exc_info:
         ensure_existing_regular_file_path(root_dir=tmp_path, target_path=link)
     assert exc_info.value.code == ErrorCode.PATH_ESCAPE
+
+
+def test_ensure_safe_write_paths_rejects_symlinked_component(tmp_path):
+    root = tmp_path / "repo"
+    (root / "docs" / "a").mkdir(parents=True)
+    (root / "real").mkdir()
+    (root / "docs" / "link").symlink_to(root / "real", target_is_directory=True)
+
+    ensure_safe_write_paths(
+        root_dir=root,
+        target_paths=[root / "docs" / "a" / "one.md", root / "docs" / "a" / "two.md"],
+    )
+    with pytest.raises(MeminitPathEscapeError) as exc_info:
+        ensure_safe_write_paths(
+            root_dir=root,
+            target_paths=[root / "docs" / "a" / "one.md", root / "docs" / "link" / "x.md"],
+        )
+    assert exc_info.value.details["symlink_component"] == str(root / "docs" / "link")
@@ -41,3 +41,24 @@ def test_schema_validator_invalid_type(mock_schema):
     assert isinstance(violation, Violation)
     assert violation.rule == "SCHEMA_VALIDATION"
     assert "title" in violation.message
+
+
+def test_schema_validator_reuses_compiled_schema_for_identical_bytes(mock_schema, tmp_path):
+    copy = tmp_path / "copy.schema.json"
+    copy.write_bytes(mock_schema.read_bytes())
+
+    first = SchemaValidator(schema_path=str(mock_schema))
+    second = SchemaValidator(schema_path=str(copy))
+
+    assert first._validator is second._validator
+
+
+def test_schema_validator_picks_up_edited_schema(mock_schema):
+    before = SchemaValidator(schema_path=str(mock_schema))
+    mock_schema.write_text(json.dumps({"type": "object", "required": ["owner"]}))
+    after = SchemaValidator(schema_path=str(mock_schema))
+
+    assert before.validate_data({"document_id": "ABC", "title": "Test"}) is None
+    violation = after.validate_data({"document_id": "ABC", "title": "Test"})
+    assert violation is not None
+    assert "owner" in violation.message
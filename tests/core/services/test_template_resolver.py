@@ -1,5 +1,6 @@
 """Unit tests for the TemplateResolver service."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -306,3 +307,64 @@ document_types:
             resolution = resolver.resolve(variant)
             assert resolution.source == SOURCE_CONVENTION
             assert "# PRD Template" in resolution.content
+
+
+class TestTemplateResolverCaching:
+    """Test memoization of template file reads."""
+
+    def test_template_text_reused_until_file_changes(self, tmp_path, monkeypatch):
+        """Unchanged templates are served from cache; edits are picked up."""
+        docs_dir = tmp_path / "docs"
+        templates_dir = docs_dir / "00-governance" / "templates"
+        templates_dir.mkdir(parents=True)
+        template = templates_dir / "prd.template.md"
+        template.write_text("# PRD Template v1")
+
+        (tmp_path / "docops.config.yaml").write_text("""
+project_name: Test
+repo_prefix: TEST
+docops_version: "2.0"
+""")
+
+        resolver = TemplateResolver(load_repo_config(str(tmp_path)))
+        assert resolver.resolve("PRD").content == "# PRD Template v1"
+
+        reads = []
+        original_read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        assert resolver.resolve("PRD").content == "# PRD Template v1"
+        assert template not in reads
+
+        template.write_text("# PRD Template v2, longer")
+        st = template.stat()
+        os.utime(template, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert resolver.resolve("PRD").content == "# PRD Template v2, longer"
+        assert template in reads
+
+    def test_template_text_cache_is_per_resolver(self, tmp_path, monkeypatch):
+        """A new resolver does not reuse text cached by an earlier one."""
+        templates_dir = tmp_path / "docs" / "00-governance" / "templates"
+        templates_dir.mkdir(parents=True)
+        template = templates_dir / "prd.template.md"
+        template.write_text("# PRD Template", encoding="utf-8")
+        (tmp_path / "docops.config.yaml").write_text(
+            'project_name: Test\nrepo_prefix: TEST\ndocops_version: "2.0"\n', encoding="utf-8"
+        )
+        repo_config = load_repo_config(str(tmp_path))
+        TemplateResolver(repo_config).resolve("PRD")
+
+        reads = []
+        original_read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        assert TemplateResolver(repo_config).resolve("PRD").content == "# PRD Template"
+        assert template in reads
@@ -492,6 +492,20 @@ docops_version: 2.0
         assert len(result.violations) == 1
         assert "adr-002-invalid.md" in result.violations[0]["path"]
 
+    def test_execute_targeted_dedupes_overlapping_patterns(self, repo_for_targeted_check):
+        use_case = CheckRepositoryUseCase(root_dir=str(repo_for_targeted_check))
+        result = use_case.execute_targeted(
+            [
+                "docs/45-adr/*.md",
+                "docs/45-adr/adr-001-valid.md",
+                "docs/45-adr/adr-001-valid.md",
+            ]
+        )
+
+        assert result.files_checked == 2
+        assert result.files_failed == 1
+        assert result.files_passed == 1
+
     def test_execute_targeted_with_glob_patterns(self, repo_for_targeted_check):
         use_case = CheckRepositoryUseCase(root_dir=str(repo_for_targeted_check))
         result = use_case.execute_targeted(["docs/45-adr/*.md"])
@@ -511,6 +525,23 @@ docops_version: 2.0
         assert result.files_passed == 1
         assert result.missing_paths_count == 0
 
+    def test_execute_targeted_directory_walk_skips_non_markdown_and_symlinked_dirs(
+        self, repo_for_targeted_check
+    ):
+        docs = repo_for_targeted_check / "docs"
+        (docs / "45-adr" / "notes.txt").write_text("not markdown")
+        (docs / "45-adr" / "archive.md").mkdir()
+        try:
+            (docs / "45-adr" / "prd-link").symlink_to(docs / "10-prd", target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        use_case = CheckRepositoryUseCase(root_dir=str(repo_for_targeted_check))
+        result = use_case.execute_targeted(["docs"])
+
+        assert result.files_checked == 3
+        assert not any("prd-link" in path for path in result.checked_paths)
+
     def test_execute_targeted_with_multiple_files(self, repo_for_targeted_check):
         use_case = CheckRepositoryUseCase(root_dir=str(repo_for_targeted_check))
         result = use_case.execute_targeted(
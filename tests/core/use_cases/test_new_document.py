@@ -689,6 +689,39 @@ class TestDryRunMode:
         assert result.keywords == ["api", "test"]
         assert result.related_ids == ["TEST-PRD-001"]
 
+    def test_dry_run_resolves_today_once(self, repo_with_config_and_template, monkeypatch):
+        import datetime as dt
+
+        calls = []
+
+        class _TickingDate(dt.date):
+            @classmethod
+            def today(cls):
+                calls.append(None)
+                return dt.date(2026, 1, 1) + dt.timedelta(days=len(calls) - 1)
+
+        monkeypatch.setattr(new_document_module, "date", _TickingDate)
+        use_case = NewDocumentUseCase(str(repo_with_config_and_template))
+        params = NewDocumentParams(doc_type="ADR", title="Dated", dry_run=True)
+        result = use_case.execute_with_params(params)
+
+        assert result.success is True
+        assert len(calls) == 1
+        assert result.last_updated == "2026-01-01"
+        assert "last_updated: '2026-01-01'" in result.rendered_content
+
+    def test_dry_run_frontmatter_round_trips_long_unicode_title(
+        self, repo_with_config_and_template
+    ):
+        title = "Ünïcode title: " + "long words " * 12
+        use_case = NewDocumentUseCase(str(repo_with_config_and_template))
+        params = NewDocumentParams(doc_type="ADR", title=title.strip(), dry_run=True)
+        result = use_case.execute_with_params(params)
+
+        assert result.success is True
+        post = frontmatter.loads(result.rendered_content)
+        assert post.metadata["title"] == title.strip()
+
 
 class TestExtendedMetadataFields:
     def test_owner_is_included_in_frontmatter(self, repo_with_config_and_template):
@@ -912,6 +945,43 @@ document_types:
     assert "## Custom Template Marker" in content
 
 
+def test_new_reads_template_once_across_executes(tmp_path, monkeypatch):
+    (tmp_path / "docs" / "00-governance" / "templates").mkdir(parents=True)
+    template = tmp_path / "docs" / "00-governance" / "templates" / "custom-adr.md"
+    template.write_text(
+        "# ADR Title\n\n<!-- MEMINIT_METADATA_BLOCK -->\n\n## Custom Template Marker\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "docs" / "00-governance" / "metadata.schema.json").write_text(
+        SCHEMA_JSON, encoding="utf-8"
+    )
+    (tmp_path / "docops.config.yaml").write_text(
+        """project_name: Example
+repo_prefix: EXAMPLE
+docops_version: '2.0'
+schema_path: docs/00-governance/metadata.schema.json
+document_types:
+  ADR:
+    directory: 45-adr
+    template: docs/00-governance/templates/custom-adr.md
+""",
+        encoding="utf-8",
+    )
+
+    reads = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    use_case = NewDocumentUseCase(str(tmp_path))
+    use_case.execute("ADR", "First Decision")
+    use_case.execute("ADR", "Second Decision")
+    assert reads.count(template) == 1
+
+
 def test_new_does_not_overwrite_existing_file(repo_with_init, monkeypatch):
     use_case = NewDocumentUseCase(str(repo_with_init))
     first = use_case.execute("ADR", "Unique Title")
@@ -963,6 +1033,69 @@ def test_new_title_slug_fallback_when_empty(repo_with_init):
     assert doc_path.name.endswith("-untitled.md")
 
 
+def test_id_patterns_are_compiled_once_per_type():
+    filename_regex, frontmatter_regex = new_document_module._id_patterns("ADR")
+
+    assert new_document_module._id_patterns("ADR") == (filename_regex, frontmatter_regex)
+    assert new_document_module._id_patterns("ADR")[0] is filename_regex
+    assert filename_regex.match("adr-042-title.md").group(1) == "042"
+    assert frontmatter_regex.match("EXAMPLE-ADR-007").group(1) == "007"
+    assert frontmatter_regex.match("EXAMPLE-PRD-007") is None
+
+
+def test_generate_id_reads_frontmatter_ids_and_skips_other_files(
+    repo_with_config_and_template,
+):
+    adr_dir = repo_with_config_and_template / "docs" / "45-adr"
+    (adr_dir / "renamed.md").write_text(
+        "\n\n---\ndocument_id: TEST-ADR-007\n---\n# Renamed\n", encoding="utf-8"
+    )
+    (adr_dir / "notes.md").write_text("# TEST-ADR-099 is mentioned here\n", encoding="utf-8")
+    (adr_dir / "broken.md").write_text("---\ndocument_id: [unclosed\n---\n", encoding="utf-8")
+    (adr_dir / "binary.md").write_bytes(b"---\n\xff\xfe\n---\n")
+
+    use_case = NewDocumentUseCase(str(repo_with_config_and_template))
+    ns = use_case._layout.default_namespace()
+
+    assert use_case._generate_id("ADR", adr_dir, ns) == "TEST-ADR-008"
+
+
+def test_apply_common_template_substitutions_single_pass(repo_with_init):
+    use_case = NewDocumentUseCase(str(repo_with_init))
+    body = (
+        "{title}|{status}|<REPO>|<PROJECT>|<SEQ>|<YYYY-MM-DD>|<Decision Title>|"
+        "<Feature Title>|<Team or Person>|{owner}|{area}|{description}|{keywords}|"
+        "{related_ids}|{unknown}|{{title}}"
+    )
+
+    result = use_case._apply_common_template_substitutions(
+        body,
+        doc_type="ADR",
+        title="Uses {status}",
+        doc_id="EXAMPLE-ADR-042",
+        status="Draft",
+        owner="Team",
+        area="Core",
+        description="Desc",
+        keywords=["a", "b"],
+        related_ids=["EXAMPLE-PRD-001"],
+        today="2026-01-02",
+    )
+
+    assert result == (
+        "Uses {status}|Draft|EXAMPLE|EXAMPLE|042|2026-01-02|Uses {status}|"
+        "Uses {status}|Team|Team|Core|Desc|a, b|EXAMPLE-PRD-001|{unknown}|{Uses {status}}"
+    )
+
+
+def test_generate_filename_slugifies_title(repo_with_init):
+    use_case = NewDocumentUseCase(str(repo_with_init))
+    assert (
+        use_case._generate_filename("EXAMPLE-ADR-007", "Use  Café_Cache -- v2.0!")
+        == "adr-007-use-cafcache-v20.md"
+    )
+
+
 def test_new_can_target_namespace(tmp_path):
     (tmp_path / "docs" / "00-governance" / "templates").mkdir(parents=True)
     (tmp_path / "docs" / "00-governance" / "metadata.schema.json").write_text(
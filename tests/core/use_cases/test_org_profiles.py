@@ -1,15 +1,31 @@
 from __future__ import annotations
 
+import dataclasses
 import json
+import os
 from pathlib import Path
 
+import pytest
 import yaml
 
-from meminit.core.services.org_profiles import global_profile_dir, resolve_org_profile
+from meminit.core.services import org_profiles
+from meminit.core.services.error_codes import ErrorCode, MeminitError
+from meminit.core.services.org_profiles import (
+    OrgProfile,
+    _file_matches,
+    diff_profile_to_repo,
+    global_profile_dir,
+    resolve_org_profile,
+)
+from meminit.core.services.safe_fs import MeminitPathEscapeError
 from meminit.core.use_cases.init_repository import InitRepositoryUseCase
 from meminit.core.use_cases.install_org_profile import InstallOrgProfileUseCase
 from meminit.core.use_cases.org_status import OrgStatusUseCase
-from meminit.core.use_cases.vendor_org_profile import VendorOrgProfileUseCase
+from meminit.core.use_cases.vendor_org_profile import (
+    OrgVendorReport,
+    VendorOrgProfileUseCase,
+    _render_lock_json,
+)
 
 
 def _xdg_env(tmp_path: Path) -> dict[str, str]:
@@ -109,6 +125,9 @@ def test_org_vendor_writes_lock_and_refuses_overwrite_without_force(tmp_path: Pa
     assert applied.dry_run is False
     assert (repo_root / "docs/00-governance/metadata.schema.json").exists()
     assert (repo_root / ".meminit/org-profile.lock.json").exists()
+    lock = json.loads((repo_root / ".meminit/org-profile.lock.json").read_text(encoding="utf-8"))
+    assert lock["digest"] == applied.digest == dry.digest
+    assert applied.digest == resolve_org_profile(profile_name="default", env=env).digest()
 
     config = yaml.safe_load(
         (repo_root / "docops.config.yaml").read_text(encoding="utf-8")
@@ -147,6 +166,7 @@ def test_org_status_reports_lock_matches_current_profile(tmp_path: Path):
     assert report.repo_lock_present is True
     assert report.current_profile_source == "global"
     assert report.repo_lock_matches_current is True
+    assert Path(report.repo_lock_path) == Path(".meminit") / "org-profile.lock.json"
 
 
 def test_init_repository_uses_global_profile_when_installed(tmp_path: Path):
@@ -191,9 +211,6 @@ def test_init_repository_uses_global_profile_when_installed(tmp_path: Path):
 
 
 def test_org_vendor_refuses_symlink_escape(tmp_path: Path):
-    import pytest
-    from meminit.core.services.error_codes import ErrorCode, MeminitError
-
     env = _xdg_env(tmp_path)
     InstallOrgProfileUseCase(env=env).execute(profile_name="default", dry_run=False)
 
@@ -209,3 +226,195 @@ def test_org_vendor_refuses_symlink_escape(tmp_path: Path):
             profile_name="default", dry_run=False
         )
     assert exc_info.value.code == ErrorCode.PATH_ESCAPE
+
+
+def test_diff_profile_to_repo_classifies_targets(tmp_path: Path):
+    profile = OrgProfile(
+        name="default",
+        version="1.0",
+        docops_version="2.0",
+        files={
+            "same.md": b"same",
+            "resized.md": b"new content",
+            "edited.md": b"abcd",
+            "missing.md": b"x",
+            "nested.md": b"y",
+        },
+        source="packaged",
+    )
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "same.md").write_bytes(b"same")
+    (docs / "resized.md").write_bytes(b"old")
+    (docs / "edited.md").write_bytes(b"abce")
+    mapping = {
+        "same.md": "docs/same.md",
+        "resized.md": "docs/resized.md",
+        "edited.md": "docs/edited.md",
+        "missing.md": "docs/missing.md",
+        "nested.md": "docs/not-yet/nested.md",
+    }
+
+    assert diff_profile_to_repo(profile, tmp_path, mapping) == (2, 2, 1)
+
+
+def test_file_matches_compares_in_chunks(tmp_path: Path):
+    target = tmp_path / "schema.json"
+    content = bytes(range(256)) * 10
+    target.write_bytes(content)
+
+    assert _file_matches(target, content, chunk_size=100)
+    assert not _file_matches(target, content[:-1] + b"\x00", chunk_size=100)
+    assert not _file_matches(target, content + b"x", chunk_size=100)
+    assert not _file_matches(target, content[:-1], chunk_size=100)
+
+
+def test_org_vendor_force_rewrites_only_changed_files(tmp_path: Path):
+    env = _xdg_env(tmp_path)
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir(parents=True, exist_ok=True)
+    VendorOrgProfileUseCase(root_dir=str(repo_root), env=env).execute(
+        profile_name="default", dry_run=False
+    )
+
+    schema = repo_root / "docs/00-governance/metadata.schema.json"
+    template = repo_root / "docs/00-governance/templates/adr.template.md"
+    config = repo_root / "docops.config.yaml"
+    original_template = template.read_bytes()
+    template.write_bytes(b"locally edited")
+    os.utime(schema, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(config, ns=(1_000_000_000, 1_000_000_000))
+
+    report = VendorOrgProfileUseCase(root_dir=str(repo_root), env=env).execute(
+        profile_name="default", dry_run=False, force=True
+    )
+
+    assert report.updated_files == 1
+    assert report.created_files == 0
+    assert template.read_bytes() == original_template
+    assert schema.stat().st_mtime_ns == 1_000_000_000
+    assert config.stat().st_mtime_ns == 1_000_000_000
+    assert not [p for p in repo_root.rglob("*") if p.name.endswith(".tmp")]
+
+
+def test_global_profile_cache_reuses_until_a_file_changes(tmp_path: Path):
+    env = _xdg_env(tmp_path)
+    InstallOrgProfileUseCase(env=env).execute(profile_name="default", dry_run=False)
+
+    first = resolve_org_profile(profile_name="default", env=env)
+    assert first.source == "global"
+    assert resolve_org_profile(profile_name="default", env=env) is first
+
+    schema = global_profile_dir("default", env=env) / "metadata.schema.json"
+    schema.write_bytes(b'{"$schema": "EDITED-IN-PLACE"}')
+    reloaded = resolve_org_profile(profile_name="default", env=env)
+    assert reloaded is not first
+    assert reloaded.files["metadata.schema.json"] == b'{"$schema": "EDITED-IN-PLACE"}'
+
+
+def test_global_profile_cache_evicts_least_recently_used(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(org_profiles, "_GLOBAL_PROFILE_CACHE", org_profiles.OrderedDict())
+    monkeypatch.setattr(org_profiles, "_GLOBAL_PROFILE_CACHE_SIZE", 1)
+    env_a = _xdg_env(tmp_path / "a")
+    env_b = _xdg_env(tmp_path / "b")
+    for env in (env_a, env_b):
+        InstallOrgProfileUseCase(env=env).execute(profile_name="default", dry_run=False)
+
+    first_a = resolve_org_profile(profile_name="default", env=env_a)
+    resolve_org_profile(profile_name="default", env=env_b)
+
+    assert list(org_profiles._GLOBAL_PROFILE_CACHE) == [global_profile_dir("default", env=env_b)]
+    assert resolve_org_profile(profile_name="default", env=env_a) is not first_a
+
+
+def test_org_vendor_report_as_dict_follows_field_order():
+    report = OrgVendorReport(
+        profile_name="default",
+        profile_version="1.0",
+        source="packaged",
+        digest="abc",
+        dry_run=True,
+        updated_files=1,
+        created_files=2,
+        unchanged_files=3,
+        lock_path=".meminit/org-profile.lock.json",
+        message="Dry run complete.",
+    )
+    assert report.as_dict() == dataclasses.asdict(report)
+    assert list(report.as_dict()) == [f.name for f in dataclasses.fields(report)]
+
+
+def test_render_lock_json_matches_json_dumps():
+    payload = {
+        "lock_schema_version": "1.0",
+        "profile_name": 'quote " and \\ and ünïcode',
+        "vendored_at": "2026-01-01T00:00:00+00:00",
+    }
+    assert _render_lock_json(payload) == json.dumps(payload, indent=2)
+
+
+def test_org_vendor_refuses_symlinked_lock_dir_before_writing(tmp_path: Path):
+    env = _xdg_env(tmp_path)
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir(parents=True, exist_ok=True)
+    (repo_root / "elsewhere").mkdir()
+    (repo_root / ".meminit").symlink_to(repo_root / "elsewhere", target_is_directory=True)
+
+    with pytest.raises(MeminitPathEscapeError):
+        VendorOrgProfileUseCase(root_dir=str(repo_root), env=env).execute(
+            profile_name="default", dry_run=False
+        )
+    assert not (repo_root / "docs").exists()
+    assert not (repo_root / "docops.config.yaml").exists()
+
+
+class _EntryProxy:
+    def __init__(self, entry, stat_calls, failing):
+        self.name = entry.name
+        self._entry = entry
+        self._stat_calls = stat_calls
+        self._failing = failing
+
+    def stat(self):
+        self._stat_calls.append(self.name)
+        if self.name in self._failing:
+            raise PermissionError(self.name)
+        return self._entry.stat()
+
+
+def _proxy_scandir(monkeypatch, stat_calls, failing=()):
+    real_scandir = os.scandir
+
+    class _Listing:
+        def __init__(self, path):
+            self._it = real_scandir(path)
+
+        def __enter__(self):
+            return (_EntryProxy(e, stat_calls, failing) for e in self._it)
+
+        def __exit__(self, *exc):
+            self._it.close()
+
+    monkeypatch.setattr(org_profiles.os, "scandir", _Listing)
+
+
+def test_stat_targets_only_stats_wanted_entries(tmp_path: Path, monkeypatch):
+    for name in ("target.md", "other-1.md", "other-2.md", "other-3.md"):
+        (tmp_path / name).write_bytes(b"x")
+    stat_calls: list = []
+    _proxy_scandir(monkeypatch, stat_calls)
+
+    stats = org_profiles._stat_targets([tmp_path / "target.md", tmp_path / "missing.md"])
+
+    assert stat_calls == ["target.md"]
+    assert stats[tmp_path / "target.md"].st_size == 1
+    assert stats[tmp_path / "missing.md"] is None
+
+
+def test_stat_targets_falls_back_when_entry_stat_fails(tmp_path: Path, monkeypatch):
+    (tmp_path / "target.md").write_bytes(b"abc")
+    _proxy_scandir(monkeypatch, [], failing={"target.md"})
+
+    stats = org_profiles._stat_targets([tmp_path / "target.md"])
+
+    assert stats[tmp_path / "target.md"].st_size == 3
@@ -70,3 +70,24 @@ def test_identify_document_invalid_index(tmp_path):
     use_case = IdentifyDocumentUseCase(str(tmp_path))
     with pytest.raises(ValueError):
         use_case.execute("docs/45-adr/adr-001-test.md")
+
+
+def test_resolve_document_reuses_parsed_index(tmp_path, monkeypatch):
+    _write_index(tmp_path)
+    use_case = ResolveDocumentUseCase(str(tmp_path))
+
+    calls = []
+    import meminit.core.use_cases.resolve_document as resolve_module
+
+    original = resolve_module.load_index_documents
+
+    def counting_load(index_file):
+        calls.append(index_file)
+        return original(index_file)
+
+    monkeypatch.setattr(resolve_module, "load_index_documents", counting_load)
+
+    assert use_case.execute("EXAMPLE-ADR-001").path == "docs/45-adr/adr-001-test.md"
+    assert use_case.execute(" EXAMPLE-ADR-001 ").path == "docs/45-adr/adr-001-test.md"
+    assert use_case.execute("EXAMPLE-ADR-999").path is None
+    assert len(calls) == 1
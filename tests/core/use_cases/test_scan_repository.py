@@ -1,3 +1,5 @@
+import pytest
+
 from meminit.core.use_cases.scan_repository import ScanRepositoryUseCase
 
 
@@ -63,6 +65,43 @@ def test_scan_suggests_namespaces_for_packages_docs(tmp_path):
     assert any(ns["docs_root"] == "packages/phyla/docs" for ns in report.suggested_namespaces)
 
 
+def test_scan_suggested_namespace_names_and_prefixes(tmp_path):
+    (tmp_path / "docs").mkdir(parents=True)
+    for package in ("data-pipeline-2", "ui"):
+        (tmp_path / "packages" / package / "docs").mkdir(parents=True)
+        (tmp_path / "packages" / package / "docs" / "note.md").write_text(
+            "# Note\n", encoding="utf-8"
+        )
+
+    report = ScanRepositoryUseCase(str(tmp_path)).execute()
+
+    assert report.suggested_namespaces == [
+        {
+            "name": "data-pipeline-2",
+            "docs_root": "packages/data-pipeline-2/docs",
+            "repo_prefix_suggestion": "DATAPIPELI",
+        },
+        {"name": "ui", "docs_root": "packages/ui/docs", "repo_prefix_suggestion": "PKG"},
+    ]
+
+
+def test_scan_skips_package_docs_without_markdown(tmp_path):
+    (tmp_path / "docs").mkdir(parents=True)
+    (tmp_path / "packages" / "empty" / "docs" / "nested").mkdir(parents=True)
+    (tmp_path / "packages" / "empty" / "docs" / "nested" / "notes.txt").write_text(
+        "not markdown\n", encoding="utf-8"
+    )
+    (tmp_path / "apps" / "web" / "docs" / "nested").mkdir(parents=True)
+    (tmp_path / "apps" / "web" / "docs" / "nested" / "deep.md").write_text(
+        "# Deep\n", encoding="utf-8"
+    )
+
+    report = ScanRepositoryUseCase(str(tmp_path)).execute()
+
+    roots = [ns["docs_root"] for ns in report.suggested_namespaces]
+    assert roots == ["apps/web/docs"]
+
+
 def test_scan_does_not_suggest_configured_namespace(tmp_path):
     (tmp_path / "docs").mkdir(parents=True)
     (tmp_path / "packages" / "phyla" / "docs").mkdir(parents=True)
@@ -109,3 +148,114 @@ def test_scan_reports_configured_namespaces_and_overlaps(tmp_path):
         o.get("parent_docs_root") == "docs" and o.get("child_docs_root") == "docs/00-governance/org"
         for o in report.overlapping_namespaces
     )
+
+
+def test_scan_reports_every_nested_ancestor_overlap(tmp_path):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docops.config.yaml").write_text(
+        "project_name: Example\n"
+        "repo_prefix: EXAMPLE\n"
+        "docops_version: '2.0'\n"
+        "namespaces:\n"
+        "  - name: repo\n"
+        "    repo_prefix: EXAMPLE\n"
+        "    docs_root: docs\n"
+        "  - name: sibling\n"
+        "    repo_prefix: SIBLING\n"
+        "    docs_root: docs-extra\n"
+        "  - name: team\n"
+        "    repo_prefix: TEAM\n"
+        "    docs_root: docs/team\n"
+        "  - name: org\n"
+        "    repo_prefix: ORG\n"
+        "    docs_root: docs/team/org\n",
+        encoding="utf-8",
+    )
+
+    report = ScanRepositoryUseCase(str(tmp_path)).execute()
+
+    pairs = [(o["parent_namespace"], o["child_namespace"]) for o in report.overlapping_namespaces]
+    assert pairs == [("repo", "team"), ("repo", "org"), ("team", "org")]
+
+
+def test_scan_counts_each_governed_file_once_per_owning_namespace(tmp_path):
+    (tmp_path / "docs" / "team" / "WIP-drafts").mkdir(parents=True)
+    (tmp_path / "docs" / "a.md").write_text("# A\n", encoding="utf-8")
+    (tmp_path / "docs" / "team" / "b.md").write_text("# B\n", encoding="utf-8")
+    (tmp_path / "docs" / "team" / "WIP-drafts" / "c.md").write_text("# C\n", encoding="utf-8")
+    (tmp_path / "packages" / "pkg" / "docs").mkdir(parents=True)
+    (tmp_path / "packages" / "pkg" / "docs" / "d.md").write_text("# D\n", encoding="utf-8")
+    (tmp_path / "docops.config.yaml").write_text(
+        "project_name: Example\n"
+        "repo_prefix: EXAMPLE\n"
+        "docops_version: '2.0'\n"
+        "namespaces:\n"
+        "  - name: repo\n"
+        "    docs_root: docs\n"
+        "  - name: team\n"
+        "    docs_root: docs/team\n"
+        "  - name: pkg\n"
+        "    docs_root: packages/pkg/docs\n"
+        "  - name: missing\n"
+        "    docs_root: packages/missing/docs\n",
+        encoding="utf-8",
+    )
+
+    report = ScanRepositoryUseCase(str(tmp_path)).execute()
+
+    counts = {
+        ns["namespace"]: (ns["docs_root_exists"], ns["governed_markdown_count"])
+        for ns in report.configured_namespaces
+    }
+    assert counts == {
+        "repo": (True, 1),
+        "team": (True, 1),
+        "pkg": (True, 1),
+        "missing": (False, 0),
+    }
+    assert report.governed_markdown_count == 3
+
+
+def test_scan_suggests_type_directory_through_symlinked_subdir(tmp_path):
+    (tmp_path / "elsewhere" / "decisions").mkdir(parents=True)
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "notes.md").write_text("# Notes\n", encoding="utf-8")
+    try:
+        (tmp_path / "docs" / "decisions").symlink_to(tmp_path / "elsewhere" / "decisions")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+
+    report = ScanRepositoryUseCase(str(tmp_path)).execute()
+
+    assert report.suggested_type_directories.get("ADR") == "decisions"
+
+
+def test_scan_counts_files_under_symlinked_nested_namespace(tmp_path):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text("# A\n", encoding="utf-8")
+    (tmp_path / "external").mkdir()
+    (tmp_path / "external" / "b.md").write_text("# B\n", encoding="utf-8")
+    (tmp_path / "external" / "c.md").write_text("# C\n", encoding="utf-8")
+    try:
+        (tmp_path / "docs" / "ext").symlink_to(tmp_path / "external", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+    (tmp_path / "docops.config.yaml").write_text(
+        "project_name: Example\n"
+        "repo_prefix: EXAMPLE\n"
+        "docops_version: '2.0'\n"
+        "namespaces:\n"
+        "  - name: main\n"
+        "    docs_root: docs\n"
+        "  - name: ext\n"
+        "    docs_root: docs/ext\n",
+        encoding="utf-8",
+    )
+
+    report = ScanRepositoryUseCase(str(tmp_path)).execute()
+
+    counts = [
+        (ns["namespace"], ns["governed_markdown_count"]) for ns in report.configured_namespaces
+    ]
+    assert counts == [("main", 1), ("ext", 2)]
+    assert report.governed_markdown_count == 3
@@ -1,11 +1,20 @@
 """Shared test utilities."""
 
+import inspect
 import json
 from typing import TYPE_CHECKING
 
+from click.testing import CliRunner
+
 if TYPE_CHECKING:
     from click.testing import Result
 
+# CliRunner kwargs that keep stderr out of result.output; Click < 8.2 mixes
+# the streams unless told otherwise. Probed once at import.
+NO_MIXED_STDERR_KWARGS = (
+    {"mix_stderr": False} if "mix_stderr" in inspect.signature(CliRunner).parameters else {}
+)
+
 
 def parse_first_json_line(output: str) -> dict:
     """Parse the first JSON line from CLI output.
@@ -35,3 +44,43 @@ def stdout_text(result: "Result") -> str:
     if hasattr(result, "stdout"):
         return result.stdout
     return result.output
+
+
+def first_line(output: str) -> str:
+    """Return the first non-blank line of CLI output without splitting the rest."""
+    return output.strip().partition("\n")[0]
+
+
+def last_line(output: str) -> str:
+    """Return the last non-blank line of CLI output.
+
+    Only the final line is split off, so long outputs are not broken into a
+    list of lines just to read the trailing envelope.
+    """
+    return output.strip().rpartition("\n")[2]
+
+
+def parse_last_json_line(output: str) -> dict:
+    """Parse the last line of CLI output as JSON."""
+    return json.loads(last_line(output))
+
+
+def assert_json_envelope(result: "Result", *, exit_code: int = 0, **fields) -> dict:
+    """Assert a CLI result's exit code and top-level envelope fields in one step.
+
+    Booleans and None are compared by identity, everything else by equality.
+    Returns the parsed envelope for any further, nested assertions.
+    """
+    assert result.exit_code == exit_code, result.output
+    data = parse_last_json_line(result.output)
+    mismatched = {
+        key: data.get(key)
+        for key, expected in fields.items()
+        if (
+            data.get(key) is not expected
+            if isinstance(expected, bool) or expected is None
+            else data.get(key) != expected
+        )
+    }
+    assert not mismatched, f"Envelope fields differ from {fields!r}: {mismatched!r}"
+    return data
@@ -148,7 +148,9 @@ def _setup_fixture(name: str, tmp_path: Path) -> None:
         _setup_initialized_repo(tmp_path)
 
 
-def _invoke_and_assert_output(name: str, tmp_path: Path, extra_args: list[str] | None = None):
+def _invoke_and_assert_output(
+    runner: CliRunner, name: str, tmp_path: Path, extra_args: list[str] | None = None
+):
     """Invoke a command and assert it produced valid output (not usage error or empty).
 
     Isolates MEMINIT_CORRELATION_ID from the parent environment so
@@ -161,7 +163,6 @@ def _invoke_and_assert_output(name: str, tmp_path: Path, extra_args: list[str] |
         args.extend(extra_args)
     env = {k: v for k, v in os.environ.items()}
     env["MEMINIT_CORRELATION_ID"] = None
-    runner = CliRunner()
     result = runner.invoke(cli, args, env=env)
 
     assert result.exit_code != 2, (
@@ -179,12 +180,12 @@ class TestEnvelopeValidity:
         _get_json_commands(),
         ids=lambda c: c["name"],
     )
-    def test_envelope_has_all_required_fields(self, cmd_info, tmp_path):
+    def test_envelope_has_all_required_fields(self, cmd_info, tmp_path, runner):
         """Each command must include all required envelope fields."""
         name = cmd_info["name"]
         _setup_fixture(name, tmp_path)
 
-        result = _invoke_and_assert_output(name, tmp_path)
+        result = _invoke_and_assert_output(runner, name, tmp_path)
         data = parse_first_json_line(result.output)
         for field in _REQUIRED_FIELDS:
             assert field in data, f"Missing required field: {field}"
@@ -200,12 +201,14 @@ class TestEnvelopeValidity:
         _get_json_commands(),
         ids=lambda c: c["name"],
     )
-    def test_correlation_id_echo(self, cmd_info, tmp_path):
+    def test_correlation_id_echo(self, cmd_info, tmp_path, runner):
         """When --correlation-id is provided, it must be echoed in output."""
         name = cmd_info["name"]
         _setup_fixture(name, tmp_path)
 
-        result = _invoke_and_assert_output(name, tmp_path, ["--correlation-id", "test-cid-42"])
+        result = _invoke_and_assert_output(
+            runner, name, tmp_path, ["--correlation-id", "test-cid-42"]
+        )
         data = parse_first_json_line(result.output)
         assert data.get("correlation_id") == "test-cid-42"
 
@@ -214,12 +217,12 @@ class TestEnvelopeValidity:
         _get_json_commands(),
         ids=lambda c: c["name"],
     )
-    def test_correlation_id_omitted_when_not_provided(self, cmd_info, tmp_path):
+    def test_correlation_id_omitted_when_not_provided(self, cmd_info, tmp_path, runner):
         """When --correlation-id is NOT provided, field must be absent."""
         name = cmd_info["name"]
         _setup_fixture(name, tmp_path)
 
-        result = _invoke_and_assert_output(name, tmp_path)
+        result = _invoke_and_assert_output(runner, name, tmp_path)
         data = parse_first_json_line(result.output)
         assert "correlation_id" not in data
 
@@ -228,12 +231,12 @@ class TestEnvelopeValidity:
         _get_json_commands(),
         ids=lambda c: c["name"],
     )
-    def test_output_is_valid_json(self, cmd_info, tmp_path):
+    def test_output_is_valid_json(self, cmd_info, tmp_path, runner):
         """Output must be parseable JSON."""
         name = cmd_info["name"]
         _setup_fixture(name, tmp_path)
 
-        result = _invoke_and_assert_output(name, tmp_path)
+        result = _invoke_and_assert_output(runner, name, tmp_path)
         non_empty_lines = [line for line in stdout_text(result).splitlines() if line.strip()]
         assert len(non_empty_lines) == 1, (
             f"Expected exactly one non-empty stdout line, got {len(non_empty_lines)}: {non_empty_lines!r}"
@@ -245,12 +248,14 @@ class TestEnvelopeValidity:
         _get_json_commands(),
         ids=lambda c: c["name"],
     )
-    def test_envelope_validates_against_schema(self, cmd_info, tmp_path, agent_output_schema):
+    def test_envelope_validates_against_schema(
+        self, cmd_info, tmp_path, agent_output_schema, runner
+    ):
         """Envelope must validate against agent-output.schema.v3.json."""
         name = cmd_info["name"]
         _setup_fixture(name, tmp_path)
 
-        result = _invoke_and_assert_output(name, tmp_path)
+        result = _invoke_and_assert_output(runner, name, tmp_path)
         payload = parse_first_json_line(result.output)
         errors = sorted(Draft7Validator(agent_output_schema).iter_errors(payload), key=str)
         assert not errors, (
@@ -262,10 +267,10 @@ class TestEnvelopeValidity:
 class TestPayloadContracts:
     """Specific data-payload field assertions for v3 contracts."""
 
-    def test_index_payload_fields(self, tmp_path):
+    def test_index_payload_fields(self, tmp_path, runner):
         """Step 1: index data must match the CLI envelope contract (SPEC-008)."""
         _setup_initialized_repo(tmp_path)
-        result = _invoke_and_assert_output("index", tmp_path)
+        result = _invoke_and_assert_output(runner, "index", tmp_path)
         data = parse_first_json_line(result.output)["data"]
 
         # Required fields
@@ -276,12 +281,12 @@ class TestPayloadContracts:
         for field in ["index_version", "graph_schema_version", "document_count"]:
             assert field not in data, f"Persisted-artifact field {field} leaked into CLI data"
 
-    def test_protocol_sync_payload_fields(self, tmp_path):
+    def test_protocol_sync_payload_fields(self, tmp_path, runner):
         """Step 3: protocol sync must include dry_run as a stable field."""
         _setup_initialized_repo(tmp_path)
 
         # Dry-run mode (default)
-        r1 = _invoke_and_assert_output("protocol sync", tmp_path)
+        r1 = _invoke_and_assert_output(runner, "protocol sync", tmp_path)
         d1 = parse_first_json_line(r1.output)["data"]
         assert d1["dry_run"] is True
         assert "applied" in d1
@@ -289,11 +294,11 @@ class TestPayloadContracts:
         assert "assets" in d1
 
         # Apply mode
-        r2 = _invoke_and_assert_output("protocol sync", tmp_path, ["--no-dry-run"])
+        r2 = _invoke_and_assert_output(runner, "protocol sync", tmp_path, ["--no-dry-run"])
         d2 = parse_first_json_line(r2.output)["data"]
         assert d2["dry_run"] is False
 
-    def test_resolve_identify_link_success_payloads(self, tmp_path):
+    def test_resolve_identify_link_success_payloads(self, tmp_path, runner):
         """Step 2: Successful resolution/identification/link payloads do not include 'found'."""
         _setup_initialized_repo(tmp_path)
         # Create a document so they succeed
@@ -303,10 +308,9 @@ class TestPayloadContracts:
             encoding="utf-8"
         )
         # We need an index for resolve/identify/link to work
-        index_result = CliRunner().invoke(cli, ["index", "--root", str(tmp_path)])
+        index_result = runner.invoke(cli, ["index", "--root", str(tmp_path)])
         assert index_result.exit_code == 0, f"Indexing failed: {index_result.output}"
 
-        runner = CliRunner()
         common_args = ["--format", "json", "--root", str(tmp_path)]
 
         # Resolve
@@ -333,34 +337,33 @@ class TestPayloadContracts:
         assert "link" in d_link
         assert "found" not in d_link
 
-    def test_resolve_identify_link_not_found_behavior(self, tmp_path):
+    def test_resolve_identify_link_not_found_behavior(self, tmp_path, runner):
         """Step 2: Misses are represented as FILE_NOT_FOUND error envelopes."""
         _setup_initialized_repo(tmp_path)
-        index_result = CliRunner().invoke(cli, ["index", "--root", str(tmp_path)])
+        index_result = runner.invoke(cli, ["index", "--root", str(tmp_path)])
         assert index_result.exit_code == 0, f"Indexing failed: {index_result.output}"
 
         for cmd in ["resolve", "identify", "link"]:
             args = cmd.split() + ["--format", "json", "--root", str(tmp_path), "NON_EXISTENT"]
-            result = CliRunner().invoke(cli, args)
+            result = runner.invoke(cli, args)
             assert result.exit_code != 0
             payload = parse_first_json_line(result.output)
             assert payload["success"] is False
             assert payload["error"]["code"] == "FILE_NOT_FOUND"
             assert "found" not in payload["data"]
 
-    def test_capabilities_payload_fields(self, tmp_path):
+    def test_capabilities_payload_fields(self, tmp_path, runner):
         """CG-1: capabilities payload has required fields and no root."""
-        result = _invoke_and_assert_output("capabilities", tmp_path)
+        result = _invoke_and_assert_output(runner, "capabilities", tmp_path)
         payload = parse_first_json_line(result.output)
         assert "root" not in payload
         data = payload["data"]
         for field in ["capabilities_version", "cli_version", "commands", "features", "error_codes"]:
             assert field in data, f"Missing {field} in capabilities data"
 
-    def test_explain_single_payload_fields(self, tmp_path):
+    def test_explain_single_payload_fields(self, tmp_path, runner):
         """CG-1: explain single-code payload has correct detailed fields and no root."""
         # Invoke explain for a known code
-        runner = CliRunner()
         result = runner.invoke(cli, ["explain", "FILE_NOT_FOUND", "--format", "json"])
         assert result.exit_code == 0
         payload = parse_first_json_line(result.output)
@@ -373,9 +376,9 @@ class TestPayloadContracts:
         for r_field in ["action", "resolution_type", "automatable", "relevant_commands"]:
             assert r_field in remed, f"Missing {r_field} in remediation object"
 
-    def test_explain_list_payload_fields(self, tmp_path):
+    def test_explain_list_payload_fields(self, tmp_path, runner):
         """CG-1: explain --list payload has correct summary fields and no root."""
-        result = _invoke_and_assert_output("explain", tmp_path)
+        result = _invoke_and_assert_output(runner, "explain", tmp_path)
         payload = parse_first_json_line(result.output)
         assert "root" not in payload
         data = payload["data"]
@@ -385,10 +388,10 @@ class TestPayloadContracts:
         for field in ["code", "category", "summary"]:
             assert field in first_code, f"Missing {field} in explain --list entry"
 
-    def test_protocol_check_payload_fields(self, tmp_path):
+    def test_protocol_check_payload_fields(self, tmp_path, runner):
         """CG-1: protocol check payload has summary and assets fields."""
         _setup_initialized_repo(tmp_path)
-        result = _invoke_and_assert_output("protocol check", tmp_path)
+        result = _invoke_and_assert_output(runner, "protocol check", tmp_path)
         data = parse_first_json_line(result.output)["data"]
         assert "summary" in data
         assert "assets" in data
@@ -421,11 +424,10 @@ class TestCapabilitiesSelfConsistency:
 class TestExplainCompleteness:
     """Explain command must cover all error codes."""
 
-    def test_explain_list_covers_all_error_codes(self):
+    def test_explain_list_covers_all_error_codes(self, runner):
         """Every ErrorCode must appear in explain --list output."""
         from meminit.core.services.error_codes import ErrorCode
 
-        runner = CliRunner()
         result = runner.invoke(cli, ["explain", "--list", "--format", "json"])
         assert result.exit_code == 0
         data = parse_first_json_line(result.output)
@@ -3,8 +3,6 @@
 import re
 from pathlib import Path
 
-from click.testing import CliRunner
-
 from meminit.cli.main import cli
 
 
@@ -24,24 +22,21 @@ def _init_repo(tmp_path: Path) -> None:
 
 
 class TestProtocolCheckCLI:
-    def test_json_output_single_line(self, tmp_path):
+    def test_json_output_single_line(self, tmp_path, runner):
         _init_repo(tmp_path)
-        runner = CliRunner()
         result = runner.invoke(cli, ["protocol", "check", "--root", str(tmp_path), "--format", "json"])
         assert result.exit_code != 2
         non_empty = [line for line in result.output.splitlines() if line.strip()]
         assert len(non_empty) == 1
 
-    def test_text_output_not_empty(self, tmp_path):
+    def test_text_output_not_empty(self, tmp_path, runner):
         _init_repo(tmp_path)
-        runner = CliRunner()
         result = runner.invoke(cli, ["protocol", "check", "--root", str(tmp_path), "--format", "text"])
         assert result.exit_code != 2
         assert "Protocol" in result.output
 
-    def test_md_output_is_markdown_table_only(self, tmp_path):
+    def test_md_output_is_markdown_table_only(self, tmp_path, runner):
         _init_repo(tmp_path)
-        runner = CliRunner()
         result = runner.invoke(cli, ["protocol", "check", "--root", str(tmp_path), "--format", "md"])
         assert result.exit_code != 2
         non_empty = [line for line in result.output.splitlines() if line.strip()]
@@ -52,32 +47,28 @@ class TestProtocolCheckCLI:
         for line in non_empty:
             assert line.startswith("|"), f"Non-table line in md output: {line!r}"
 
-    def test_missing_assets_exit_nonzero(self, tmp_path):
+    def test_missing_assets_exit_nonzero(self, tmp_path, runner):
         _init_repo(tmp_path)
-        runner = CliRunner()
         result = runner.invoke(cli, ["protocol", "check", "--root", str(tmp_path), "--format", "json"])
         assert result.exit_code != 0
 
 
 class TestProtocolSyncCLI:
-    def test_json_output_single_line(self, tmp_path):
+    def test_json_output_single_line(self, tmp_path, runner):
         _init_repo(tmp_path)
-        runner = CliRunner()
         result = runner.invoke(cli, ["protocol", "sync", "--root", str(tmp_path), "--format", "json"])
         assert result.exit_code != 2
         non_empty = [line for line in result.output.splitlines() if line.strip()]
         assert len(non_empty) == 1
 
-    def test_text_output_not_empty(self, tmp_path):
+    def test_text_output_not_empty(self, tmp_path, runner):
         _init_repo(tmp_path)
-        runner = CliRunner()
         result = runner.invoke(cli, ["protocol", "sync", "--root", str(tmp_path), "--format", "text"])
         assert result.exit_code != 2
         assert "Protocol" in result.output
 
-    def test_md_output_is_markdown_table_only(self, tmp_path):
+    def test_md_output_is_markdown_table_only(self, tmp_path, runner):
         _init_repo(tmp_path)
-        runner = CliRunner()
         result = runner.invoke(cli, ["protocol", "sync", "--root", str(tmp_path), "--format", "md"])
         assert result.exit_code != 2
         non_empty = [line for line in result.output.splitlines() if line.strip()]
@@ -86,9 +77,8 @@ class TestProtocolSyncCLI:
         for line in non_empty:
             assert line.startswith("|"), f"Non-table line in md output: {line!r}"
 
-    def test_dry_run_missing_assets_exit_nonzero(self, tmp_path):
+    def test_dry_run_missing_assets_exit_nonzero(self, tmp_path, runner):
         _init_repo(tmp_path)
-        runner = CliRunner()
         result = runner.invoke(cli, ["protocol", "sync", "--root", str(tmp_path), "--format", "json"])
         # Dry-run with missing assets should be non-zero (fix 2)
         assert result.exit_code != 0
@@ -97,9 +87,8 @@ class TestProtocolSyncCLI:
 class TestProtocolCheckSyncCycle:
     """End-to-end check -> sync -> check cycle."""
 
-    def test_sync_then_check_is_aligned(self, tmp_path):
+    def test_sync_then_check_is_aligned(self, tmp_path, runner):
         _init_repo(tmp_path)
-        runner = CliRunner()
 
         # Check: should show drift
         r_check = runner.invoke(cli, ["protocol", "check", "--root", str(tmp_path), "--format", "json"])
@@ -131,25 +120,23 @@ class TestProtocolSyncViolationCodes:
         lines = [line for line in result.output.splitlines() if line.strip()]
         return json.loads(lines[0])
 
-    def test_missing_emits_missing_code(self, tmp_path):
+    def test_missing_emits_missing_code(self, tmp_path, runner):
         _init_repo(tmp_path)
-        runner = CliRunner()
         result = runner.invoke(cli, ["protocol", "sync", "--root", str(tmp_path), "--asset", "agents-md", "--format", "json"])
         data = self._json(result)
         codes = [v["code"] for v in data["violations"]]
         assert "PROTOCOL_ASSET_MISSING" in codes
         assert "PROTOCOL_ASSET_TAMPERED" not in codes
 
-    def test_legacy_emits_legacy_code(self, tmp_path):
+    def test_legacy_emits_legacy_code(self, tmp_path, runner):
         _init_repo(tmp_path)
         self._setup_asset(tmp_path, "agents-md", "# Legacy content\n")
-        runner = CliRunner()
         result = runner.invoke(cli, ["protocol", "sync", "--root", str(tmp_path), "--asset", "agents-md", "--format", "json"])
         data = self._json(result)
         codes = [v["code"] for v in data["violations"]]
         assert "PROTOCOL_ASSET_LEGACY" in codes
 
-    def test_unparseable_emits_unparseable_code(self, tmp_path):
+    def test_unparseable_emits_unparseable_code(self, tmp_path, runner):
         _init_repo(tmp_path)
         from meminit.core.services.protocol_assets import ProtocolAssetRegistry
         asset = ProtocolAssetRegistry.default().get_by_id("agents-md")
@@ -158,7 +145,6 @@ class TestProtocolSyncViolationCodes:
         lines = canonical.split("\n")
         lines.insert(0, "Preamble\n")
         self._setup_asset(tmp_path, "agents-md", "\n".join(lines))
-        runner = CliRunner()
         result = runner.invoke(cli, ["protocol", "sync", "--root", str(tmp_path), "--asset", "agents-md", "--force", "--format", "json"])
         data = self._json(result)
         codes = [v["code"] for v in data["violations"]]
@@ -17,15 +17,16 @@ from click.testing import CliRunner
 from meminit.cli.main import cli
 from meminit.core.services.error_codes import ErrorCode
 from meminit.core.use_cases.state_document import StateDocumentUseCase
-from tests.helpers import parse_first_json_line
+from tests.helpers import (
+    NO_MIXED_STDERR_KWARGS,
+    last_line,
+    parse_first_json_line,
+    parse_last_json_line,
+)
 
 
 def _runner() -> CliRunner:
-    import inspect
-    kwargs = {}
-    if "mix_stderr" in inspect.signature(CliRunner).parameters:
-        kwargs["mix_stderr"] = False
-    return CliRunner(**kwargs)
+    return CliRunner(**NO_MIXED_STDERR_KWARGS)
 
 
 def _write_config(tmp_path: Path, prefix: str = "Q") -> None:
@@ -97,7 +98,7 @@ def _invoke_state_next(tmp_path: Path, *flags, **extra_flags) -> Dict[str, Any]:
             args.extend([f"--{k}", v])
     result = _runner().invoke(cli, args)
     if result.exit_code == 0:
-        return json.loads(result.output.strip().splitlines()[-1])
+        return parse_last_json_line(result.output)
     return {"_exit_code": result.exit_code, "_output": result.output}
 
 
@@ -109,7 +110,7 @@ def _invoke_state_blockers(tmp_path: Path, **extra_flags) -> Dict[str, Any]:
             args.extend([f"--{k}", v])
     result = _runner().invoke(cli, args)
     if result.exit_code == 0:
-        return json.loads(result.output.strip().splitlines()[-1])
+        return parse_last_json_line(result.output)
     return {"_exit_code": result.exit_code, "_output": result.output}
 
 
@@ -123,7 +124,7 @@ def _invoke_state_list(tmp_path: Path, **extra_flags) -> Dict[str, Any]:
             args.extend([f"--{k}", v])
     result = _runner().invoke(cli, args)
     if result.exit_code == 0:
-        return json.loads(result.output.strip().splitlines()[-1])
+        return parse_last_json_line(result.output)
     return {"_exit_code": result.exit_code, "_output": result.output}
 
 
@@ -489,8 +490,8 @@ def test_state_idempotency_q18_cli_envelope_bytes(tmp_path: Path):
     ])
     assert r1.exit_code == 0
     assert r2.exit_code == 0
-    stdout1 = r1.output.strip().splitlines()[-1]
-    stdout2 = r2.output.strip().splitlines()[-1]
+    stdout1 = last_line(r1.output)
+    stdout2 = last_line(r2.output)
     assert stdout1 == stdout2
 
 
@@ -510,8 +511,8 @@ def test_state_determinism_q19_state_list(tmp_path: Path):
     ])
     assert r1.exit_code == 0
     assert r2.exit_code == 0
-    stdout1 = r1.output.strip().splitlines()[-1]
-    stdout2 = r2.output.strip().splitlines()[-1]
+    stdout1 = last_line(r1.output)
+    stdout2 = last_line(r2.output)
     assert stdout1 == stdout2
 
 
@@ -529,8 +530,8 @@ def test_state_determinism_q19_state_next(tmp_path: Path):
     ])
     assert r1.exit_code == 0
     assert r2.exit_code == 0
-    stdout1 = r1.output.strip().splitlines()[-1]
-    stdout2 = r2.output.strip().splitlines()[-1]
+    stdout1 = last_line(r1.output)
+    stdout2 = last_line(r2.output)
     assert stdout1 == stdout2
 
 
@@ -544,7 +545,7 @@ def test_index_v2_integration_q20(tmp_path: Path):
         "index", "--root", str(tmp_path), "--format", "json",
     ])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
 
     nodes = data["data"]["nodes"]
     assert len(nodes) == 1
@@ -644,7 +645,7 @@ def test_index_p2_round_trips_and_none_is_absent(tmp_path):
     runner = _runner()
     result = runner.invoke(cli, ["index", "--root", str(tmp_path), "--format", "json"])
     assert result.exit_code == 0
-    data = json.loads(result.output.strip().splitlines()[-1])
+    data = parse_last_json_line(result.output)
     nodes = {n["document_id"]: n for n in data["data"]["nodes"]}
     assert nodes["FIX-ADR-001"].get("priority") == "P2", "Explicit P2 must round-trip"
     assert "priority" not in nodes["FIX-ADR-002"], "No-priority entry must not have priority key"
@@ -1,16 +1,14 @@
 import os
 import pytest
 from pathlib import Path
-from click.testing import CliRunner
 from meminit.cli.main import cli
 
-def test_new_template_frontmatter_regression(tmp_path, monkeypatch):
+def test_new_template_frontmatter_regression(tmp_path, monkeypatch, runner):
     """
     Test that 'meminit new' correctly renders built-in templates (PRD, FDD)
     without duplicate frontmatter blocks or literal {{...}} tokens in output.
     """
     # Initialize a dummy repo
-    runner = CliRunner()
     monkeypatch.chdir(tmp_path)
     
     # 1. Initialize
@@ -57,9 +55,8 @@ def test_new_template_frontmatter_regression(tmp_path, monkeypatch):
     assert "Regression Test PRD" in content
     assert "Tester" in content
 
-def test_new_fdd_interpolation(tmp_path, monkeypatch):
+def test_new_fdd_interpolation(tmp_path, monkeypatch, runner):
     """Verify FDD template interpolation as well."""
-    runner = CliRunner()
     monkeypatch.chdir(tmp_path)
     
     result_init = runner.invoke(cli, ["init"])